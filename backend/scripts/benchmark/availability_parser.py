@@ -0,0 +1,100 @@
+import random
+import re
+import timeit
+from typing import Optional
+
+import pendulum
+
+from src.routes.visualizations.provider.line.availability import parse
+from src.routes.visualizations.provider.line.availability.grammar import (
+    parse_availability,
+)
+
+DISTINCT_STRINGS = 300
+SAMPLE_SIZE = 100_000
+REPEAT = 5
+
+"""
+the identifier chain that the combined grammar replaced, kept as the baseline of this benchmark
+"""
+
+time_12_hour_regex = re.compile(r"^(\d+):(\d+)([ap]m)$", re.IGNORECASE)
+range_regex = re.compile(r"^([^\s]+)\s+(?:to|-)\s+([^\s]+)$", re.IGNORECASE)
+opening_regex = re.compile(r"^opens\s+at\s+([^\s]+)$", re.IGNORECASE)
+time_constants = {"sunrise": pendulum.time(7), "sunset": pendulum.time(19)}
+
+
+def legacy_parse_time(s: str) -> Optional[pendulum.Time]:
+    time = time_constants.get(s.lower())
+    if time is not None:
+        return time
+
+    res = time_12_hour_regex.match(s)
+    if res is None:
+        return None
+
+    hour = int(res[1]) % 12
+    if res[3].lower() == "pm":
+        hour += 12
+    return pendulum.time(hour, int(res[2]))
+
+
+identifiers = [
+    (lambda s: s.lower() == "all day", lambda s: (pendulum.Time.min, None)),
+    (lambda s: s.lower() == "closed", lambda s: (None, pendulum.Time.min)),
+    (
+        lambda s: range_regex.match(s) is not None,
+        lambda s: tuple(legacy_parse_time(e) for e in range_regex.match(s).groups()),  # type: ignore
+    ),
+    (
+        lambda s: opening_regex.match(s) is not None,
+        lambda s: (legacy_parse_time(opening_regex.match(s)[1]), None),  # type: ignore
+    ),
+]
+
+
+def legacy_parse(s: str) -> tuple[Optional[pendulum.Time], Optional[pendulum.Time]]:
+    for is_match, convert in identifiers:
+        if is_match(s):
+            return convert(s)  # type: ignore
+
+    return (None, None)
+
+
+def to_minutes(time: Optional[pendulum.Time]) -> Optional[int]:
+    return None if time is None else time.hour * 60 + time.minute
+
+
+def create_strings(rng: random.Random) -> list[str]:
+    def time() -> str:
+        return f"{rng.randint(1, 12)}:{rng.choice(['00', '15', '30', '45'])}{rng.choice(['am', 'pm', 'AM', 'PM'])}"
+
+    distinct = ["All Day", "Closed", "Sunrise to Sunset", "Opens at sunrise", "unknown"]
+    while len(distinct) < DISTINCT_STRINGS:
+        distinct.append(rng.choice([f"{time()} to {time()}", f"{time()} - {time()}", f"Opens at {time()}"]))
+
+    return [rng.choice(distinct) for _ in range(SAMPLE_SIZE)]
+
+
+def benchmark(name: str, function, strings: list[str]) -> None:
+    def run() -> None:
+        for s in strings:
+            function(s)
+
+    best = min(timeit.repeat(run, number=1, repeat=REPEAT))
+    print(f"{name:<24}{best * 1000:>10.1f} ms{best / len(strings) * 1e9:>10.0f} ns/string")
+
+
+def main():
+    strings = create_strings(random.Random(0))
+
+    mismatches = [s for s in set(strings) if tuple(map(to_minutes, legacy_parse(s))) != parse_availability(s)]
+    print(f"{len(set(strings))} distinct strings, {len(strings)} parsed per run, {len(mismatches)} mismatches")
+
+    benchmark("identifier chain", legacy_parse, strings)
+    benchmark("combined grammar", parse_availability, strings)
+    benchmark("memoized grammar", parse, strings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.common.core import db
+from src.models import (
+    RedditPost,
+    Region,
+    RegionTag,
+    RegionTripType,
+    Vineyard,
+    VineyardRegionAssociation,
+    Wine,
+    WineRegionAssociation,
+    WineVineyardAssociation,
+)
+from src.util.bulk_load import bulk_insert, collect_instances, collect_rows
+
+"""
+loads a synthetic catalog shaped like data/*.json into SQLite, once through the ORM as db_init used to, and once per
+chunk size through the bulk loader
+"""
+
+CHUNK_SIZES = [100, 1000, 10000]
+WINE_TYPES = ["Red", "White", "Sparkling", "Rose", "Dessert", "Port"]
+TAGS = ["Wineries", "Vineyards", "Tours", "Tastings", "Food", "Scenic"]
+
+
+def create_instances(scale: int, rng: random.Random) -> list[list]:
+    regions = [
+        Region(
+            name=f"Region {i}",
+            country=f"Country {i % 20}",
+            rating=round(rng.uniform(3, 5), 1),
+            reviews=rng.randint(0, 5000),
+            tags=(tags := rng.sample(TAGS, 3)),
+            trip_types=["Couples", "Friends"],
+            longitude=rng.uniform(-180, 180),
+            latitude=rng.uniform(-90, 90),
+            url="https://example.com",
+            image="https://example.com/image.jpg",
+            image_width=640,
+            image_height=480,
+            tag_list=[RegionTag(tag=e) for e in tags],
+            trip_type_list=[RegionTripType(trip_type="Couples"), RegionTripType(trip_type="Friends")],
+        )
+        for i in range(scale)
+    ]
+
+    vineyards = []
+    for i in range(scale * 3):
+        vineyard_regions = rng.sample(regions, 2)
+        vineyards.append(
+            Vineyard(
+                name=f"Vineyard {i}",
+                country=vineyard_regions[0].country,
+                price=rng.randint(1, 4),
+                rating=round(rng.uniform(3, 5), 1),
+                reviews=rng.randint(0, 5000),
+                image="https://example.com/image.jpg",
+                url="https://example.com",
+                longitude=rng.uniform(-180, 180),
+                latitude=rng.uniform(-90, 90),
+                region_names=[e.name for e in vineyard_regions],
+                region_list=[VineyardRegionAssociation(region=e) for e in vineyard_regions],
+            )
+        )
+
+    reddit_posts = [RedditPost(wine_type=e, urls=["https://reddit.com"]) for e in WINE_TYPES]
+
+    wines = []
+    for i in range(scale * 6):
+        region = rng.choice(regions)
+        wines.append(
+            Wine(
+                name=f"Wine {i}",
+                country=region.country,
+                region=region.name,
+                winery=f"Winery {i % 100}",
+                rating=round(rng.uniform(3, 5), 1),
+                reviews=rng.randint(0, 5000),
+                type=(wine_type := rng.choice(WINE_TYPES)),
+                image="https://example.com/image.jpg",
+                reddit_post=reddit_posts[WINE_TYPES.index(wine_type)],
+                region_list=[WineRegionAssociation(region=region)],
+                vineyard_list=[WineVineyardAssociation(vineyard=e) for e in rng.sample(vineyards, 4)],
+            )
+        )
+
+    return [reddit_posts, wines, regions, vineyards]
+
+
+def benchmark(name: str, load, scale: int) -> None:
+    path = Path(tempfile.mkdtemp()) / "benchmark.db"
+    engine = create_engine(f"sqlite:///{path}")
+    db.metadata.create_all(engine)
+
+    lists = create_instances(scale, random.Random(0))
+    rows = len(collect_instances(lists))
+
+    start = time.perf_counter()
+    load(engine, lists)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<24}{elapsed:>8.2f} s{rows / elapsed:>12.0f} rows/s")
+
+
+def load_orm(engine, lists: list[list]) -> None:
+    with Session(engine) as session:
+        for data_list in lists:
+            session.add_all(data_list)
+        session.commit()
+
+
+def load_bulk(chunk_size: int):
+    def load(engine, lists: list[list]) -> None:
+        rows = collect_rows(lists)
+        with engine.begin() as connection:
+            bulk_insert(connection, rows, chunk_size)
+
+    return load
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=2000, help="number of regions, other tables scale with it")
+    args = parser.parse_args()
+
+    benchmark("orm add_all", load_orm, args.scale)
+    for chunk_size in CHUNK_SIZES:
+        benchmark(f"bulk, chunks of {chunk_size}", load_bulk(chunk_size), args.scale)
+
+
+if __name__ == "__main__":
+    main()
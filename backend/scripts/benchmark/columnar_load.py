@@ -0,0 +1,75 @@
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import Table, create_engine
+
+from scripts.benchmark.bulk_load import create_instances
+from src.common.core import db
+from src.util.bulk_load import bulk_insert, collect_rows
+from src.util.columnar import load_columns, write_columns
+from src.util.upsert import read_rows
+
+"""
+loads a synthetic catalog into SQLite, once from ORM instances through the bulk loader as db_init does with the json
+files, and once from its columnar export, then checks that both databases hold the same rows
+"""
+
+REPEAT = 3
+
+
+def create_engine_with_tables():
+    path = Path(tempfile.mkdtemp()) / "benchmark.db"
+    engine = create_engine(f"sqlite:///{path}")
+    db.metadata.create_all(engine)
+    return engine
+
+
+def load_bulk(scale: int):
+    engine = create_engine_with_tables()
+
+    start = time.perf_counter()
+    rows = collect_rows(create_instances(scale, random.Random(0)))
+    with engine.begin() as connection:
+        bulk_insert(connection, rows)
+    return engine, time.perf_counter() - start
+
+
+def load_columnar(path: Path, tables: list[Table]):
+    engine = create_engine_with_tables()
+
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        load_columns(connection, path, tables)
+    return engine, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=2000, help="number of regions, other tables scale with it")
+    args = parser.parse_args()
+
+    rows = collect_rows(create_instances(args.scale, random.Random(0)))
+    path = Path(tempfile.mkdtemp()) / "columnar"
+    write_columns(path, rows, "")
+
+    count = sum(len(e) for e in rows.values())
+    size = sum(e.stat().st_size for e in path.iterdir())
+    print(f"{count} rows, columnar export of {size / 1e6:.1f} MB")
+
+    bulk = [load_bulk(args.scale) for _ in range(REPEAT)]
+    tables = list(rows)
+    columnar = [load_columnar(path, tables) for _ in range(REPEAT)]
+
+    with bulk[0][0].connect() as a, columnar[0][0].connect() as b:
+        assert read_rows(a, tables) == read_rows(b, tables)
+
+    for name, results in [("instances, bulk insert", bulk), ("columnar export", columnar)]:
+        elapsed = min(e[1] for e in results)
+        print(f"{name:<24}{elapsed:>8.2f} s{count / elapsed:>12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
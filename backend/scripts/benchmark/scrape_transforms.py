@@ -0,0 +1,153 @@
+import argparse
+import random
+import timeit
+from typing import Any, Callable
+
+from scripts.scrape.abstract_scrape_script import ScriptMode, SimpleRegion
+from scripts.scrape.region_location_details import RegionLocationDetailsScript
+from scripts.scrape.regions import RegionScript
+
+REPEAT = 3
+
+"""
+the scans and comparisons that the indexed lookups replaced, kept as the baseline of this benchmark
+"""
+
+
+def legacy_get_first_image(photo_submissions: list[dict], id: str) -> dict:
+    for photo_submission in photo_submissions:
+        if photo_submission["is_good"] and photo_submission["location_id"] == id:
+            image = photo_submission["images"]["large"]
+            return {"url": image["url"], "width": image["width"], "height": image["height"]}
+
+    return {}
+
+
+class LegacyLocationInfo:
+    def __init__(self) -> None:
+        self.frequency = 0
+        self.levels: list[int] = []
+
+    def score(self) -> float:
+        return self.frequency * 0.5 + sum(self.levels) * 0.5
+
+    def average_level(self) -> float:
+        return sum(self.levels) / self.frequency
+
+    def __gt__(self, other: "LegacyLocationInfo") -> bool:
+        if self.score() == other.score():
+            return self.average_level() > other.average_level()
+        return self.score() > other.score()
+
+
+def legacy_best_ancestor(location_list: list[dict]) -> str:
+    stats: dict[str, LegacyLocationInfo] = {}
+    ids: dict[int, str] = {}
+
+    for location in location_list:
+        ancestors = location["ancestors"]
+        for i, ancestor in enumerate(ancestors):
+            info = stats.setdefault(ancestor["location_id"], LegacyLocationInfo())
+            ids[id(info)] = ancestor["location_id"]
+            info.frequency += 1
+            info.levels.append(len(ancestors) - i)
+
+    return ids[id(max(stats.values()))]
+
+
+def legacy_filter_regions(vineyards: list[dict], regions: set[SimpleRegion]) -> list[list[str]]:
+    ret = []
+    for vineyard in vineyards:
+        country = vineyard["country"]
+        filtered = filter(lambda e: SimpleRegion(e["name"], country) in regions, vineyard["regions"])
+        ret.append(list(map(lambda e: e["name"], filtered)))
+    return ret
+
+
+def filter_regions(vineyards: list[dict], regions: set[tuple[str, str]]) -> list[list[str]]:
+    return [
+        [e["name"] for e in vineyard["regions"] if (e["name"], vineyard["country"]) in regions]
+        for vineyard in vineyards
+    ]
+
+
+def first_images(script: RegionScript, photo_submissions: list[dict], ids: list[str]) -> list[dict]:
+    images = script.get_first_images(photo_submissions)
+    return [images.get(id, {}) for id in ids]
+
+
+def create_inputs(rng: random.Random, scale: int) -> dict[str, Any]:
+    location_ids = [str(100000 + i) for i in range(scale)]
+
+    photos = [
+        {
+            "location_id": rng.choice(location_ids),
+            "is_good": rng.random() < 0.3,
+            "images": {"large": {"url": f"https://photos/{i}.jpg", "width": 640, "height": 480}},
+        }
+        for i in range(scale * 10)
+    ]
+
+    ancestor_pool = [{"location_id": str(i), "name": f"A{i}", "level": "City"} for i in range(scale)]
+    location_lists = [
+        [{"ancestors": rng.sample(ancestor_pool, 6)} for _ in range(20)] for _ in range(max(1, scale // 10))
+    ]
+
+    region_names = [(f"R{i}", rng.choice(["France", "Italy", "Spain"])) for i in range(scale)]
+    vineyards = [
+        {
+            "country": rng.choice(["France", "Italy", "Spain"]),
+            "regions": [{"name": rng.choice(region_names)[0]} for _ in range(5)],
+        }
+        for _ in range(scale * 5)
+    ]
+
+    return {
+        "location_ids": location_ids,
+        "photos": photos,
+        "location_lists": location_lists,
+        "regions": region_names,
+        "vineyards": vineyards,
+    }
+
+
+def benchmark(name: str, legacy: Callable[[], Any], indexed: Callable[[], Any]) -> None:
+    assert legacy() == indexed(), name
+
+    legacy_time = min(timeit.repeat(legacy, number=1, repeat=REPEAT))
+    indexed_time = min(timeit.repeat(indexed, number=1, repeat=REPEAT))
+    print(
+        f"{name:<20}{legacy_time * 1000:>12.1f} ms{indexed_time * 1000:>12.1f} ms{legacy_time / indexed_time:>10.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=2000, help="number of regions")
+    args = parser.parse_args()
+
+    inputs = create_inputs(random.Random(0), args.scale)
+    regions = RegionScript("regions.json", ScriptMode.MODIFY)
+    details = RegionLocationDetailsScript("region_location_details.json", ScriptMode.MODIFY)
+
+    print(f"{'':<20}{'legacy':>15}{'indexed':>15}{'speedup':>11}")
+
+    benchmark(
+        "first images",
+        lambda: [legacy_get_first_image(inputs["photos"], id) for id in inputs["location_ids"]],
+        lambda: first_images(regions, inputs["photos"], inputs["location_ids"]),
+    )
+    benchmark(
+        "best ancestors",
+        lambda: [legacy_best_ancestor(e) for e in inputs["location_lists"]],
+        lambda: [details.determine_best_ancestor(e)["location_id"] for e in inputs["location_lists"]],
+    )
+    benchmark(
+        "vineyard regions",
+        lambda: legacy_filter_regions(inputs["vineyards"], {SimpleRegion(*e) for e in inputs["regions"]}),
+        lambda: filter_regions(inputs["vineyards"], set(inputs["regions"])),
+    )
+
+
+if __name__ == "__main__":
+    main()
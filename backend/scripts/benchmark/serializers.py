@@ -0,0 +1,86 @@
+import argparse
+import json
+import random
+import timeit
+from decimal import Decimal
+from typing import Any, Callable
+
+from scripts.benchmark.bulk_load import create_instances
+from src.schemas import (
+    RegionSchema,
+    VineyardSchema,
+    WineSchema,
+    regions_schema,
+    serialize_wine,
+    vineyards_schema,
+    wines_partial_schema,
+)
+
+"""
+dumps a synthetic catalog with the marshmallow schemas and with the serializers the routes use in their place, checks
+that both produce the same JSON and compares their speed
+"""
+
+REPEAT = 5
+DECIMAL_COLUMNS = {"rating": 1, "longitude": 6, "latitude": 6}
+
+
+def set_loaded_values(instances: list) -> None:
+    # as if read from the database, with an id and decimal columns as Decimal
+    for i, instance in enumerate(instances):
+        instance.id = i + 1
+        for column, scale in DECIMAL_COLUMNS.items():
+            if hasattr(instance, column):
+                setattr(instance, column, round(Decimal(getattr(instance, column)), scale))
+
+
+def benchmark(name: str, schema: Callable[[], Any], serializer: Callable[[], Any], count: int) -> None:
+    assert json.dumps(schema()) == json.dumps(serializer()), name
+
+    schema_time = min(timeit.repeat(schema, number=1, repeat=REPEAT))
+    serializer_time = min(timeit.repeat(serializer, number=1, repeat=REPEAT))
+    print(
+        f"{name:<16}{count / schema_time:>14.0f}/s{count / serializer_time:>14.0f}/s"
+        f"{schema_time / serializer_time:>10.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=2000, help="number of regions, other tables scale with it")
+    args = parser.parse_args()
+
+    reddit_posts, wines, regions, vineyards = create_instances(args.scale, random.Random(0))
+    for instances in [wines, regions, vineyards]:
+        set_loaded_values(instances)
+    for reddit_post in reddit_posts:
+        reddit_post.urls = [f"https://www.reddit.com/r/wine/comments/{i}/post" for i in range(30)]
+
+    print(f"{'':<16}{'marshmallow':>16}{'serializer':>16}{'speedup':>11}")
+
+    benchmark(
+        "regions", lambda: RegionSchema(many=True).dump(regions), lambda: regions_schema.dump(regions), len(regions)
+    )
+    benchmark(
+        "vineyards",
+        lambda: VineyardSchema(many=True).dump(vineyards),
+        lambda: vineyards_schema.dump(vineyards),
+        len(vineyards),
+    )
+    benchmark(
+        "wines",
+        lambda: WineSchema(exclude=["redditPosts"], many=True).dump(wines),
+        lambda: wines_partial_schema.dump(wines),
+        len(wines),
+    )
+    # the detail and batch routes dump each wine with the reddit posts of its type
+    benchmark(
+        "wine details",
+        lambda: [WineSchema(context={"reddit_post": e.reddit_post}).dump(e) for e in wines[:1000]],
+        lambda: [serialize_wine(e, e.reddit_post) for e in wines[:1000]],
+        1000,
+    )
+
+
+if __name__ == "__main__":
+    main()
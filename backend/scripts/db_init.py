@@ -1,37 +1,73 @@
+import argparse
 import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
 
 import __init__  # type: ignore
 from src.app import app
 from src.common.core import db
 from src.models import (
+    DataVersion,
     RedditPost,
     Region,
+    RegionTag,
+    RegionTripType,
     Vineyard,
     VineyardRegionAssociation,
     Wine,
     WineRegionAssociation,
     WineVineyardAssociation,
 )
+from src.util.blue_green import catalog_tables, reload_tables
+from src.util.bulk_load import BULK_CHUNK_SIZE, bulk_insert, collect_rows
+from src.util.columnar import (
+    check_columns,
+    get_source_digest,
+    load_columns,
+    write_columns,
+)
+from src.util.data_version import bump_data_version
+from src.util.upsert import NaturalKeys, TableDiff, apply_diff, diff_rows, read_rows
 
+NATURAL_KEYS: NaturalKeys = {
+    RedditPost.__table__: ("wine_type",),
+    Wine.__table__: ("name", "winery"),
+    Region.__table__: ("country", "name"),
+    Vineyard.__table__: ("name", "country"),
+}
 
-def connect_wines_reddit_post(reddit_posts: list[RedditPost], wines: list[Wine]):
-    for reddit_post in reddit_posts:
+SOURCE_PATHS = [Path(f"data/{e}.json") for e in ["wine_reddit", "wines", "vineyards", "regions"]]
+COLUMNAR_PATH = Path("data/columnar")
 
-        def predicate(e: Wine):
-            return e.type == reddit_post.wine_type
 
-        reddit_post.wines = [wine for wine in filter(predicate, wines)]
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    print(f"{name}: {time.perf_counter() - start:.3f}s")
+
+
+def connect_wines_reddit_post(reddit_posts: list[RedditPost], wines: list[Wine]):
+    wines_by_type: dict[str, list[Wine]] = defaultdict(list)
+    for wine in wines:
+        wines_by_type[wine.type].append(wine)
+
+    for reddit_post in reddit_posts:
+        reddit_post.wines = list(wines_by_type[reddit_post.wine_type])
 
 
 def connect_wines_regions(wines: list[Wine], regions: list[Region]):
     total_associations = 0
 
-    for wine in wines:
-
-        def predicate(e: Region):
-            return e.country == wine.country and e.name == wine.region
+    regions_by_key: dict[tuple[str, str], Region] = {}
+    for region in regions:
+        regions_by_key.setdefault((region.country, region.name), region)
 
-        region = next(filter(predicate, regions))
+    for wine in wines:
+        region = regions_by_key[(wine.country, wine.region)]
         wine.region_list.append(WineRegionAssociation(region=region))
         total_associations += 1
 
@@ -41,13 +77,16 @@ def connect_wines_regions(wines: list[Wine], regions: list[Region]):
 def connect_vineyards_regions(vineyards: list[Vineyard], regions: list[Region]):
     total_associations = 0
 
-    for vineyard in vineyards:
+    # positions of the regions with each name, so that associations keep the order of `regions`
+    region_indices_by_name: dict[str, list[int]] = defaultdict(list)
+    for i, region in enumerate(regions):
+        region_indices_by_name[region.name].append(i)
 
-        def predicate(e: Vineyard):
-            return e.name in vineyard.region_names
+    for vineyard in vineyards:
+        indices = {i for name in vineyard.region_names for i in region_indices_by_name.get(name, [])}
 
-        for region in filter(predicate, regions):
-            vineyard.region_list.append(VineyardRegionAssociation(region=region))
+        for i in sorted(indices):
+            vineyard.region_list.append(VineyardRegionAssociation(region=regions[i]))
             total_associations += 1
 
     print(f"vineyard - region associations: {total_associations}")
@@ -56,12 +95,13 @@ def connect_vineyards_regions(vineyards: list[Vineyard], regions: list[Region]):
 def connect_wines_vineyards(wines: list[Wine], vineyards: list[Vineyard]):
     total_associations = 0
 
-    for wine in wines:
-
-        def predicate(e: Vineyard):
-            return wine.region in e.region_names
+    vineyards_by_region_name: dict[str, list[Vineyard]] = defaultdict(list)
+    for vineyard in vineyards:
+        for name in dict.fromkeys(vineyard.region_names):
+            vineyards_by_region_name[name].append(vineyard)
 
-        for vineyard in filter(predicate, vineyards):
+    for wine in wines:
+        for vineyard in vineyards_by_region_name.get(wine.region, []):
             wine.vineyard_list.append(WineVineyardAssociation(vineyard=vineyard))
             total_associations += 1
 
@@ -69,23 +109,99 @@ def connect_wines_vineyards(wines: list[Wine], vineyards: list[Vineyard]):
 
 
 def create_instances() -> list[list]:
-    reddit_posts = create_reddit_posts()
-    wines = create_wines()
-    regions = create_regions()
-    vineyards = create_vineyards()
+    with phase("read data"):
+        reddit_posts = create_reddit_posts()
+        wines = create_wines()
+        regions = create_regions()
+        vineyards = create_vineyards()
+
+    with phase("connect wines - reddit posts"):
+        connect_wines_reddit_post(reddit_posts, wines)
+
+    with phase("connect wines - regions"):
+        connect_wines_regions(wines, regions)
 
-    connect_wines_reddit_post(reddit_posts, wines)
-    connect_wines_regions(wines, regions)
-    connect_vineyards_regions(vineyards, regions)
-    connect_wines_vineyards(wines, vineyards)
+    with phase("connect vineyards - regions"):
+        connect_vineyards_regions(vineyards, regions)
+
+    with phase("connect wines - vineyards"):
+        connect_wines_vineyards(wines, vineyards)
 
     return [reddit_posts, wines, regions, vineyards]
 
 
-def populate_db(lists: list[list]):
-    for data_list in lists:
-        db.session.add_all(data_list)
-    db.session.commit()
+def populate_db(lists: list[list], chunk_size: int = BULK_CHUNK_SIZE):
+    rows = collect_rows(lists)
+
+    with db.engine.begin() as connection:
+        bulk_insert(connection, rows, chunk_size)
+
+
+def export_db(lists: list[list]):
+    """
+    Writes the rows of the data files to `COLUMNAR_PATH`, which `populate_db_from_columns` loads without parsing them.
+    """
+    rows = collect_rows(lists)
+    write_columns(COLUMNAR_PATH, rows, get_source_digest(SOURCE_PATHS))
+
+    for table, table_rows in rows.items():
+        print(f"{table.name}: {len(table_rows)} rows exported")
+
+
+def can_populate_from_columns() -> bool:
+    reason = check_columns(COLUMNAR_PATH, get_source_digest(SOURCE_PATHS), catalog_tables(), db.engine.dialect)
+    if reason is not None:
+        print(f"columnar export not loaded, {reason}")
+
+    return reason is None
+
+
+def populate_db_from_columns(chunk_size: int = BULK_CHUNK_SIZE):
+    with db.engine.begin() as connection:
+        load_columns(connection, COLUMNAR_PATH, catalog_tables(), chunk_size)
+
+
+def reload_db(lists: list[list], chunk_size: int = BULK_CHUNK_SIZE):
+    """
+    Replaces the catalog while the API keeps serving the previous one, see `reload_tables`.
+    """
+    rows = collect_rows(lists)
+    DataVersion.__table__.create(db.engine, checkfirst=True)
+
+    with db.engine.begin() as connection:
+        reload_tables(connection, rows, chunk_size)
+
+
+def upsert_db(lists: list[list], chunk_size: int = BULK_CHUNK_SIZE, dry_run: bool = False) -> bool:
+    """
+    Only writes the rows that changed since the last load, see `diff_rows`. Returns whether anything changed.
+    """
+    rows = collect_rows(lists)
+    db.create_all()
+
+    with db.engine.begin() as connection:
+        stored = read_rows(connection, list(rows))
+        diffs = diff_rows(stored, rows, NATURAL_KEYS, connection.dialect)
+        report(diffs, dry_run)
+
+        if not dry_run:
+            apply_diff(connection, diffs, NATURAL_KEYS, chunk_size)
+
+    return any(len(e) > 0 for e in diffs)
+
+
+def report(diffs: list[TableDiff], verbose: bool):
+    for diff in diffs:
+        counts = f"{len(diff.inserted)} inserted, {len(diff.updated)} updated, {len(diff.deleted)} deleted"
+        print(f"{diff.table.name}: {counts}")
+
+        key_columns = NATURAL_KEYS.get(diff.table)
+        if not verbose or key_columns is None:
+            continue
+
+        for sign, rows in [("+", diff.inserted), ("~", diff.updated), ("-", diff.deleted)]:
+            for row in rows:
+                print(f"  {sign} {tuple(row[e] for e in key_columns)}")
 
 
 def create_reddit_posts() -> list[RedditPost]:
@@ -174,6 +290,8 @@ def create_regions() -> list[Region]:
                 "image_height": int(region["imageHeight"]),
                 "tags": region["tags"],
                 "trip_types": region["tripTypes"],
+                "tag_list": [RegionTag(tag=tag) for tag in set(region["tags"])],
+                "trip_type_list": [RegionTripType(trip_type=trip_type) for trip_type in set(region["tripTypes"])],
             }
 
             ret.append(Region(**args))
@@ -182,8 +300,64 @@ def create_regions() -> list[Region]:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=BULK_CHUNK_SIZE, help="rows per INSERT executemany")
+    parser.add_argument(
+        "--mode",
+        choices=["create", "reload", "upsert"],
+        default="create",
+        help=(
+            "create: drop and recreate every table, reload: swap in the new catalog without downtime, "
+            "upsert: only write the rows that changed"
+        ),
+    )
+    parser.add_argument("--dry-run", action="store_true", help="with --mode upsert, only report the changes")
+    parser.add_argument(
+        "--source",
+        choices=["auto", "json", "columns"],
+        default="auto",
+        help=(
+            "auto: with --mode create, load the columnar export if it is up to date with the data files, "
+            "json: always read the data files, columns: require the columnar export"
+        ),
+    )
+    parser.add_argument("--export", action="store_true", help="write the columnar export of the data files and exit")
+    args = parser.parse_args()
+
+    if args.dry_run and args.mode != "upsert":
+        parser.error("--dry-run requires --mode upsert")
+    if args.source == "columns" and args.mode != "create":
+        parser.error("--source columns requires --mode create")
+
     with app.app_context():
-        lists = create_instances()
-        db.drop_all()
-        db.create_all()
-        populate_db(lists)
+        if args.export:
+            with phase("export"):
+                export_db(create_instances())
+            raise SystemExit
+
+        from_columns = args.mode == "create" and args.source != "json" and can_populate_from_columns()
+        if args.source == "columns" and not from_columns:
+            raise SystemExit("run with --export to write the columnar export")
+
+        lists = [] if from_columns else create_instances()
+        changed = True
+
+        if args.mode == "upsert":
+            with phase("upsert"):
+                changed = upsert_db(lists, args.chunk_size, args.dry_run) and not args.dry_run
+        elif args.mode == "reload":
+            with phase("reload"):
+                reload_db(lists, args.chunk_size)
+        else:
+            with phase("create tables"):
+                db.drop_all()
+                db.create_all()
+
+            with phase("populate"):
+                if from_columns:
+                    populate_db_from_columns(args.chunk_size)
+                else:
+                    populate_db(lists, args.chunk_size)
+
+        if changed:
+            bump_data_version()
@@ -1,8 +1,12 @@
 import json
+import os
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Optional
+
+from .fetch import Fetcher, ResponseCache
+from .json_stream import iter_entries, iter_items, write_json
 
 JsonObject = dict[str, Any]
 
@@ -34,7 +38,14 @@ class SimpleRegion:
 
 
 class AbstractScrapeScript(ABC):
-    def __init__(self, filename: str, script_mode: ScriptMode) -> None:
+    # limits of the API the script scrapes, see `Fetcher`
+    max_workers: int = 8
+    per_host_limit: int = 4
+    requests_per_second: Optional[float] = 5
+    # how old a cached response a resumed run reuses, see `ResponseCache`
+    response_max_age: float = 24 * 60 * 60
+
+    def __init__(self, filename: str, script_mode: ScriptMode, resume: bool = False) -> None:
         super().__init__()
 
         self.script_mode = script_mode
@@ -42,16 +53,33 @@ class AbstractScrapeScript(ABC):
         self.root_dir = (Path(__file__).resolve().parent / "../..").resolve()  # go to backend dir
         self.target_dir = self.root_dir / "data" / self.script_mode.value
         self.target_file = self.target_dir / self.filename
+        self.fetcher = Fetcher(
+            self.max_workers,
+            self.per_host_limit,
+            self.requests_per_second,
+            cache=ResponseCache(
+                self.root_dir / "data" / "cache" / "responses.sqlite3",
+                self.response_max_age if resume else 0,
+            ),
+        )
 
     def create_dir(self):
         print(f"creating directory (if needed): {self.target_dir}")
         self.target_dir.mkdir(parents=True, exist_ok=True)
 
     def write_data(self, data: JsonObject):
-        with self.target_file.open(mode="w") as file:
-            content = json.dumps(data, ensure_ascii=False, indent=4)
-            print(f"writing to: {self.target_file}")
-            file.write(content)
+        """
+        Writes the data as indented JSON. Lists and iterators at the top level, e.g. `{"data": <generator>}`, are
+        written one element at a time, so a stage that yields its records never holds all of them.
+        """
+        temp_file = self.target_file.with_suffix(".tmp")
+
+        print(f"writing to: {self.target_file}")
+        with temp_file.open(mode="w", encoding="utf-8") as file:
+            write_json(file, data)
+
+        # a stage that fails halfway leaves the previous output in place
+        os.replace(temp_file, self.target_file)
 
     def read_json_file(self, path: Path) -> JsonObject:
         file_path = path.resolve()
@@ -62,14 +90,32 @@ class AbstractScrapeScript(ABC):
 
         return data
 
-    def get_region_candidates(self) -> set[SimpleRegion]:
-        ret: set[SimpleRegion] = set()
+    def iter_json_items(self, path: Path, key: Optional[str] = "data") -> Iterator[Any]:
+        """
+        Yields the elements of the `key` array of a file one at a time, see `iter_items`.
+        """
+        file_path = path.resolve()
+
+        print(f"reading data from: {file_path}")
+        return iter_items(file_path, key)
+
+    def iter_json_entries(self, path: Path, key: Optional[str] = None) -> Iterator[tuple[str, Any]]:
+        """
+        Yields the entries of the `key` object of a file one at a time, see `iter_entries`.
+        """
+        file_path = path.resolve()
+
+        print(f"reading data from: {file_path}")
+        return iter_entries(file_path, key)
 
-        data = self.read_json_file(self.root_dir / "data/modify/regions.json")
-        regions: list[JsonObject] = data["data"]
+    def get_region_candidates(self) -> set[tuple[str, str]]:
+        """
+        The (name, country) of every region, hashed as plain tuples for lookups.
+        """
+        ret: set[tuple[str, str]] = set()
 
-        for region in regions:
-            ret.add(SimpleRegion(region["name"], region["country"]))
+        for region in self.iter_json_items(self.root_dir / "data/modify/regions.json"):
+            ret.add((region["name"], region["country"]))
 
         return ret
 
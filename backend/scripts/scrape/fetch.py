@@ -0,0 +1,225 @@
+import hashlib
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock, Semaphore
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# responses that say nothing about the requested resource, never cached
+UNCACHED_STATUSES = RETRY_STATUSES | {401, 403}
+
+
+class TokenBucket:
+    """
+    Allows `rate` acquisitions per second on average, in bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class FetchRequest:
+    def __init__(self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None):
+        self.url = url
+        self.params = params or {}
+        self.headers = headers or {}
+
+
+class ResponseCache:
+    """
+    Response bodies of earlier runs in a SQLite file, keyed by a hash of the URL and the parameters of the request.
+    Parameters in `ignored_params`, e.g. API keys, are left out of the key and never stored.
+
+    Responses are stored as soon as they arrive, so a run that dies halfway, e.g. on an exhausted quota, is resumed by
+    running it again. Responses older than `max_age` seconds are fetched again, and with a `max_age` of 0 every
+    response is fetched again while still being stored for a later resume.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_age: Optional[float] = None,
+        ignored_params: frozenset[str] = frozenset({"key"}),
+    ) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.ignored_params = ignored_params
+        self.connection: Optional[sqlite3.Connection] = None
+        self.lock = Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, url TEXT, body TEXT, fetched_at REAL)"
+            )
+        return self.connection
+
+    def key(self, request: "FetchRequest") -> str:
+        params = {k: v for k, v in request.params.items() if k not in self.ignored_params}
+        content = json.dumps([request.url, params], sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, request: "FetchRequest") -> Optional[str]:
+        if self.max_age == 0:
+            return None
+
+        with self.lock:
+            row = (
+                self.connect()
+                .execute("SELECT body, fetched_at FROM responses WHERE key = ?", (self.key(request),))
+                .fetchone()
+            )
+
+        if row is None or (self.max_age is not None and time.time() - row[1] >= self.max_age):
+            return None
+        return row[0]
+
+    def set(self, request: "FetchRequest", body: str) -> None:
+        with self.lock:
+            self.connect().execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (self.key(request), request.url, body, time.time()),
+            )
+
+    def close(self) -> None:
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+class Fetcher:
+    """
+    Performs the GET requests of a scrape script on a bounded thread pool that shares one `requests.Session`.
+
+    Each host gets at most `per_host` requests in flight and, if `requests_per_second` is set, a token bucket that
+    spaces out its requests. Responses with a status in `RETRY_STATUSES` and connection errors are retried up to
+    `retries` times, waiting for the `Retry-After` header of the response or an exponential backoff. Any other response
+    is returned as parsed JSON, error bodies included, like the plain `requests.get(...).json()` it replaces.
+
+    With a `cache`, requests answered by an earlier run are not sent again.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        per_host: int = 4,
+        requests_per_second: Optional[float] = None,
+        retries: int = 3,
+        backoff: float = 1.0,
+        timeout: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.requests_per_second = requests_per_second
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.cached = 0
+        self.fetched = 0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.hosts: dict[str, tuple[Semaphore, Optional[TokenBucket]]] = {}
+        self.lock = Lock()
+
+    def get_host_limits(self, url: str) -> tuple[Semaphore, Optional[TokenBucket]]:
+        host = urlsplit(url).netloc
+
+        with self.lock:
+            limits = self.hosts.get(host)
+            if limits is None:
+                bucket = None if self.requests_per_second is None else TokenBucket(self.requests_per_second)
+                limits = self.hosts[host] = (Semaphore(self.per_host), bucket)
+
+        return limits
+
+    def get_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = None if response is None else response.headers.get("Retry-After", "")
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * 2**attempt
+
+    def get(self, request: FetchRequest) -> Any:
+        body = None if self.cache is None else self.cache.get(request)
+        if body is not None:
+            with self.lock:
+                self.cached += 1
+            return json.loads(body)
+
+        semaphore, bucket = self.get_host_limits(request.url)
+
+        for attempt in range(self.retries + 1):
+            if bucket is not None:
+                bucket.acquire()
+
+            print(f"performing GET {request.url}" + ("" if attempt == 0 else f" (retry {attempt})"))
+            response: Optional[requests.Response] = None
+
+            try:
+                with semaphore:
+                    response = self.session.get(
+                        request.url,
+                        params=request.params,
+                        headers=request.headers,
+                        timeout=self.timeout,
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+
+            if response is not None and (response.status_code not in RETRY_STATUSES or attempt == self.retries):
+                data = response.json()
+                with self.lock:
+                    self.fetched += 1
+
+                if self.cache is not None and response.status_code not in UNCACHED_STATUSES:
+                    self.cache.set(request, response.text)
+
+                return data
+
+            time.sleep(self.get_delay(attempt, response))
+
+    def fetch_all(self, batch: list[FetchRequest]) -> list[Any]:
+        """
+        Performs the requests concurrently and returns their responses in the order of the requests.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            ret = list(executor.map(self.get, batch))
+
+        print(f"responses fetched: {self.fetched}, from cache: {self.cached}")
+        return ret
@@ -0,0 +1,166 @@
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = " \t\n\r"
+
+
+class JsonReader:
+    """
+    Decodes one JSON value at a time from a file, holding only the value being decoded in memory.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Reads more of the file, at least as much as is buffered, so that a large value is decoded in few attempts.
+        """
+        if self.eof:
+            return False
+
+        chunk = self.file.read(max(CHUNK_SIZE, len(self.buffer) - self.pos))
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        self.eof = len(chunk) == 0
+        return not self.eof
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                break
+
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+
+    def expect(self, *tokens: str) -> str:
+        token = self.peek()
+        if token not in tokens:
+            raise ValueError(f"expected one of {tokens} at {self.file.name}, found {token!r}")
+        self.pos += 1
+        return token
+
+    def value(self) -> Any:
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+
+            # a number near the end of the buffer may continue in the next chunk, e.g. `1.` of `1.5`
+            if isinstance(value, (int, float)) and len(self.buffer) - end <= 2 and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.value()
+            if self.expect(",", "]") == "]":
+                return
+
+    def entries(self) -> Iterator[tuple[str, Any]]:
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key, self.value()
+            if self.expect(",", "}") == "}":
+                return
+
+    def find(self, key: str) -> None:
+        """
+        Moves to the value of `key` in the object at the current position, skipping the values before it.
+        """
+        self.expect("{")
+
+        while self.peek() != "}":
+            current = self.value()
+            self.expect(":")
+            if current == key:
+                return
+
+            self.value()
+            if self.expect(",", "}") == "}":
+                break
+
+        raise KeyError(key)
+
+
+def iter_items(path: Path, key: Optional[str] = "data") -> Iterator[Any]:
+    """
+    Yields the elements of the array at `key` of the top level object of a file, or of the top level array if `key`
+    is None, one at a time.
+    """
+    with path.open(encoding="utf-8") as file:
+        reader = JsonReader(file)
+        if key is not None:
+            reader.find(key)
+        yield from reader.items()
+
+
+def iter_entries(path: Path, key: Optional[str] = None) -> Iterator[tuple[str, Any]]:
+    """
+    Yields the entries of the object at `key` of the top level object of a file, or of the top level object if `key`
+    is None, one at a time.
+    """
+    with path.open(encoding="utf-8") as file:
+        reader = JsonReader(file)
+        if key is not None:
+            reader.find(key)
+        yield from reader.entries()
+
+
+def indented(value: Any, level: int) -> str:
+    # json.dumps escapes line breaks inside strings, so every line break is indentation
+    return json.dumps(value, ensure_ascii=False, indent=4).replace("\n", "\n" + "    " * level)
+
+
+def write_json(file: TextIO, data: dict[str, Any]) -> None:
+    """
+    Writes the same text as `json.dump(data, file, ensure_ascii=False, indent=4)`, but consumes lists and iterators
+    at the top level of `data` one element at a time, e.g. `{"data": <generator>}`.
+    """
+    if len(data) == 0:
+        file.write("{}")
+        return
+
+    file.write("{")
+
+    for i, (key, value) in enumerate(data.items()):
+        file.write(("," if i > 0 else "") + "\n    " + json.dumps(key, ensure_ascii=False) + ": ")
+
+        if not isinstance(value, (list, Iterator)):
+            file.write(indented(value, 1))
+            continue
+
+        elements: Iterable[Any] = value
+        empty = True
+        for element in elements:
+            file.write(("[" if empty else ",") + "\n        " + indented(element, 2))
+            empty = False
+
+        file.write("[]" if empty else "\n    ]")
+
+    file.write("\n}")
@@ -0,0 +1,213 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from .abstract_scrape_script import AbstractScrapeScript, ScriptMode
+
+DATA_DIR = (Path(__file__).resolve().parent / "../../data").resolve()
+STATE_PATH = DATA_DIR / "cache" / "pipeline.json"
+
+
+class Stage:
+    """
+    One mode of a scrape script, e.g. `vineyards:modify`, which writes `<mode>/<module>.json` from its input files.
+    Inputs and outputs are paths relative to the data directory.
+    """
+
+    def __init__(self, module: str, mode: ScriptMode, inputs: list[str]) -> None:
+        self.module = module
+        self.mode = mode
+        self.inputs = inputs
+        self.name = f"{module}:{mode.value}"
+        self.output = f"{mode.value}/{module}.json"
+
+    def version(self) -> str:
+        """
+        Digest of the code of the stage and of the modules shared by all stages, e.g. `fetch.py`, so that a changed
+        script runs again even if its inputs did not change.
+        """
+        digest = hashlib.sha256()
+        for source in [Path(__file__).parent / f"{self.module}.py", *shared_sources()]:
+            digest.update(source.read_bytes())
+        return digest.hexdigest()
+
+    def run(self, resume: bool = False) -> None:
+        module = importlib.import_module(f"{__package__}.{self.module}")
+        script_class = next(
+            value
+            for value in vars(module).values()
+            if inspect.isclass(value)
+            and issubclass(value, AbstractScrapeScript)
+            and value.__module__ == module.__name__
+        )
+
+        script = script_class(Path(self.output).name, self.mode, resume)
+        script.run()
+
+
+def shared_sources() -> list[Path]:
+    """
+    The modules of this package that are not the script of a stage, which any stage may build on.
+    """
+    stage_modules = {e.module for e in STAGES}
+    sources = Path(__file__).parent.glob("*.py")
+    return sorted(e for e in sources if e.stem not in stage_modules and e != Path(__file__))
+
+
+RAW, MODIFY, FINAL = ScriptMode.RAW, ScriptMode.MODIFY, ScriptMode.FINAL
+
+STAGES = [
+    Stage("wines", RAW, []),
+    Stage("wines", MODIFY, ["raw/wines.json"]),
+    Stage("wine_reddit", RAW, ["modify/wines.json"]),
+    Stage("vineyards", RAW, ["modify/wines.json"]),
+    Stage("vineyards", MODIFY, ["raw/vineyards.json"]),
+    Stage("region_nearby_locations", RAW, ["modify/vineyards.json"]),
+    Stage("region_nearby_locations", MODIFY, ["raw/region_nearby_locations.json"]),
+    Stage("region_location_details", RAW, ["modify/region_nearby_locations.json"]),
+    Stage("region_location_details", MODIFY, ["raw/region_location_details.json"]),
+    Stage("region_info", RAW, ["modify/region_location_details.json"]),
+    Stage("region_photos", RAW, ["modify/region_location_details.json"]),
+    Stage(
+        "regions",
+        MODIFY,
+        ["modify/region_location_details.json", "raw/region_info.json", "misc/reviewed_photos.json"],
+    ),
+    Stage("vineyards", FINAL, ["modify/vineyards.json", "modify/regions.json"]),
+    Stage("wines", FINAL, ["modify/wines.json", "modify/regions.json"]),
+    Stage("regions", FINAL, ["modify/regions.json", "final/wines.json"]),
+]
+
+
+class Pipeline:
+    """
+    Runs stages as soon as the stages that write their inputs are done, up to `max_workers` at a time, in one process.
+
+    A stage is skipped when its output exists and neither its inputs nor its code changed since it last succeeded,
+    as recorded in the state file. Raw stages read the APIs they scrape, which no fingerprint covers, so they always
+    run unless the pipeline resumes an earlier run, which also reuses their cached responses. Stages that depend on a
+    failed stage do not run.
+    """
+
+    def __init__(self, stages: list[Stage], data_dir: Path, state_path: Path, max_workers: int = 4) -> None:
+        self.stages = {stage.name: stage for stage in stages}
+        self.data_dir = data_dir
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.lock = Lock()
+
+        producers = {stage.output: stage.name for stage in stages}
+        self.dependencies = {
+            stage.name: {producers[e] for e in stage.inputs if e in producers and producers[e] != stage.name}
+            for stage in stages
+        }
+
+        self.state: dict[str, str] = {}
+        if state_path.exists():
+            self.state = json.loads(state_path.read_text(encoding="utf-8"))
+
+    def fingerprint(self, stage: Stage) -> str:
+        digest = hashlib.sha256(f"{stage.name}\n{stage.version()}\n".encode())
+
+        for name in stage.inputs:
+            path = self.data_dir / name
+            digest.update(f"{name}\n".encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest() if path.exists() else b"missing")
+
+        return digest.hexdigest()
+
+    def save_state(self, name: str, fingerprint: str) -> None:
+        with self.lock:
+            self.state[name] = fingerprint
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_path = self.state_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(self.state, indent=4), encoding="utf-8")
+            os.replace(temp_path, self.state_path)
+
+    def run_stage(self, stage: Stage, force: bool, resume: bool) -> str:
+        fingerprint = self.fingerprint(stage)
+        fresh = self.state.get(stage.name) == fingerprint and (self.data_dir / stage.output).exists()
+        if not force and fresh and (resume or stage.mode is not ScriptMode.RAW):
+            print(f"[{stage.name}] skipped, inputs unchanged")
+            return "skipped"
+
+        print(f"[{stage.name}] running")
+        stage.run(resume)
+        self.save_state(stage.name, fingerprint)
+        print(f"[{stage.name}] done")
+        return "ran"
+
+    def run(self, force: bool = False, only: Optional[set[str]] = None, resume: bool = False) -> dict[str, str]:
+        """
+        Runs every stage, or the stages in `only`, and returns the result of each: ran, skipped, failed or blocked.
+        """
+        selected = set(self.stages) if only is None else only
+        pending = {name: self.dependencies[name] & selected for name in selected}
+        results: dict[str, str] = {}
+        running: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while len(pending) > 0 or len(running) > 0:
+                blocked = True
+                while blocked:
+                    blocked = False
+
+                    for name, dependencies in list(pending.items()):
+                        if any(results.get(e) in ("failed", "blocked") for e in dependencies):
+                            print(f"[{name}] blocked by a failed stage")
+                            results[name] = "blocked"
+                            blocked = True
+                            del pending[name]
+                        elif all(e in results for e in dependencies):
+                            running[executor.submit(self.run_stage, self.stages[name], force, resume)] = name
+                            del pending[name]
+
+                if len(running) == 0:
+                    if len(pending) > 0:
+                        raise ValueError(f"stages depend on each other: {', '.join(sorted(pending))}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception:
+                        print(f"[{name}] failed\n{traceback.format_exc()}")
+                        results[name] = "failed"
+
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="runs the scrape scripts in dependency order")
+    parser.add_argument("stages", nargs="*", help="only run these stages, e.g. vineyards:modify")
+    parser.add_argument("--force", action="store_true", help="run stages even if their inputs did not change")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip raw stages that succeeded and reuse the API responses of the last day",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="stages that run at the same time")
+    args = parser.parse_args()
+
+    pipeline = Pipeline(STAGES, DATA_DIR, STATE_PATH, args.workers)
+    unknown = set(args.stages) - set(pipeline.stages)
+    if len(unknown) > 0:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    results = pipeline.run(args.force, set(args.stages) if len(args.stages) > 0 else None, args.resume)
+    for name, result in results.items():
+        print(f"{name}: {result}")
+
+    sys.exit(0 if all(e in ("ran", "skipped") for e in results.values()) else 1)
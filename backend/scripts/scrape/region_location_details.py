@@ -1,7 +1,7 @@
 import os
 import sys
+from typing import Iterable
 
-import requests
 from dotenv import load_dotenv
 
 from .abstract_scrape_script import (
@@ -10,6 +10,7 @@ from .abstract_scrape_script import (
     ScriptMode,
     SimpleRegion,
 )
+from .fetch import FetchRequest
 
 load_dotenv()
 
@@ -21,33 +22,39 @@ class LocationInfo:
         self.level = level
         self.frequency: int = 0
         self.levels: list[int] = []
+        self.level_sum: int = 0
+
+    def add_level(self, level: int) -> None:
+        self.frequency += 1
+        self.levels.append(level)
+        self.level_sum += level
 
     def score(self) -> float:
-        return self.frequency * 0.5 + sum(self.levels) * 0.5
+        return self.frequency * 0.5 + self.level_sum * 0.5
 
     def average_level(self) -> float:
-        return sum(self.levels) / self.frequency
+        return self.level_sum / self.frequency
+
+    def key(self) -> tuple[float, float]:
+        """
+        Orders locations by score, then by average level.
+        """
+        return (self.score(), self.average_level())
 
     def __lt__(self, __o) -> bool:
         assert isinstance(__o, LocationInfo)
         other: LocationInfo = __o
-
-        if self.score() == other.score():
-            return self.average_level() < other.average_level()
-        return self.score() < other.score()
+        return self.key() < other.key()
 
     def __le__(self, __o) -> bool:
         assert isinstance(__o, LocationInfo)
         other: LocationInfo = __o
-
-        if self.score() == other.score():
-            return self.average_level() <= other.average_level()
-        return self.score() <= other.score()
+        return self.key() <= other.key()
 
     def __eq__(self, __o) -> bool:
         if isinstance(__o, LocationInfo):
             other: LocationInfo = __o
-            return self.score() == other.score() and self.average_level() == other.average_level()
+            return self.key() == other.key()
 
         return False
 
@@ -59,23 +66,17 @@ class LocationInfo:
     def __gt__(self, __o) -> bool:
         assert isinstance(__o, LocationInfo)
         other: LocationInfo = __o
-
-        if self.score() == other.score():
-            return self.average_level() > other.average_level()
-        return self.score() > other.score()
+        return self.key() > other.key()
 
     def __ge__(self, __o) -> bool:
         assert isinstance(__o, LocationInfo)
         other: LocationInfo = __o
-
-        if self.score() == other.score():
-            return self.average_level() >= other.average_level()
-        return self.score() >= other.score()
+        return self.key() >= other.key()
 
 
 class RegionLocationDetailsScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def get_locations(self) -> list[JsonObject]:
         data = self.read_json_file(self.root_dir / "data/modify/region_nearby_locations.json")
@@ -88,22 +89,24 @@ class RegionLocationDetailsScript(AbstractScrapeScript):
         headers = {"accept": "application/json"}
 
         location_details_endpoint_data: list[JsonObject] = []
-
-        for location in self.get_locations():
-            id: str = location["raw"]["location_id"]
-            url = location_details_url(id)
-
-            print(f"performing GET {url}")
-            response: JsonObject = requests.get(
-                url,
-                headers=headers,
-                params={
-                    "key": os.environ["TRIP_ADVISOR_API_KEY"],
-                    "language": "en",
-                    "currency": "USD",
-                },
-            ).json()
-
+        locations = self.get_locations()
+
+        responses: list[JsonObject] = self.fetcher.fetch_all(
+            [
+                FetchRequest(
+                    location_details_url(location["raw"]["location_id"]),
+                    params={
+                        "key": os.environ["TRIP_ADVISOR_API_KEY"],
+                        "language": "en",
+                        "currency": "USD",
+                    },
+                    headers=headers,
+                )
+                for location in locations
+            ]
+        )
+
+        for location, response in zip(locations, responses):
             location_details_endpoint_data.append(
                 {
                     "regions": location["regions"],
@@ -118,8 +121,7 @@ class RegionLocationDetailsScript(AbstractScrapeScript):
         return data
 
     def apply_changes(self) -> JsonObject:
-        data = self.read_json_file(self.root_dir / "data/raw" / self.filename)
-        location_details_data: list[JsonObject] = data["location_details"]
+        location_details_data = self.iter_json_items(self.root_dir / "data/raw" / self.filename, "location_details")
         region_locations = self.get_region_location_dict(location_details_data)
 
         region_data: list[JsonObject] = []
@@ -197,14 +199,14 @@ class RegionLocationDetailsScript(AbstractScrapeScript):
                 if location_id not in location_id_stats:
                     location_id_stats[location_id] = LocationInfo(location_id, ancestor["name"], ancestor["level"])
 
-                location_id_stats[location_id].frequency += 1
-                location_id_stats[location_id].levels.append(len(ancestors) - i)
+                location_id_stats[location_id].add_level(len(ancestors) - i)
 
-        best = max(location_id_stats.values())
+        # the key of each location is computed once, instead of on both sides of every comparison
+        best = max(location_id_stats.values(), key=LocationInfo.key)
 
         return {"level": best.level, "name": best.name, "location_id": best.location_id}
 
-    def get_region_location_dict(self, data: list[JsonObject]) -> dict[SimpleRegion, list[JsonObject]]:
+    def get_region_location_dict(self, data: Iterable[JsonObject]) -> dict[SimpleRegion, list[JsonObject]]:
         ret: dict[SimpleRegion, list[JsonObject]] = {}
 
         for location in data:
@@ -226,5 +228,8 @@ class RegionLocationDetailsScript(AbstractScrapeScript):
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = RegionLocationDetailsScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = RegionLocationDetailsScript(
+        AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume
+    )
     script.run()
@@ -1,7 +1,6 @@
 import os
 import sys
 
-import requests
 from dotenv import load_dotenv
 
 from .abstract_scrape_script import (
@@ -10,21 +9,19 @@ from .abstract_scrape_script import (
     ScriptMode,
     SimpleRegion,
 )
+from .fetch import FetchRequest
 
 load_dotenv()
 
 
 class RegionNearbyLocationsScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def get_unique_regions(self) -> set[SimpleRegion]:
-        data = self.read_json_file(self.root_dir / "data/modify/vineyards.json")
-        vineyards: list[JsonObject] = data["data"]
-
         ret: set[SimpleRegion] = set()
 
-        for vineyard in vineyards:
+        for vineyard in self.iter_json_items(self.root_dir / "data/modify/vineyards.json"):
             regions: list[JsonObject] = vineyard["regions"]
             for region in regions:
                 ret.add(SimpleRegion(region["name"], region["country"], region["latitude"], region["longitude"]))
@@ -39,20 +36,25 @@ class RegionNearbyLocationsScript(AbstractScrapeScript):
         headers = {"accept": "application/json"}
 
         nearby_search_endpoint_data: JsonObject = {}
-
-        for region in self.get_unique_regions():
-            print(f"performing GET {nearby_search_url} with {region.name}, {region.country}")
-            response: JsonObject = requests.get(
-                nearby_search_url,
-                headers=headers,
-                params={
-                    "key": os.environ["TRIP_ADVISOR_API_KEY"],
-                    "latLong": f"{region.latitude},{region.longitude}",
-                    "language": "en",
-                    "category": "attractions",
-                },
-            ).json()
-
+        regions = list(self.get_unique_regions())
+
+        responses: list[JsonObject] = self.fetcher.fetch_all(
+            [
+                FetchRequest(
+                    nearby_search_url,
+                    params={
+                        "key": os.environ["TRIP_ADVISOR_API_KEY"],
+                        "latLong": f"{region.latitude},{region.longitude}",
+                        "language": "en",
+                        "category": "attractions",
+                    },
+                    headers=headers,
+                )
+                for region in regions
+            ]
+        )
+
+        for region, response in zip(regions, responses):
             if region.country not in nearby_search_endpoint_data:
                 nearby_search_endpoint_data[region.country] = {}
             country_data = nearby_search_endpoint_data[region.country]
@@ -66,16 +68,13 @@ class RegionNearbyLocationsScript(AbstractScrapeScript):
         return data
 
     def apply_changes(self) -> JsonObject:
-        data = self.read_json_file(self.root_dir / "data/raw" / self.filename)
-        nearby_search_data: JsonObject = data["nearby_search"]
+        nearby_search_data = self.iter_json_entries(self.root_dir / "data/raw" / self.filename, "nearby_search")
 
         locations_dict: dict[str, JsonObject] = {}
         region_count = 0
         zero_location_count = 0
 
-        for country in nearby_search_data:
-            country_data: JsonObject = nearby_search_data[country]
-
+        for country, country_data in nearby_search_data:
             for region in country_data:
                 region_data: JsonObject = country_data[region]
                 locations: list[JsonObject] = region_data["data"]
@@ -116,5 +115,8 @@ class RegionNearbyLocationsScript(AbstractScrapeScript):
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = RegionNearbyLocationsScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = RegionNearbyLocationsScript(
+        AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume
+    )
     script.run()
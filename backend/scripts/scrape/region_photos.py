@@ -1,25 +1,22 @@
 import os
 import sys
 
-import requests
 from dotenv import load_dotenv
 
 from .abstract_scrape_script import AbstractScrapeScript, JsonObject, ScriptMode
+from .fetch import FetchRequest
 
 load_dotenv()
 
 
 class RegionPhotosScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def get_unique_region_ids(self) -> set[str]:
-        data = self.read_json_file(self.root_dir / "data/modify/region_location_details.json")
-        regions: list[JsonObject] = data["data"]
-
         ret: set[str] = set()
 
-        for region in regions:
+        for region in self.iter_json_items(self.root_dir / "data/modify/region_location_details.json"):
             ret.add(region["best_trip_advisor_ancestor"]["location_id"])
 
         return ret
@@ -31,21 +28,23 @@ class RegionPhotosScript(AbstractScrapeScript):
         headers = {"accept": "application/json"}
 
         location_photos_endpoint_data: JsonObject = {}
-        region_ids = self.get_unique_region_ids()
-
-        for id in region_ids:
-            url = location_photos_url(id)
-
-            print(f"performing GET {url}")
-            response: JsonObject = requests.get(
-                url,
-                headers=headers,
-                params={
-                    "key": os.environ["TRIP_ADVISOR_API_KEY"],
-                    "language": "en",
-                },
-            ).json()
-
+        region_ids = list(self.get_unique_region_ids())
+
+        responses: list[JsonObject] = self.fetcher.fetch_all(
+            [
+                FetchRequest(
+                    location_photos_url(id),
+                    params={
+                        "key": os.environ["TRIP_ADVISOR_API_KEY"],
+                        "language": "en",
+                    },
+                    headers=headers,
+                )
+                for id in region_ids
+            ]
+        )
+
+        for id, response in zip(region_ids, responses):
             location_photos_endpoint_data[id] = response
 
         print(f"total GET requests: {len(region_ids)}")
@@ -63,5 +62,6 @@ class RegionPhotosScript(AbstractScrapeScript):
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = RegionPhotosScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = RegionPhotosScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume)
     script.run()
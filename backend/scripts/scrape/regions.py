@@ -1,30 +1,29 @@
 import sys
+from typing import Iterator
 
 from dotenv import load_dotenv
 
-from .abstract_scrape_script import (
-    AbstractScrapeScript,
-    JsonObject,
-    ScriptMode,
-    SimpleRegion,
-)
+from .abstract_scrape_script import AbstractScrapeScript, JsonObject, ScriptMode
 
 load_dotenv()
 
 
 class RegionScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def scrape_api(self) -> JsonObject:
         return {}
 
     def apply_changes(self) -> JsonObject:
+        return {"data": self.create_models()}
+
+    def create_models(self) -> Iterator[JsonObject]:
         locations = self.get_locations()
-        region_photos = self.get_region_photos()
+        first_images = self.get_first_images(self.get_region_photos())
         region_info = self.get_region_info()
 
-        regions: list[JsonObject] = []
+        count = 0
         error_count = 0
 
         for location in locations:
@@ -33,7 +32,7 @@ class RegionScript(AbstractScrapeScript):
                 location_list = location["raw"]
 
                 rating_info = self.determine_rating_info(location_list)
-                image = self.get_first_image(region_photos, id)
+                image = first_images.get(id, {})
 
                 model: JsonObject = {
                     "name": location["name"],
@@ -49,15 +48,15 @@ class RegionScript(AbstractScrapeScript):
                     "imageWidth": image["width"],
                     "imageHeight": image["height"],
                 }
-
-                regions.append(model)
             except Exception:
                 error_count += 1
+                continue
 
-        print(f"final region count: {len(regions)}")
-        print(f"error count: {error_count}")
+            count += 1
+            yield model
 
-        return {"data": regions}
+        print(f"final region count: {count}")
+        print(f"error count: {error_count}")
 
     def get_region_info(self) -> JsonObject:
         data = self.read_json_file(self.root_dir / "data/raw/region_info.json")
@@ -67,50 +66,53 @@ class RegionScript(AbstractScrapeScript):
         data = self.read_json_file(self.root_dir / "data/misc/reviewed_photos.json")
         return data["data"]
 
-    def get_locations(self) -> list[JsonObject]:
-        data = self.read_json_file(self.root_dir / "data/modify/region_location_details.json")
-        return data["data"]
-
-    def get_regions_from_wines(self) -> set[SimpleRegion]:
-        ret: set[SimpleRegion] = set()
+    def get_locations(self) -> Iterator[JsonObject]:
+        return self.iter_json_items(self.root_dir / "data/modify/region_location_details.json")
 
-        data = self.read_json_file(self.root_dir / "data/final/wines.json")
-        wines: list[JsonObject] = data["data"]
+    def get_regions_from_wines(self) -> set[tuple[str, str]]:
+        ret: set[tuple[str, str]] = set()
 
-        for wine in wines:
-            ret.add(SimpleRegion(wine["region"], wine["country"]))
+        for wine in self.iter_json_items(self.root_dir / "data/final/wines.json"):
+            ret.add((wine["region"], wine["country"]))
 
         return ret
 
     def final_changes(self) -> JsonObject:
-        region_data = self.read_json_file(self.root_dir / "data/modify" / self.filename)
-        regions: list[JsonObject] = region_data["data"]
+        return {"data": self.filter_regions()}
 
+    def filter_regions(self) -> Iterator[JsonObject]:
         wine_regions = self.get_regions_from_wines()
-        ret: list[JsonObject] = []
+        count = 0
+        remove_count = 0
 
-        for region in regions:
-            if SimpleRegion(region["name"], region["country"]) in wine_regions:
-                ret.append(region)
+        for region in self.iter_json_items(self.root_dir / "data/modify" / self.filename):
+            if (region["name"], region["country"]) in wine_regions:
+                count += 1
+                yield region
+            else:
+                remove_count += 1
 
-        print(f"final wine count: {len(ret)}")
-        print(f"remove count: {len(regions)- len(ret)}")
+        print(f"final wine count: {count}")
+        print(f"remove count: {remove_count}")
 
-        return {"data": ret}
+    def get_first_images(self, photo_submissions: list[JsonObject]) -> dict[str, JsonObject]:
+        """
+        The first good photo of each location, by location id.
+        """
+        ret: dict[str, JsonObject] = {}
 
-    def get_first_image(self, photo_submissions: list[JsonObject], id: str) -> JsonObject:
         for photo_submission in photo_submissions:
-            if photo_submission["is_good"] and photo_submission["location_id"] == id:
+            if photo_submission["is_good"] and photo_submission["location_id"] not in ret:
                 images = photo_submission["images"]
                 image = images["large"]
 
-                return {
+                ret[photo_submission["location_id"]] = {
                     "url": image["url"],
                     "width": image["width"],
                     "height": image["height"],
                 }
 
-        return {}
+        return ret
 
     def determine_tags(self, location_list: list[JsonObject]) -> list[str]:
         tag_set: set[str] = set()
@@ -184,5 +186,6 @@ class RegionScript(AbstractScrapeScript):
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = RegionScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = RegionScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume)
     script.run()
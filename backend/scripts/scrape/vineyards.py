@@ -1,7 +1,7 @@
 import os
 import sys
+from typing import Iterator
 
-import requests
 from dotenv import load_dotenv
 
 from .abstract_scrape_script import (
@@ -10,21 +10,19 @@ from .abstract_scrape_script import (
     ScriptMode,
     SimpleRegion,
 )
+from .fetch import FetchRequest
 
 load_dotenv()
 
 
 class VineyardScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def get_unique_locations(self) -> set[SimpleRegion]:
-        data = self.read_json_file(self.root_dir / "data/modify/wines.json")
-        wines: list[JsonObject] = data["data"]
-
         ret: set[SimpleRegion] = set()
 
-        for wine in wines:
+        for wine in self.iter_json_items(self.root_dir / "data/modify/wines.json"):
             ret.add(SimpleRegion(wine["region"], wine["country"]))
 
         print(f"found unique locations: {len(ret)}")
@@ -52,26 +50,26 @@ class VineyardScript(AbstractScrapeScript):
         )
 
         search_endpoint_data: JsonObject = {}
+        locations = list(self.get_unique_locations())
 
-        for simple_region in self.get_unique_locations():
-            country_data = search_endpoint_data.setdefault(simple_region.country, {})
-            if simple_region.country not in search_endpoint_data:
-                search_endpoint_data[simple_region.country] = country_data
-
-            search_params: JsonObject = {
-                "location": f"{simple_region.name}, {simple_region.country}",
-                "term": "winery",
-                "categories": [categories],
-                "limit": "20",
-            }
-
-            print(f"performing GET {search_url} with location " + search_params["location"])
-            response: JsonObject = requests.get(
-                search_url,
-                params=search_params,
-                headers=headers,
-            ).json()
+        responses: list[JsonObject] = self.fetcher.fetch_all(
+            [
+                FetchRequest(
+                    search_url,
+                    params={
+                        "location": f"{simple_region.name}, {simple_region.country}",
+                        "term": "winery",
+                        "categories": [categories],
+                        "limit": "20",
+                    },
+                    headers=headers,
+                )
+                for simple_region in locations
+            ]
+        )
 
+        for simple_region, response in zip(locations, responses):
+            country_data = search_endpoint_data.setdefault(simple_region.country, {})
             country_data[simple_region.name] = response
 
         data: JsonObject = {
@@ -81,18 +79,13 @@ class VineyardScript(AbstractScrapeScript):
         return data
 
     def apply_changes(self) -> JsonObject:
-        data = self.read_json_file(self.root_dir / "data/raw" / self.filename)
         business_dict: dict[str, JsonObject] = {}
 
         error_count = 0
         region_error = 0
         zero_found = 0
 
-        search_endpoint_data: JsonObject = data["search"]
-
-        for country in search_endpoint_data:
-            country_data: JsonObject = search_endpoint_data[country]
-
+        for country, country_data in self.iter_json_entries(self.root_dir / "data/raw" / self.filename, "search"):
             for region in country_data:
                 region_data: JsonObject = country_data[region]
 
@@ -160,31 +153,33 @@ class VineyardScript(AbstractScrapeScript):
         return {"data": ret}
 
     def final_changes(self) -> JsonObject:
-        data = self.read_json_file(self.root_dir / "data/modify" / self.filename)
-        vineyards: list[JsonObject] = data["data"]
+        return {"data": self.filter_vineyards()}
 
+    def filter_vineyards(self) -> Iterator[JsonObject]:
         regions = self.get_region_candidates()
-        ret: list[JsonObject] = []
+        count = 0
+        remove_count = 0
 
-        for vineyard in vineyards:
+        for vineyard in self.iter_json_items(self.root_dir / "data/modify" / self.filename):
             vineyard_country = vineyard["country"]
             vineyard_regions: list[JsonObject] = vineyard["regions"]
 
-            filtered_regions = filter(lambda e: SimpleRegion(e["name"], vineyard_country) in regions, vineyard_regions)
-            region_names: list[str] = list(map(lambda e: e["name"], filtered_regions))
+            region_names = [e["name"] for e in vineyard_regions if (e["name"], vineyard_country) in regions]
 
             if len(region_names) > 0:
                 vineyard["regions"] = region_names
                 vineyard.pop("raw", None)
-                ret.append(vineyard)
+                count += 1
+                yield vineyard
+            else:
+                remove_count += 1
 
-        print(f"final vineyard count: {len(ret)}")
-        print(f"remove count: {len(vineyards) - len(ret)}")
-
-        return {"data": ret}
+        print(f"final vineyard count: {count}")
+        print(f"remove count: {remove_count}")
 
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = VineyardScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = VineyardScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume)
     script.run()
@@ -20,16 +20,13 @@ reddit = praw.Reddit(
 
 
 class WineRedditScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def get_wine_types(self) -> set[str]:
-        data = self.read_json_file(self.root_dir / "data/modify/wines.json")
-        wines: list[JsonObject] = data["data"]
-
         ret: set[str] = set()
 
-        for wine in wines:
+        for wine in self.iter_json_items(self.root_dir / "data/modify/wines.json"):
             ret.add(wine["type"])
 
         return ret
@@ -64,5 +61,6 @@ class WineRedditScript(AbstractScrapeScript):
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = WineRedditScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = WineRedditScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume)
     script.run()
@@ -1,19 +1,15 @@
 import re
 import sys
+from typing import Iterator
 
 import requests
 
-from .abstract_scrape_script import (
-    AbstractScrapeScript,
-    JsonObject,
-    ScriptMode,
-    SimpleRegion,
-)
+from .abstract_scrape_script import AbstractScrapeScript, JsonObject, ScriptMode
 
 
 class WineScript(AbstractScrapeScript):
-    def __init__(self, filename: str, script_type: ScriptMode) -> None:
-        super().__init__(filename, script_type)
+    def __init__(self, filename: str, script_type: ScriptMode, resume: bool = False) -> None:
+        super().__init__(filename, script_type, resume)
 
     def scrape_api(self) -> JsonObject:
         data: JsonObject = {}
@@ -32,9 +28,10 @@ class WineScript(AbstractScrapeScript):
         return data
 
     def apply_changes(self) -> JsonObject:
-        data = self.read_json_file(self.root_dir / "data/raw" / self.filename)
-        ret: list[JsonObject] = []
+        return {"data": self.create_models()}
 
+    def create_models(self) -> Iterator[JsonObject]:
+        count = 0
         error_count = 0
         wine_types = {
             "reds": "Red",
@@ -45,9 +42,7 @@ class WineScript(AbstractScrapeScript):
             "port": "Port",
         }
 
-        for endpoint in data:
-            wines: list[JsonObject] = data[endpoint]
-
+        for endpoint, wines in self.iter_json_entries(self.root_dir / "data/raw" / self.filename):
             for wine in wines:
                 try:
                     model: JsonObject = {
@@ -80,34 +75,37 @@ class WineScript(AbstractScrapeScript):
                     assert isinstance(model["region"], str) and len(model["region"]) > 0
                     assert isinstance(model["name"], str) and len(model["name"]) > 0
                     assert isinstance(model["type"], str) and len(model["type"]) > 0
-
-                    ret.append(model)
                 except Exception:
                     error_count += 1
+                    continue
 
-        print(f"final wine count: {len(ret)}")
-        print(f"errored wine count: {error_count}")
+                count += 1
+                yield model
 
-        return {"data": ret}
+        print(f"final wine count: {count}")
+        print(f"errored wine count: {error_count}")
 
     def final_changes(self) -> JsonObject:
-        data = self.read_json_file(self.root_dir / "data/modify" / self.filename)
-        wines: list[JsonObject] = data["data"]
+        return {"data": self.filter_wines()}
 
+    def filter_wines(self) -> Iterator[JsonObject]:
         regions = self.get_region_candidates()
-        ret: list[JsonObject] = []
-
-        for wine in wines:
-            if SimpleRegion(wine["region"], wine["country"]) in regions:
-                ret.append(wine)
+        count = 0
+        remove_count = 0
 
-        print(f"final wine count: {len(ret)}")
-        print(f"remove count: {len(wines)- len(ret)}")
+        for wine in self.iter_json_items(self.root_dir / "data/modify" / self.filename):
+            if (wine["region"], wine["country"]) in regions:
+                count += 1
+                yield wine
+            else:
+                remove_count += 1
 
-        return {"data": ret}
+        print(f"final wine count: {count}")
+        print(f"remove count: {remove_count}")
 
 
 if __name__ == "__main__":
     enum_key = sys.argv[1].upper()
-    script = WineScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key])
+    resume = "--resume" in sys.argv[2:]
+    script = WineScript(AbstractScrapeScript.determine_output_filename(__file__), ScriptMode[enum_key], resume)
     script.run()
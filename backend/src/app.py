@@ -1,6 +1,12 @@
+import os
+
 import __init__  # type: ignore
 from src import routes
 from src.common.core import api, app
+from src.common.response_cache import ResponseCache, create_backend
+from src.common.search_index import search_indexes
+from src.util import http_cache
+from src.util.data_version import get_data_version, on_data_version_change
 
 """
 useful info/documentation
@@ -26,24 +32,48 @@ JSON MEMBER OF function
 - https://dev.mysql.com/doc/refman/8.0/en/json-search-functions.html#operator_member-of
 """
 
+RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+RESPONSE_CACHE_TTL = 300  # seconds
+
+# set RESPONSE_CACHE_URL to a redis:// url to share cached responses between workers
+response_cache = ResponseCache(
+    create_backend(os.environ.get("RESPONSE_CACHE_URL"), RESPONSE_CACHE_BYTES, RESPONSE_CACHE_TTL),
+    lambda: get_data_version()[0],
+)
+on_data_version_change(response_cache.backend.clear)
+cached = response_cache.cached
+
+app.before_request(http_cache.before_request)
+app.after_request(http_cache.after_request)
+
 api.add_resource(routes.Welcome, "/")
 
-api.add_resource(routes.RegionsAll, "/regions")
-api.add_resource(routes.RegionsId, "/regions/<int:id>")
-api.add_resource(routes.RegionsConstraints, "/regions/constraints")
+api.add_resource(cached(routes.RegionsAll), "/regions")
+api.add_resource(cached(routes.RegionsId), "/regions/<int:id>")
+api.add_resource(cached(routes.RegionsBatch), "/regions/batch")
+api.add_resource(cached(routes.RegionsConstraints), "/regions/constraints")
 
-api.add_resource(routes.WinesAll, "/wines")
-api.add_resource(routes.WinesId, "/wines/<int:id>")
-api.add_resource(routes.WinesConstraints, "/wines/constraints")
+api.add_resource(cached(routes.WinesAll), "/wines")
+api.add_resource(cached(routes.WinesId), "/wines/<int:id>")
+api.add_resource(cached(routes.WinesBatch), "/wines/batch")
+api.add_resource(cached(routes.WinesConstraints), "/wines/constraints")
 
-api.add_resource(routes.VineyardsAll, "/vineyards")
-api.add_resource(routes.VineyardsId, "/vineyards/<int:id>")
-api.add_resource(routes.VineyardsConstraints, "/vineyards/constraints")
+api.add_resource(cached(routes.VineyardsAll), "/vineyards")
+api.add_resource(cached(routes.VineyardsId), "/vineyards/<int:id>")
+api.add_resource(cached(routes.VineyardsBatch), "/vineyards/batch")
+api.add_resource(cached(routes.VineyardsConstraints), "/vineyards/constraints")
 
 api.add_resource(routes.VisualizationLine, "/visualizations/provider/line")
 api.add_resource(routes.VisualizationChoropleth, "/visualizations/provider/choropleth")
 api.add_resource(routes.VisualizationBubble, "/visualizations/provider/bubble")
 
+api.add_resource(routes.Stats, "/stats", resource_class_kwargs={"response_cache": response_cache})
+
+# build the search indexes now, rather than during the first search
+with app.app_context():
+    for search_index in search_indexes:
+        search_index.ensure_built()
+
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=4000, debug=True)
@@ -0,0 +1,42 @@
+import base64
+import binascii
+import json
+from decimal import Decimal
+from typing import Any, Optional
+
+
+class Cursor:
+    """
+    Opaque keyset position in a sorted list.
+
+    A cursor remembers the sort key and id of the row on the edge of a page. When `reverse` is false, the page it
+    points to starts right after that row; otherwise the page ends right before it.
+    """
+
+    def __init__(self, sort: Optional[str], value: Any, id: int, page: int, reverse: bool = False) -> None:
+        self.sort = sort
+        self.value = value
+        self.id = id
+        self.page = page
+        self.reverse = reverse
+
+    def encode(self) -> str:
+        value = str(self.value) if isinstance(self.value, Decimal) else self.value
+        content = json.dumps([self.sort, value, self.id, self.page, self.reverse], separators=(",", ":"))
+        return base64.urlsafe_b64encode(content.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode(s: str) -> "Cursor":
+        try:
+            padding = "=" * (-len(s) % 4)
+            content = base64.urlsafe_b64decode(s + padding).decode()
+            sort, value, id, page, reverse = json.loads(content)
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError):
+            raise ValueError("invalid cursor")
+
+        if sort is not None and not isinstance(sort, str):
+            raise ValueError("invalid cursor")
+        if not isinstance(id, int) or not isinstance(page, int) or not isinstance(reverse, bool):
+            raise ValueError("invalid cursor")
+
+        return Cursor(sort, value, id, page, reverse)
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Hashable, Optional, Protocol
+
+import requests
+from flask_restful.representations.json import output_json
+
+from src.util.general import JsonObject
+
+logger = logging.getLogger(__name__)
+
+MAX_VIEWS = 64
+
+
+class ProviderSource(Protocol):
+    def fetch(self, resource: str) -> JsonObject:
+        ...
+
+
+class HttpSource:
+    """
+    Reads resources from the provider's API, e.g. `https://api.parkscape.me/parks`.
+    """
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def fetch(self, resource: str) -> JsonObject:
+        res = self.session.get(f"{self.base_url}/{resource}", timeout=self.timeout)
+        res.raise_for_status()
+        return res.json()
+
+
+class FileSource:
+    """
+    Reads resources from `<directory>/<resource>.json`, standing in for the provider's API.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def fetch(self, resource: str) -> JsonObject:
+        with open(self.directory / f"{resource}.json") as file:
+            return json.load(file)
+
+
+class ProviderEntry:
+    def __init__(self, fetched_at: float, payload: JsonObject) -> None:
+        self.fetched_at = fetched_at
+        self.payload = payload
+        self.digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def create_source(location: str, timeout: float) -> ProviderSource:
+    if location.startswith(("http://", "https://")):
+        return HttpSource(location, timeout)
+    return FileSource(Path(location))
+
+
+class ProviderStore:
+    """
+    Keeps the last good payload of each provider resource in memory and on disk.
+
+    Handlers are served from memory, and every `refresh_interval` seconds the resources served so far are fetched
+    again by a daemon thread that starts with the first request. Once a payload is older than `max_age` it is still
+    served while a background thread fetches a new one (stale-while-revalidate); if that fetch fails, the old payload
+    is kept. Only a resource that was never fetched, neither by this process nor by an earlier one, is fetched while
+    the request waits.
+
+    Responses derived from a payload are rendered through `render`, which keeps the serialized JSON of the
+    `max_views` most recently used ones until the content of their payload changes.
+    """
+
+    def __init__(
+        self,
+        source: ProviderSource,
+        cache_dir: Optional[Path],
+        max_age: float,
+        refresh_interval: Optional[float] = None,
+        max_views: int = MAX_VIEWS,
+    ) -> None:
+        self.source = source
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.refresh_interval = refresh_interval
+        self.scheduled = False
+        self.entries: dict[str, ProviderEntry] = {}
+        self.max_views = max_views
+        self.views: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+        self.refreshing: set[str] = set()
+        self.lock = Lock()
+        self.stopped = Event()
+
+    def get(self, resource: str) -> JsonObject:
+        return self.get_entry(resource).payload
+
+    def get_entry(self, resource: str) -> ProviderEntry:
+        self.schedule()
+
+        entry = self.entries.get(resource)
+        if entry is None:
+            entry = self.load(resource)
+
+        if entry is None:
+            return self.refresh(resource)
+
+        if time.time() - entry.fetched_at >= self.max_age:
+            self.refresh_in_background(resource)
+
+        return entry
+
+    def render(self, resource: str, create: Callable[..., JsonObject], *args: Hashable) -> bytes:
+        """
+        Returns the serialized JSON of `create(payload, *args)`, only calling `create` again once the payload changed.
+        """
+        entry = self.get_entry(resource)
+        key = (resource, create, *args)
+
+        with self.lock:
+            view = self.views.get(key)
+            if view is not None and view[0] == entry.digest:
+                self.views.move_to_end(key)
+                return view[1]
+
+        body = output_json(create(entry.payload, *args), 200).get_data()
+        with self.lock:
+            self.views[key] = (entry.digest, body)
+            self.views.move_to_end(key)
+
+            while len(self.views) > self.max_views:
+                self.views.popitem(last=False)
+
+        return body
+
+    def refresh(self, resource: str) -> ProviderEntry:
+        entry = ProviderEntry(time.time(), self.source.fetch(resource))
+
+        with self.lock:
+            self.entries[resource] = entry
+
+            # views of an older payload are never served again
+            for key in [k for k, v in self.views.items() if k[0] == resource and v[0] != entry.digest]:
+                del self.views[key]
+
+        self.save(resource, entry)
+
+        return entry
+
+    def try_refresh(self, resource: str) -> bool:
+        try:
+            self.refresh(resource)
+            return True
+        except Exception:
+            logger.warning("could not refresh provider resource %s", resource, exc_info=True)
+            return False
+        finally:
+            with self.lock:
+                self.refreshing.discard(resource)
+
+    def refresh_in_background(self, resource: str) -> None:
+        with self.lock:
+            if resource in self.refreshing:
+                return
+            self.refreshing.add(resource)
+
+        Thread(target=self.try_refresh, args=(resource,), daemon=True).start()
+
+    def schedule(self) -> None:
+        if self.refresh_interval is None or self.scheduled:
+            return
+
+        with self.lock:
+            if self.scheduled:
+                return
+            self.scheduled = True
+
+        def run(interval: float) -> None:
+            while not self.stopped.wait(interval):
+                for resource in list(self.entries):
+                    self.try_refresh(resource)
+
+        Thread(target=run, args=(self.refresh_interval,), daemon=True).start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def path(self, resource: str) -> Optional[Path]:
+        return None if self.cache_dir is None else self.cache_dir / f"{resource}.json"
+
+    def load(self, resource: str) -> Optional[ProviderEntry]:
+        path = self.path(resource)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            with open(path) as file:
+                obj = json.load(file)
+        except (OSError, ValueError):
+            logger.warning("ignoring unreadable provider snapshot %s", path, exc_info=True)
+            return None
+
+        entry = ProviderEntry(obj["fetchedAt"], obj["payload"])
+        with self.lock:
+            return self.entries.setdefault(resource, entry)
+
+    def save(self, resource: str, entry: ProviderEntry) -> None:
+        path = self.path(resource)
+        if path is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+        with open(temp_path, "w") as file:
+            json.dump({"fetchedAt": entry.fetched_at, "payload": entry.payload}, file)
+
+        # readers never see a partially written snapshot
+        os.replace(temp_path, path)
@@ -0,0 +1,164 @@
+import time
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Callable, Optional, Protocol
+
+from flask import Response, request
+from flask_restful import Resource
+from flask_restful.representations.json import output_json
+
+from src.util.http_cache import normalized_query
+
+
+class ResponseCacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    def set(self, key: str, value: bytes) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class LocalBackend:
+    """
+    LRU of response bodies for a single process, bounded by the total size of the bodies it holds.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires <= time.monotonic():
+                self._remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.size += len(value)
+
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def _remove(self, key: str) -> None:
+        _, value = self.entries.pop(key)
+        self.size -= len(value)
+
+
+class RedisBackend:
+    """
+    Response bodies kept in a Redis compatible server, so that every gunicorn worker shares the same hits. Memory and
+    eviction are bounded by the server configuration (`maxmemory` with an LRU policy).
+    """
+
+    def __init__(self, url: str, ttl: float, prefix: str = "wineworld:response:") -> None:
+        import redis  # optional dependency, only needed when this backend is configured
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(self.prefix + key, value, px=int(self.ttl * 1000))
+
+    def clear(self) -> None:
+        # keys include the data version, so entries of older versions are never read again and simply expire
+        pass
+
+
+def create_backend(url: Optional[str], max_bytes: int, ttl: float) -> ResponseCacheBackend:
+    if url is None or len(url) == 0:
+        return LocalBackend(max_bytes, ttl)
+    return RedisBackend(url, ttl)
+
+
+class ResponseCache:
+    """
+    Caches the JSON bodies returned by resources, keyed by the data version, the path and the canonicalized query
+    arguments of the request. Nothing is cached while there is no data version.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, get_version: Callable[[], Optional[str]]) -> None:
+        self.backend = backend
+        self.get_version = get_version
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def key(self, version: str) -> str:
+        return f"{version}:{request.path}?{normalized_query()}"
+
+    def decorator(self, method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            version = self.get_version()
+            if version is None:
+                return method(*args, **kwargs)
+
+            key = self.key(version)
+            body = self.backend.get(key)
+
+            if body is not None:
+                with self.lock:
+                    self.hits += 1
+                return Response(body, mimetype="application/json")
+
+            with self.lock:
+                self.misses += 1
+            data = method(*args, **kwargs)
+            if not isinstance(data, dict):
+                return data
+
+            body = output_json(data, 200).get_data()
+            self.backend.set(key, body)
+            return Response(body, mimetype="application/json")
+
+        return wrapper
+
+    def stats(self) -> dict:
+        with self.lock:
+            hits, misses = self.hits, self.misses
+
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hitRate": 0.0 if lookups == 0 else hits / lookups,
+        }
+
+    def cached(self, resource: type[Resource]) -> type[Resource]:
+        """
+        Returns a resource whose GET responses are served from this cache. The returned class keeps the name of the
+        original resource, so endpoint names do not change.
+        """
+        return type(resource.__name__, (resource,), {"method_decorators": {"get": [self.decorator]}})
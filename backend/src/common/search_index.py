@@ -0,0 +1,184 @@
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Optional
+
+from sqlalchemy import bindparam
+from sqlalchemy.sql.expression import Select
+
+from src.common.core import db
+from src.common.simple_argument import SimpleArgument
+from src.common.sort_method import SortMethod
+from src.util.data_version import on_data_version_change
+from src.util.database import execute_cached
+
+token_regex = re.compile(r"\w+")
+
+GRAM_SIZE = 3
+MATCH_CACHE_SIZE = 4096
+SEARCH_CACHE_SIZE = 1024
+
+# how well a query term matches an indexed token
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.75
+SUBSTRING_MATCH = 0.5
+
+# every index, so that they can be built when the app starts
+search_indexes: list["SearchIndex"] = []
+
+search_argument = SimpleArgument(
+    "search",
+    type=str,
+    location="values",
+)
+
+
+def tokenize(s: str) -> list[str]:
+    decomposed = unicodedata.normalize("NFKD", s)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return token_regex.findall(stripped.lower())
+
+
+def grams(token: str, size: int) -> set[str]:
+    return {token[i : i + size] for i in range(len(token) - size + 1)}
+
+
+class SearchIndex:
+    """
+    In-process inverted index over the text columns of a model.
+
+    Query terms match any indexed token that contains them, so a search behaves like the `LIKE '%term%'` predicates
+    it replaces, but is answered from memory through an n-gram index over the vocabulary. Every term of a query has to
+    match, and results are ranked by how well and in which columns they matched. A query without any terms, e.g. only
+    punctuation, is looked for as a substring of the indexed texts, like `LIKE` would.
+    """
+
+    def __init__(self, model, weights: dict[str, float], max_age: float = 3600) -> None:
+        self.model = model
+        self.weights = weights
+        self.max_age = max_age
+        self.built_at: Optional[float] = None
+        self.lock = Lock()
+
+        self.postings: dict[str, dict[int, float]] = {}
+        self.texts: dict[int, list[str]] = {}
+        self.gram_index: dict[str, set[str]] = {}
+        self.match = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+        self.search = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search)
+
+        on_data_version_change(self.invalidate)
+        search_indexes.append(self)
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.built_at = None
+
+    def ensure_built(self) -> None:
+        with self.lock:
+            if self.built_at is not None and time.monotonic() - self.built_at < self.max_age:
+                return
+
+            columns = [getattr(self.model, name) for name in self.weights]
+            rows = db.session.execute(db.select(self.model.id, *columns)).all()
+            self.build(rows)
+            self.built_at = time.monotonic()
+
+    def build(self, rows: list[Any]) -> None:
+        postings: dict[str, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        texts: dict[int, list[str]] = defaultdict(list)
+        weights = list(self.weights.values())
+
+        for id, *values in rows:
+            for weight, value in zip(weights, values):
+                for text in value if isinstance(value, list) else [value]:
+                    if text is None:
+                        continue
+
+                    texts[id].append(text.lower())
+                    for token in tokenize(text):
+                        postings[token][id] += weight
+
+        gram_index: dict[str, set[str]] = defaultdict(set)
+        for token in postings:
+            for size in range(1, GRAM_SIZE + 1):
+                for gram in grams(token, size):
+                    gram_index[gram].add(token)
+
+        self.postings = {token: dict(ids) for token, ids in postings.items()}
+        self.gram_index = dict(gram_index)
+        self.texts = dict(texts)
+        self.match.cache_clear()
+        self.search.cache_clear()
+
+    def _match(self, term: str) -> list[tuple[str, float]]:
+        size = min(len(term), GRAM_SIZE)
+        candidates: Optional[set[str]] = None
+
+        for gram in grams(term, size):
+            tokens = self.gram_index.get(gram, set())
+            candidates = tokens if candidates is None else candidates & tokens
+
+        ret: list[tuple[str, float]] = []
+
+        for token in candidates or set():
+            if token == term:
+                ret.append((token, EXACT_MATCH))
+            elif token.startswith(term):
+                ret.append((token, PREFIX_MATCH))
+            elif term in token:
+                ret.append((token, SUBSTRING_MATCH))
+
+        return ret
+
+    def _search(self, s: str) -> tuple[int, ...]:
+        terms = tokenize(s)
+        if len(terms) == 0:
+            value = s.lower()
+            return tuple(sorted(id for id, texts in self.texts.items() if any(value in e for e in texts)))
+
+        scores: Optional[dict[int, float]] = None
+
+        for term in terms:
+            term_scores: dict[int, float] = {}
+
+            for token, quality in self.match(term):
+                for id, weight in self.postings[token].items():
+                    term_scores[id] = max(term_scores.get(id, 0.0), weight * quality)
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {id: scores[id] + score for id, score in term_scores.items() if id in scores}
+
+        ranked = sorted(scores or {}, key=lambda id: (-scores[id], id))  # type: ignore
+        return tuple(ranked)
+
+    def filter_ids(self, query: Select, value: str, sort_method: Optional[SortMethod]) -> list[int]:
+        """
+        Finds the ids of the instances that a query selects and that match a search, ordered by the sort method, or by
+        relevance without one. Only the matching ids are read from the database: they are bound as one expanding
+        parameter, so the filters of the query and the sort run there on the matches alone, while matching and ranking
+        run in memory, and no statement depends on how many instances match.
+        """
+        self.ensure_built()
+        matches = self.search(value)
+        if len(matches) == 0:
+            return []
+
+        id_query = query.with_only_columns(self.model.id).order_by(None)
+
+        if sort_method is None and id_query.whereclause is None:
+            return list(matches)
+
+        id_query = id_query.where(self.model.id.in_(bindparam("ids", expanding=True)))
+        params = {"ids": list(matches)}
+
+        if sort_method is not None:
+            id_query = id_query.order_by(*sort_method.order_by(self.model.id))
+            return list(execute_cached(id_query, params).scalars())
+
+        selected = set(execute_cached(id_query, params).scalars())
+        return [id for id in matches if id in selected]
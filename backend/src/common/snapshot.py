@@ -0,0 +1,34 @@
+from threading import Lock
+from typing import Callable, Generic, Optional, TypeVar
+
+from src.util.data_version import get_data_version, on_data_version_change
+
+T = TypeVar("T")
+
+
+class Snapshot(Generic[T]):
+    """
+    Value derived from the catalog that is built on first use and kept in memory until the data version changes.
+    Without a data version, it is built on every use.
+    """
+
+    def __init__(self, build: Callable[[], T]) -> None:
+        self.build = build
+        self.value: Optional[T] = None
+        self.lock = Lock()
+
+        on_data_version_change(self.invalidate)
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.value = None
+
+    def get(self) -> T:
+        version, _ = get_data_version()  # notices reloads, which invalidates this snapshot
+        if version is None:
+            return self.build()
+
+        with self.lock:
+            if self.value is None:
+                self.value = self.build()
+            return self.value
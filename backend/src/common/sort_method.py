@@ -1,11 +1,16 @@
+import math
+from decimal import Decimal
+from typing import Any
+
 from sqlalchemy import Column
-from sqlalchemy.sql.expression import text
+from sqlalchemy.sql.expression import ColumnElement, and_, or_
 
 from src.models import Region, Vineyard, Wine
 
 
 class SortMethod:
     def __init__(self, column: Column, ascending: bool, name: str, group: str) -> None:
+        self.column = column
         self.key: str = column.key
         self.name = name
         self.group = group
@@ -13,7 +18,31 @@ class SortMethod:
 
         direction = "asc" if ascending else "desc"
         self.id = f"{self.key}_{direction}"
-        self.clause = text(f"{self.key} {direction}")
+
+    def to_value(self, raw: Any) -> Any:
+        value = self.column.type.python_type(raw)
+        if isinstance(value, (Decimal, float)) and not math.isfinite(value):
+            raise ValueError(f"{raw} is not a finite number")
+        return value
+
+    def value_of(self, instance: Any) -> Any:
+        return getattr(instance, self.key)
+
+    def order_by(self, id_column: Column, reverse: bool = False) -> list[ColumnElement]:
+        ascending = self.ascending != reverse
+        if ascending:
+            return [self.column.asc(), id_column.asc()]
+        return [self.column.desc(), id_column.desc()]
+
+    def seek(self, id_column: Column, value: Any, id: int, reverse: bool = False) -> ColumnElement:
+        """
+        Selects the rows after `(value, id)` in the order of this sort. The redundant bound on the column alone lets
+        the database range scan the `(column, id)` index of the table, which the `OR` on its own does not.
+        """
+        ascending = self.ascending != reverse
+        if ascending:
+            return and_(self.column >= value, or_(self.column > value, id_column > id))
+        return and_(self.column <= value, or_(self.column < value, id_column < id))
 
     def to_json(self):
         return {
@@ -0,0 +1,42 @@
+from sqlalchemy.util import LRUCache
+
+
+class StatementCache(LRUCache):
+    """
+    LRU of compiled SQL statements that counts its hits and misses.
+
+    SQLAlchemy keys compiled statements by their structure, leaving bound values out, so as long as filters use bound
+    parameters, every request with the same filter shape reuses one compiled statement. Pass an instance as the
+    `compiled_cache` execution option to use it. The counters are updated under the lock of the LRU, since threaded
+    workers share one cache.
+    """
+
+    __slots__ = "hits", "misses"
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        item = super().get(key, default)
+
+        with self._mutex:
+            if item is default:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return item
+
+    def stats(self) -> dict:
+        with self._mutex:
+            hits, misses = self.hits, self.misses
+
+        lookups = hits + misses
+        return {
+            "size": len(self),
+            "hits": hits,
+            "misses": misses,
+            "hitRate": 0.0 if lookups == 0 else hits / lookups,
+        }
@@ -1,5 +1,8 @@
+from .data_version import DataVersion
 from .reddit_post import RedditPost
 from .region import Region
+from .region_tag import RegionTag
+from .region_trip_type import RegionTripType
 from .vineyard import Vineyard
 from .vineyard_region_association import VineyardRegionAssociation
 from .wine import Wine
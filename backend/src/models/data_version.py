@@ -0,0 +1,12 @@
+# mypy: disable-error-code="name-defined"
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from src.common.core import db
+
+
+class DataVersion(db.Model):
+    __tablename__ = "data_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(String(32))
+    updated_at = Column(DateTime)
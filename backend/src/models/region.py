@@ -1,6 +1,6 @@
 # mypy: disable-error-code="name-defined"
 
-from sqlalchemy import DECIMAL, JSON, Column, Integer, String
+from sqlalchemy import DECIMAL, JSON, Column, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.common.core import db, ma
@@ -8,6 +8,13 @@ from src.common.core import db, ma
 
 class Region(db.Model):
     __tablename__ = "regions"
+    # keyset pagination seeks on (sort column, id), see SortMethod.seek
+    __table_args__ = (
+        Index("ix_regions_name_id", "name", "id"),
+        Index("ix_regions_rating_id", "rating", "id"),
+        Index("ix_regions_reviews_id", "reviews", "id"),
+        Index("ix_regions_country_id", "country", "id"),
+    )
     id = Column(Integer, primary_key=True)
     name = Column(String(100))
     country = Column(String(100))
@@ -23,3 +30,5 @@ class Region(db.Model):
     image_height = Column(Integer)
     wine_list = relationship("WineRegionAssociation", back_populates="region")
     vineyard_list = relationship("VineyardRegionAssociation", back_populates="region")
+    tag_list = relationship("RegionTag", back_populates="region")
+    trip_type_list = relationship("RegionTripType", back_populates="region")
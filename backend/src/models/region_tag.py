@@ -0,0 +1,13 @@
+# mypy: disable-error-code="name-defined"
+
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.orm import relationship
+
+from src.common.core import db
+
+
+class RegionTag(db.Model):
+    __tablename__ = "region_tags"
+    region_id = Column(ForeignKey("regions.id"), primary_key=True)
+    tag = Column(String(100), primary_key=True, index=True)
+    region = relationship("Region", back_populates="tag_list")
@@ -0,0 +1,13 @@
+# mypy: disable-error-code="name-defined"
+
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.orm import relationship
+
+from src.common.core import db
+
+
+class RegionTripType(db.Model):
+    __tablename__ = "region_trip_types"
+    region_id = Column(ForeignKey("regions.id"), primary_key=True)
+    trip_type = Column(String(100), primary_key=True, index=True)
+    region = relationship("Region", back_populates="trip_type_list")
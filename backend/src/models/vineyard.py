@@ -1,6 +1,6 @@
 # mypy: disable-error-code="name-defined"
 
-from sqlalchemy import DECIMAL, JSON, Column, Integer, String
+from sqlalchemy import DECIMAL, JSON, Column, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.common.core import db
@@ -8,6 +8,14 @@ from src.common.core import db
 
 class Vineyard(db.Model):
     __tablename__ = "vineyards"
+    # keyset pagination seeks on (sort column, id), see SortMethod.seek
+    __table_args__ = (
+        Index("ix_vineyards_name_id", "name", "id"),
+        Index("ix_vineyards_price_id", "price", "id"),
+        Index("ix_vineyards_rating_id", "rating", "id"),
+        Index("ix_vineyards_reviews_id", "reviews", "id"),
+        Index("ix_vineyards_country_id", "country", "id"),
+    )
     id = Column(Integer, primary_key=True)
     name = Column(String(100))
     country = Column(String(100))
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from sqlalchemy import DECIMAL, Column, ForeignKey, Integer, String
+from sqlalchemy import DECIMAL, Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.common.core import db
@@ -10,6 +10,15 @@ from src.common.core import db
 
 class Wine(db.Model):
     __tablename__ = "wines"
+    # keyset pagination seeks on (sort column, id), see SortMethod.seek
+    __table_args__ = (
+        Index("ix_wines_name_id", "name", "id"),
+        Index("ix_wines_rating_id", "rating", "id"),
+        Index("ix_wines_reviews_id", "reviews", "id"),
+        Index("ix_wines_country_id", "country", "id"),
+        Index("ix_wines_winery_id", "winery", "id"),
+        Index("ix_wines_type_id", "type", "id"),
+    )
     id = Column(Integer, primary_key=True)
     name = Column(String(100))
     country = Column(String(100))
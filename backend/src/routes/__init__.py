@@ -1,7 +1,10 @@
 from .regions.all import RegionsAll
+from .regions.batch import RegionsBatch
 from .regions.constraints import RegionsConstraints
 from .regions.id import RegionsId
+from .stats import Stats
 from .vineyards.all import VineyardsAll
+from .vineyards.batch import VineyardsBatch
 from .vineyards.constraints import VineyardsConstraints
 from .vineyards.id import VineyardsId
 from .visualizations.provider.bubble.index import VisualizationBubble
@@ -9,5 +12,6 @@ from .visualizations.provider.choropleth.index import VisualizationChoropleth
 from .visualizations.provider.line.index import VisualizationLine
 from .welcome import Welcome
 from .wines.all import WinesAll
+from .wines.batch import WinesBatch
 from .wines.constraints import WinesConstraints
 from .wines.id import WinesId
@@ -1,13 +1,15 @@
 from flask_restful import Resource, reqparse
-from sqlalchemy.engine import Row
-from sqlalchemy.sql.expression import Select, or_, text
+from sqlalchemy import Column, func
+from sqlalchemy.sql.expression import ColumnElement, Select
 
 from src.common.core import db
 from src.common.query_argument import QueryArgument
+from src.common.search_index import SearchIndex, search_argument
 from src.common.sort_method import SortMethod
-from src.models import Region
+from src.models import Region, RegionTag, RegionTripType
 from src.schemas import regions_schema
-from src.util.general import PAGE_SIZE, JsonObject, determine_total_pages
+from src.util.general import JsonObject
+from src.util.pagination import paginate, paginate_ids, pagination_arguments
 
 sort_methods: dict[str, SortMethod] = {
     e.id: e
@@ -64,36 +66,37 @@ sort_methods: dict[str, SortMethod] = {
 }
 
 
+def has_all(id_column: Column, value_column: Column, values: list[str]) -> ColumnElement:
+    """
+    Matches regions that have every one of the values, looking them up in a normalized region value table.
+    """
+    unique_values = sorted(set(values))
+    matching_ids = (
+        db.select(id_column)
+        .where(value_column.in_(unique_values))
+        .group_by(id_column)
+        .having(func.count() == len(unique_values))
+    )
+    return Region.id.in_(matching_ids)
+
+
 def process_tags(query: Select, tags: list[str]) -> Select:
-    for tag in tags:
-        query = query.filter(text(f"'{tag}' MEMBER OF({Region.tags.key})"))
-    return query
+    return query.filter(has_all(RegionTag.region_id, RegionTag.tag, tags))
 
 
 def process_trip_types(query: Select, trip_types: list[str]) -> Select:
-    for trip_type in trip_types:
-        query = query.filter(text(f"'{trip_type}' MEMBER OF({Region.trip_types.key})"))
-    return query
+    return query.filter(has_all(RegionTripType.region_id, RegionTripType.trip_type, trip_types))
 
 
-def process_sort(query: Select, id: str) -> Select:
-    if id not in sort_methods:
-        return query
-    return query.order_by(sort_methods[id].clause)
+search_index = SearchIndex(Region, {"name": 2.0, "country": 1.0, "trip_types": 0.5})
 
 
 arguments: dict[str, QueryArgument] = {
     e.name: e
     for e in [
-        QueryArgument(
-            "page",
-            lambda query, value: query.limit(PAGE_SIZE).offset((value - 1) * PAGE_SIZE),
-            type=int,
-            location="values",
-        ),
         QueryArgument(
             "country",
-            lambda query, value: query.filter(or_(Region.country == e for e in value)),
+            lambda query, value: query.filter(Region.country.in_(value)),
             type=str,
             location="values",
             action="append",
@@ -136,57 +139,38 @@ arguments: dict[str, QueryArgument] = {
             location="values",
             action="append",
         ),
-        QueryArgument(
-            "sort",
-            process_sort,
-            type=str,
-            location="values",
-        ),
-        QueryArgument(
-            "search",
-            lambda query, value: query.filter(
-                or_(
-                    Region.name.contains(value),
-                    Region.country.contains(value),
-                    text(f"REGEXP_LIKE(`{Region.trip_types.key}`, '.*{value}.*', 'i')"),
-                )
-            ),
-            type=str,
-            location="values",
-        ),
     ]
 }
 
 parser = reqparse.RequestParser()
-for argument in arguments.values():
+for argument in [*arguments.values(), search_argument, *pagination_arguments]:
     argument.add_to_parser(parser)
 
 
 class RegionsAll(Resource):
     def get(self):
         args = parser.parse_args()
-        query: Select = db.select(Region, text("COUNT(*) OVER() as total_count"))
+        query: Select = db.select(Region)
 
-        for name in args:
+        for name in arguments:
             if args[name] is not None:
                 query = arguments[name].callback(query, args[name])
 
-        rows: list[Row] = db.session.execute(query).fetchall() if args["page"] is None or args["page"] >= 1 else []
-
-        region_list: list[JsonObject] = regions_schema.dump(e for e, _ in rows)
-        _, total_instances = rows[0] if len(rows) > 0 else (0, 0)
-
-        cur_page = 1
-        total_pages = 1
+        sort_method = sort_methods.get(args["sort"])
 
-        if args["page"] is not None:
-            cur_page = args["page"]
-            total_pages = determine_total_pages(total_instances, PAGE_SIZE)
+        if args["search"] is None:
+            page = paginate(query, Region.id, args, sort_method)
+        else:
+            ids = search_index.filter_ids(query, args["search"], sort_method)
+            page = paginate_ids(Region, ids, args, "relevance" if sort_method is None else sort_method.id)
+        region_list: list[JsonObject] = regions_schema.dump(page.instances)
 
         data = {
-            "page": cur_page,
-            "totalPages": total_pages,
-            "totalInstances": total_instances,
+            "page": page.number,
+            "totalPages": page.total_pages,
+            "totalInstances": page.total_instances,
+            "nextCursor": page.next_cursor,
+            "prevCursor": page.prev_cursor,
             "length": len(region_list),
             "list": region_list,
         }
@@ -0,0 +1,49 @@
+from flask_restful import Resource, reqparse
+
+from src.common.core import db
+from src.models import (
+    Region,
+    Vineyard,
+    VineyardRegionAssociation,
+    Wine,
+    WineRegionAssociation,
+)
+from src.schemas import regions_schema, vineyards_schema, wines_partial_schema
+from src.util.database import get_related_instances_batch
+from src.util.general import JsonObject, id_list
+
+parser = reqparse.RequestParser()
+parser.add_argument("ids", type=id_list, location="values", required=True)
+
+
+class RegionsBatch(Resource):
+    def get(self):
+        ids: list[int] = parser.parse_args()["ids"]
+
+        regions: list[Region] = db.session.execute(db.select(Region).where(Region.id.in_(ids))).scalars().all()
+        found_ids = [region.id for region in regions]
+
+        vineyards = get_related_instances_batch(
+            Vineyard,
+            VineyardRegionAssociation.vineyard_id,
+            VineyardRegionAssociation.region_id,
+            found_ids,
+            vineyards_schema,
+        )
+
+        wines = get_related_instances_batch(
+            Wine, WineRegionAssociation.wine_id, WineRegionAssociation.region_id, found_ids, wines_partial_schema
+        )
+
+        data: dict[int, JsonObject] = {}
+
+        for region, region_json in zip(regions, regions_schema.dump(regions)):
+            data[region.id] = {
+                **region_json,
+                "related": {
+                    "wines": wines[region.id],
+                    "vineyards": vineyards[region.id],
+                },
+            }
+
+        return {"data": data}
@@ -1,72 +1,44 @@
 from flask_restful import Resource
-from sqlalchemy.sql.expression import Select, text
+from sqlalchemy.sql.expression import Select
 
 from src.common.core import db
-from src.models import Region
+from src.common.snapshot import Snapshot
+from src.models import Region, RegionTag, RegionTripType
 from src.routes.regions.all import sort_methods
+from src.util.database import get_ranges
+from src.util.general import JsonObject
 
 
-class RegionsConstraints(Resource):
-    def get(self):
-        countries_query: Select = db.select(Region.country)
-        countries_query = countries_query.distinct().order_by(Region.country.asc())
-        countries: list[str] = db.session.execute(countries_query).scalars().all()
+def create_constraints() -> dict:
+    countries_query: Select = db.select(Region.country)
+    countries_query = countries_query.distinct().order_by(Region.country.asc())
+    countries: list[str] = db.session.execute(countries_query).scalars().all()
+
+    trip_types_query: Select = db.select(RegionTripType.trip_type)
+    trip_types_query = trip_types_query.distinct().order_by(RegionTripType.trip_type.asc())
+    trip_types: list[str] = db.session.execute(trip_types_query).scalars().all()
+
+    tags_query: Select = db.select(RegionTag.tag)
+    tags_query = tags_query.distinct().order_by(RegionTag.tag.asc())
+    tags: list[str] = db.session.execute(tags_query).scalars().all()
 
-        trip_type_val = "trip_type_val"
-        trip_types_query = text(
-            f"""
-            SELECT DISTINCT
-                {trip_type_val}
-            FROM
-                {Region.__tablename__},
-                JSON_TABLE(
-                    {Region.trip_types.key},
-                    '$[*]' COLUMNS(
-                        {trip_type_val} VARCHAR(100) PATH '$'
-                    )
-                ) as _temp
-            ORDER BY
-                {trip_type_val}
-                ASC
-        """
-        )
-        trip_types: list[str] = db.session.execute(trip_types_query).scalars().all()
+    sorts = [e.to_json() for e in sort_methods.values()]
+    sorts.sort(key=lambda e: e["id"])
 
-        tag_val = "tag_val"
-        tags_query = text(
-            f"""
-            SELECT DISTINCT
-                {tag_val}
-            FROM
-                {Region.__tablename__},
-                JSON_TABLE(
-                    {Region.tags.key},
-                    '$[*]' COLUMNS(
-                        {tag_val} VARCHAR(100) PATH '$'
-                    )
-                ) as _temp
-            ORDER BY
-                {tag_val}
-                ASC
-        """
-        )
-        tags: list[str] = db.session.execute(tags_query).scalars().all()
+    data: JsonObject = {
+        **get_ranges(Region.rating, Region.reviews),
+        "tripTypes": trip_types,
+        "tags": tags,
+        "countries": countries,
+        "sorts": sorts,
+    }
 
-        sorts = [e.to_json() for e in sort_methods.values()]
-        sorts.sort(key=lambda e: e["id"])
+    return data
 
-        data = {
-            "rating": {
-                "min": 0.0,
-                "max": 5.0,
-            },
-            "reviews": {
-                "min": 0,
-            },
-            "tripTypes": trip_types,
-            "tags": tags,
-            "countries": countries,
-            "sorts": sorts,
-        }
 
-        return data
+constraints = Snapshot(create_constraints)
+
+
+class RegionsConstraints(Resource):
+    def get(self):
+        return constraints.get()
@@ -1,33 +1,29 @@
+from typing import Optional
+
+from flask import abort
 from flask_restful import Resource
 
-from src.common.core import db
-from src.models import (
-    Region,
-    Vineyard,
-    VineyardRegionAssociation,
-    Wine,
-    WineRegionAssociation,
-)
+from src.models import Region, VineyardRegionAssociation, WineRegionAssociation
 from src.schemas import region_schema, vineyards_schema, wines_partial_schema
-from src.util.database import get_related_instances
+from src.util.database import dump_related, get_instance_with_related
 
 
 class RegionsId(Resource):
     def get(self, id: int):
-        region: Region = db.get_or_404(Region, id)
-
-        vineyards = get_related_instances(
-            Vineyard, VineyardRegionAssociation.vineyard_id, VineyardRegionAssociation.region_id == id, vineyards_schema
+        region: Optional[Region] = get_instance_with_related(
+            Region,
+            id,
+            (Region.vineyard_list, VineyardRegionAssociation.vineyard),
+            (Region.wine_list, WineRegionAssociation.wine),
         )
 
-        wines = get_related_instances(
-            Wine, WineRegionAssociation.wine_id, WineRegionAssociation.region_id == id, wines_partial_schema
-        )
+        if region is None:
+            abort(404)
 
         return {
             **region_schema.dump(region),
             "related": {
-                "wines": wines,
-                "vineyards": vineyards,
+                "wines": dump_related(region.wine_list, "wine", wines_partial_schema),
+                "vineyards": dump_related(region.vineyard_list, "vineyard", vineyards_schema),
             },
         }
@@ -0,0 +1,15 @@
+from flask_restful import Resource
+
+from src.common.response_cache import ResponseCache
+from src.util.database import statement_cache
+
+
+class Stats(Resource):
+    def __init__(self, response_cache: ResponseCache) -> None:
+        self.response_cache = response_cache
+
+    def get(self):
+        return {
+            "statementCache": statement_cache.stats(),
+            "responseCache": self.response_cache.stats(),
+        }
@@ -1,13 +1,14 @@
 from flask_restful import Resource, reqparse
-from sqlalchemy.engine import Row
-from sqlalchemy.sql.expression import Select, or_, text
+from sqlalchemy.sql.expression import Select
 
 from src.common.core import db
 from src.common.query_argument import QueryArgument
+from src.common.search_index import SearchIndex, search_argument
 from src.common.sort_method import SortMethod
 from src.models import Vineyard
 from src.schemas import vineyards_schema
-from src.util.general import PAGE_SIZE, JsonObject, determine_total_pages
+from src.util.general import JsonObject
+from src.util.pagination import paginate, paginate_ids, pagination_arguments
 
 sort_methods: dict[str, SortMethod] = {
     e.id: e
@@ -76,24 +77,15 @@ sort_methods: dict[str, SortMethod] = {
 }
 
 
-def process_sort(query: Select, id: str) -> Select:
-    if id not in sort_methods:
-        return query
-    return query.order_by(sort_methods[id].clause)
+search_index = SearchIndex(Vineyard, {"name": 2.0, "country": 1.0})
 
 
 arguments: dict[str, QueryArgument] = {
     e.name: e
     for e in [
-        QueryArgument(
-            "page",
-            lambda query, value: query.limit(PAGE_SIZE).offset((value - 1) * PAGE_SIZE),
-            type=int,
-            location="values",
-        ),
         QueryArgument(
             "country",
-            lambda query, value: query.filter(or_(Vineyard.country == e for e in value)),
+            lambda query, value: query.filter(Vineyard.country.in_(value)),
             type=str,
             location="values",
             action="append",
@@ -134,56 +126,38 @@ arguments: dict[str, QueryArgument] = {
             type=int,
             location="values",
         ),
-        QueryArgument(
-            "sort",
-            process_sort,
-            type=str,
-            location="values",
-        ),
-        QueryArgument(
-            "search",
-            lambda query, value: query.filter(
-                or_(
-                    Vineyard.name.contains(value),
-                    Vineyard.country.contains(value),
-                )
-            ),
-            type=str,
-            location="values",
-        ),
     ]
 }
 
 parser = reqparse.RequestParser()
-for argument in arguments.values():
+for argument in [*arguments.values(), search_argument, *pagination_arguments]:
     argument.add_to_parser(parser)
 
 
 class VineyardsAll(Resource):
     def get(self):
         args = parser.parse_args()
-        query: Select = db.select(Vineyard, text("COUNT(*) OVER() as total_count"))
+        query: Select = db.select(Vineyard)
 
-        for name in args:
+        for name in arguments:
             if args[name] is not None:
                 query = arguments[name].callback(query, args[name])
 
-        rows: list[Row] = db.session.execute(query).fetchall() if args["page"] is None or args["page"] >= 1 else []
-
-        vineyard_list: list[JsonObject] = vineyards_schema.dump(e for e, _ in rows)
-        _, total_instances = rows[0] if len(rows) > 0 else (0, 0)
-
-        cur_page = 1
-        total_pages = 1
+        sort_method = sort_methods.get(args["sort"])
 
-        if args["page"] is not None:
-            cur_page = args["page"]
-            total_pages = determine_total_pages(total_instances, PAGE_SIZE)
+        if args["search"] is None:
+            page = paginate(query, Vineyard.id, args, sort_method)
+        else:
+            ids = search_index.filter_ids(query, args["search"], sort_method)
+            page = paginate_ids(Vineyard, ids, args, "relevance" if sort_method is None else sort_method.id)
+        vineyard_list: list[JsonObject] = vineyards_schema.dump(page.instances)
 
         data = {
-            "page": cur_page,
-            "totalPages": total_pages,
-            "totalInstances": total_instances,
+            "page": page.number,
+            "totalPages": page.total_pages,
+            "totalInstances": page.total_instances,
+            "nextCursor": page.next_cursor,
+            "prevCursor": page.prev_cursor,
             "length": len(vineyard_list),
             "list": vineyard_list,
         }
@@ -0,0 +1,49 @@
+from flask_restful import Resource, reqparse
+
+from src.common.core import db
+from src.models import (
+    Region,
+    Vineyard,
+    VineyardRegionAssociation,
+    Wine,
+    WineVineyardAssociation,
+)
+from src.schemas import regions_schema, vineyards_schema, wines_partial_schema
+from src.util.database import get_related_instances_batch
+from src.util.general import JsonObject, id_list
+
+parser = reqparse.RequestParser()
+parser.add_argument("ids", type=id_list, location="values", required=True)
+
+
+class VineyardsBatch(Resource):
+    def get(self):
+        ids: list[int] = parser.parse_args()["ids"]
+
+        vineyards: list[Vineyard] = db.session.execute(db.select(Vineyard).where(Vineyard.id.in_(ids))).scalars().all()
+        found_ids = [vineyard.id for vineyard in vineyards]
+
+        regions = get_related_instances_batch(
+            Region,
+            VineyardRegionAssociation.region_id,
+            VineyardRegionAssociation.vineyard_id,
+            found_ids,
+            regions_schema,
+        )
+
+        wines = get_related_instances_batch(
+            Wine, WineVineyardAssociation.wine_id, WineVineyardAssociation.vineyard_id, found_ids, wines_partial_schema
+        )
+
+        data: dict[int, JsonObject] = {}
+
+        for vineyard, vineyard_json in zip(vineyards, vineyards_schema.dump(vineyards)):
+            data[vineyard.id] = {
+                **vineyard_json,
+                "related": {
+                    "wines": wines[vineyard.id],
+                    "regions": regions[vineyard.id],
+                },
+            }
+
+        return {"data": data}
@@ -2,33 +2,33 @@ from flask_restful import Resource
 from sqlalchemy.sql.expression import Select
 
 from src.common.core import db
+from src.common.snapshot import Snapshot
 from src.models import Vineyard
 from src.routes.vineyards.all import sort_methods
+from src.util.database import get_ranges
+from src.util.general import JsonObject
+
+
+def create_constraints() -> dict:
+    countries_query: Select = db.select(Vineyard.country)
+    countries_query = countries_query.distinct().order_by(Vineyard.country.asc())
+    countries: list[str] = db.session.execute(countries_query).scalars().all()
+
+    sorts = [e.to_json() for e in sort_methods.values()]
+    sorts.sort(key=lambda e: e["id"])
+
+    data: JsonObject = {
+        **get_ranges(Vineyard.rating, Vineyard.reviews, Vineyard.price),
+        "countries": countries,
+        "sorts": sorts,
+    }
+
+    return data
+
+
+constraints = Snapshot(create_constraints)
 
 
 class VineyardsConstraints(Resource):
     def get(self):
-        countries_query: Select = db.select(Vineyard.country)
-        countries_query = countries_query.distinct().order_by(Vineyard.country.asc())
-        countries: list[str] = db.session.execute(countries_query).scalars().all()
-
-        sorts = [e.to_json() for e in sort_methods.values()]
-        sorts.sort(key=lambda e: e["id"])
-
-        data = {
-            "rating": {
-                "min": 0.0,
-                "max": 5.0,
-            },
-            "reviews": {
-                "min": 0,
-            },
-            "price": {
-                "min": 0,
-                "max": 4,
-            },
-            "countries": countries,
-            "sorts": sorts,
-        }
-
-        return data
+        return constraints.get()
@@ -1,33 +1,29 @@
+from typing import Optional
+
+from flask import abort
 from flask_restful import Resource
 
-from src.common.core import db
-from src.models import (
-    Region,
-    Vineyard,
-    VineyardRegionAssociation,
-    Wine,
-    WineVineyardAssociation,
-)
+from src.models import Vineyard, VineyardRegionAssociation, WineVineyardAssociation
 from src.schemas import regions_schema, vineyard_schema, wines_partial_schema
-from src.util.database import get_related_instances
+from src.util.database import dump_related, get_instance_with_related
 
 
 class VineyardsId(Resource):
     def get(self, id: int):
-        vineyard: Vineyard = db.get_or_404(Vineyard, id)
-
-        regions = get_related_instances(
-            Region, VineyardRegionAssociation.region_id, VineyardRegionAssociation.vineyard_id == id, regions_schema
+        vineyard: Optional[Vineyard] = get_instance_with_related(
+            Vineyard,
+            id,
+            (Vineyard.region_list, VineyardRegionAssociation.region),
+            (Vineyard.wine_list, WineVineyardAssociation.wine),
         )
 
-        wines = get_related_instances(
-            Wine, WineVineyardAssociation.wine_id, WineVineyardAssociation.vineyard_id == id, wines_partial_schema
-        )
+        if vineyard is None:
+            abort(404)
 
         return {
             **vineyard_schema.dump(vineyard),
             "related": {
-                "wines": wines,
-                "regions": regions,
+                "wines": dump_related(vineyard.wine_list, "wine", wines_partial_schema),
+                "regions": dump_related(vineyard.region_list, "region", regions_schema),
             },
         }
@@ -1,14 +1,11 @@
 import re
 from typing import Any
 
-import requests
+from flask import Response
 from flask_restful import Resource
 
 from src.util.general import JsonObject, state_names
-
-
-def get_response() -> JsonObject:
-    return requests.get("https://api.parkscape.me/cities").json()
+from src.util.provider import provider_store
 
 
 def count_population(response: JsonObject) -> list[JsonObject]:
@@ -30,9 +27,13 @@ def create_response(cities: list[JsonObject]) -> JsonObject:
     return {"data": cities}
 
 
+def create_data(response: JsonObject) -> JsonObject:
+    cities = count_population(response)
+    data = create_response(cities)
+    return data
+
+
 class VisualizationBubble(Resource):
     def get(self):
-        response = get_response()
-        cities = count_population(response)
-        data = create_response(cities)
-        return data
+        # recomputed only when the provider's cities change
+        return Response(provider_store.render("cities", create_data), mimetype="application/json")
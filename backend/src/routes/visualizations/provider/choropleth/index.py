@@ -1,13 +1,10 @@
 from typing import Any
 
-import requests
+from flask import Response
 from flask_restful import Resource
 
 from src.util.general import JsonObject, state_names
-
-
-def get_response() -> JsonObject:
-    return requests.get("https://api.parkscape.me/airports").json()
+from src.util.provider import provider_store
 
 
 def count_airports(response: JsonObject) -> list[JsonObject]:
@@ -42,9 +39,13 @@ def create_response(states: list[JsonObject]) -> JsonObject:
     }
 
 
+def create_data(response: JsonObject) -> JsonObject:
+    states = count_airports(response)
+    data = create_response(states)
+    return data
+
+
 class VisualizationChoropleth(Resource):
     def get(self):
-        response = get_response()
-        states = count_airports(response)
-        data = create_response(states)
-        return data
+        # recomputed only when the provider's airports change
+        return Response(provider_store.render("airports", create_data), mimetype="application/json")
@@ -1,10 +1,14 @@
-from .identifier import identifiers
+from functools import lru_cache
+
+from .grammar import parse_availability
 from .types import Availability
 
+PARSE_CACHE_SIZE = 4096
 
-def parse(s: str) -> Availability:
-    for is_match, convert in identifiers:
-        if is_match(s):
-            return convert(s)
 
-    return (None, None)
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse(s: str) -> Availability:
+    """
+    Parses availability such as `9:00am to 5:00pm` to its opening and closing time, in minutes since midnight.
+    """
+    return parse_availability(s)
@@ -0,0 +1,72 @@
+import re
+from typing import Optional
+
+from .types import Availability, RuleConversionFunction
+
+time_12_hour_regex = re.compile(r"(\d+):(\d+)([ap]m)", re.IGNORECASE)
+
+time_constants = {
+    "sunrise": 7 * 60,
+    "sunset": 19 * 60,
+}
+
+
+def parse_time(s: str) -> Optional[int]:
+    """
+    Converts a time such as `sunrise` or `9:30pm` to minutes since midnight.
+    """
+    constant = time_constants.get(s.lower())
+    if constant is not None:
+        return constant
+
+    res = time_12_hour_regex.fullmatch(s)
+    if res is None:
+        return None
+
+    hour = int(res[1]) % 12
+    minute = int(res[2])
+
+    if minute >= 60:
+        return None
+
+    if res[3].lower() == "pm":
+        hour += 12
+
+    return hour * 60 + minute
+
+
+# each rule is a named alternative of one combined pattern; its converter receives the rule's named groups
+rules: list[tuple[str, str, RuleConversionFunction]] = [
+    (
+        "all_day",
+        r"all day",
+        lambda groups: (0, None),
+    ),
+    (
+        "closed",
+        r"closed",
+        lambda groups: (None, 0),
+    ),
+    (
+        "range",
+        r"(?P<range_opening>\S+)\s+(?:to|-)\s+(?P<range_closing>\S+)",
+        lambda groups: (parse_time(groups["range_opening"]), parse_time(groups["range_closing"])),
+    ),
+    (
+        "opening",
+        r"opens\s+at\s+(?P<opening_time>\S+)",
+        lambda groups: (parse_time(groups["opening_time"]), None),
+    ),
+]
+
+grammar = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in rules), re.IGNORECASE)
+conversions = {name: convert for name, _, convert in rules}
+
+
+def parse_availability(s: str) -> Availability:
+    res = grammar.fullmatch(s)
+
+    if res is None or res.lastgroup is None:
+        return (None, None)
+
+    return conversions[res.lastgroup](res.groupdict())
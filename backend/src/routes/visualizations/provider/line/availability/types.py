@@ -1,7 +1,5 @@
 from typing import Callable, Optional
 
-import pendulum
-
-Availability = tuple[Optional[pendulum.Time], Optional[pendulum.Time]]
-TimeMatchFunction = Callable[[str], bool]
-TimeConversionFunction = Callable[[str], Availability]
+# opening and closing time, in minutes since midnight
+Availability = tuple[Optional[int], Optional[int]]
+RuleConversionFunction = Callable[[dict[str, str]], Availability]
@@ -0,0 +1,89 @@
+from itertools import chain
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from src.util.general import JsonObject
+
+from .availability import parse
+
+MINUTES_PER_DAY = 24 * 60
+WEEKDAYS = 7
+NO_TIME = -1
+
+IntArray = npt.NDArray[np.int64]
+
+
+def to_minutes(minutes: Optional[int]) -> int:
+    return NO_TIME if minutes is None else minutes
+
+
+def parse_availability(data: list[JsonObject]) -> tuple[IntArray, IntArray, IntArray]:
+    """
+    Parses the availability of every park and weekday into parallel arrays of weekday index, opening minute and
+    closing minute, where `NO_TIME` stands for a missing time. Each distinct string is only parsed once.
+    """
+    lengths = np.fromiter((len(park["weekdays"]) for park in data), dtype=np.int64, count=len(data))
+    strings = list(chain.from_iterable(park["weekdays"] for park in data))
+
+    # position of each string within the weekdays of its park
+    starts = np.cumsum(lengths) - lengths
+    weekdays = np.arange(len(strings), dtype=np.int64) - np.repeat(starts, lengths)
+
+    codes: dict[str, int] = {}
+    table: list[tuple[int, int]] = []
+
+    for s in dict.fromkeys(strings):
+        opening, closing = parse(s)
+        codes[s] = len(table)
+        table.append((to_minutes(opening), to_minutes(closing)))
+
+    indices = np.fromiter((codes[s] for s in strings), dtype=np.int64, count=len(strings))
+    times = np.array(table, dtype=np.int64).reshape(-1, 2)[indices]
+
+    return weekdays, times[:, 0], times[:, 1]
+
+
+def count_availability(
+    weekdays: IntArray, openings: IntArray, closings: IntArray, resolution: int, series: int
+) -> IntArray:
+    """
+    Counts how many parks are open in each `resolution` minute bucket of the day. Returns one row per weekday when
+    `series` is `WEEKDAYS`, or a single row over every weekday when it is 1.
+    """
+    buckets = -(-MINUTES_PER_DAY // resolution)
+    rows = weekdays if series > 1 else np.zeros_like(weekdays)
+
+    opened = (openings != NO_TIME) & (rows < series)
+    closed = opened & (closings != NO_TIME)
+
+    # difference array over the flattened (series, bucket) grid, its prefix sum is the number of open parks
+    size = series * buckets
+    count = np.bincount(rows[opened] * buckets + openings[opened] // resolution, minlength=size)
+    count -= np.bincount(rows[closed] * buckets + closings[closed] // resolution, minlength=size)
+
+    return np.cumsum(count.reshape(series, buckets), axis=1)
+
+
+def get_points(counts: IntArray) -> tuple[IntArray, IntArray]:
+    """
+    Reduces a series to the buckets on both sides of every change, plus its first and last bucket.
+    """
+    data = np.maximum(counts, 0)
+    changes = np.flatnonzero(data[1:] != data[:-1]) + 1
+
+    if len(changes) == 0:
+        return np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+
+    indices = np.empty(2 * len(changes), dtype=np.int64)
+    indices[0::2] = changes - 1
+    indices[1::2] = changes
+
+    if indices[0] != 0:
+        indices = np.insert(indices, 0, 0)
+
+    if indices[-1] != len(data) - 1:
+        indices = np.append(indices, len(data) - 1)
+
+    return indices, data[indices]
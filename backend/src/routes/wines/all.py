@@ -1,13 +1,14 @@
 from flask_restful import Resource, reqparse
-from sqlalchemy.engine import Row
-from sqlalchemy.sql.expression import Select, or_, text
+from sqlalchemy.sql.expression import Select
 
 from src.common.core import db
 from src.common.query_argument import QueryArgument
+from src.common.search_index import SearchIndex, search_argument
 from src.common.sort_method import SortMethod
 from src.models import Wine
 from src.schemas import wines_partial_schema
-from src.util.general import PAGE_SIZE, JsonObject, determine_total_pages
+from src.util.general import JsonObject
+from src.util.pagination import paginate, paginate_ids, pagination_arguments
 
 sort_methods: dict[str, SortMethod] = {
     e.id: e
@@ -88,38 +89,29 @@ sort_methods: dict[str, SortMethod] = {
 }
 
 
-def process_sort(query: Select, id: str) -> Select:
-    if id not in sort_methods:
-        return query
-    return query.order_by(sort_methods[id].clause)
+search_index = SearchIndex(Wine, {"name": 2.0, "winery": 1.5, "region": 1.0, "country": 1.0, "type": 1.0})
 
 
 arguments: dict[str, QueryArgument] = {
     e.name: e
     for e in [
-        QueryArgument(
-            "page",
-            lambda query, value: query.limit(PAGE_SIZE).offset((value - 1) * PAGE_SIZE),
-            type=int,
-            location="values",
-        ),
         QueryArgument(
             "country",
-            lambda query, value: query.filter(or_(Wine.country == e for e in value)),
+            lambda query, value: query.filter(Wine.country.in_(value)),
             type=str,
             location="values",
             action="append",
         ),
         QueryArgument(
             "winery",
-            lambda query, value: query.filter(or_(Wine.winery == e for e in value)),
+            lambda query, value: query.filter(Wine.winery.in_(value)),
             type=str,
             location="values",
             action="append",
         ),
         QueryArgument(
             "type",
-            lambda query, value: query.filter(or_(Wine.type == e for e in value)),
+            lambda query, value: query.filter(Wine.type.in_(value)),
             type=str,
             location="values",
             action="append",
@@ -148,60 +140,39 @@ arguments: dict[str, QueryArgument] = {
             type=int,
             location="values",
         ),
-        QueryArgument(
-            "sort",
-            process_sort,
-            type=str,
-            location="values",
-        ),
-        QueryArgument(
-            "search",
-            lambda query, value: query.filter(
-                or_(
-                    Wine.name.contains(value),
-                    Wine.country.contains(value),
-                    Wine.region.contains(value),
-                    Wine.winery.contains(value),
-                    Wine.type.contains(value),
-                )
-            ),
-            type=str,
-            location="values",
-        ),
     ]
 }
 
 
 parser = reqparse.RequestParser()
-for argument in arguments.values():
+for argument in [*arguments.values(), search_argument, *pagination_arguments]:
     argument.add_to_parser(parser)
 
 
 class WinesAll(Resource):
     def get(self):
         args = parser.parse_args()
-        query: Select = db.select(Wine, text("COUNT(*) OVER() as total_count"))
+        query: Select = db.select(Wine)
 
-        for name in args:
+        for name in arguments:
             if args[name] is not None:
                 query = arguments[name].callback(query, args[name])
 
-        rows: list[Row] = db.session.execute(query).fetchall() if args["page"] is None or args["page"] >= 1 else []
-
-        wine_list: list[JsonObject] = wines_partial_schema.dump(e for e, _ in rows)
-        _, total_instances = rows[0] if len(rows) > 0 else (0, 0)
-
-        cur_page = 1
-        total_pages = 1
+        sort_method = sort_methods.get(args["sort"])
 
-        if args["page"] is not None:
-            cur_page = args["page"]
-            total_pages = determine_total_pages(total_instances, PAGE_SIZE)
+        if args["search"] is None:
+            page = paginate(query, Wine.id, args, sort_method)
+        else:
+            ids = search_index.filter_ids(query, args["search"], sort_method)
+            page = paginate_ids(Wine, ids, args, "relevance" if sort_method is None else sort_method.id)
+        wine_list: list[JsonObject] = wines_partial_schema.dump(page.instances)
 
         data = {
-            "page": cur_page,
-            "totalPages": total_pages,
-            "totalInstances": total_instances,
+            "page": page.number,
+            "totalPages": page.total_pages,
+            "totalInstances": page.total_instances,
+            "nextCursor": page.next_cursor,
+            "prevCursor": page.prev_cursor,
             "length": len(wine_list),
             "list": wine_list,
         }
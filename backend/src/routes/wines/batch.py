@@ -0,0 +1,45 @@
+from flask_restful import Resource, reqparse
+
+from src.common.core import db
+from src.models import (
+    Region,
+    Vineyard,
+    Wine,
+    WineRegionAssociation,
+    WineVineyardAssociation,
+)
+from src.schemas import regions_schema, serialize_wine, vineyards_schema
+from src.util.database import WINES_REDDIT_QUERY, get_related_instances_batch
+from src.util.general import JsonObject, id_list
+
+parser = reqparse.RequestParser()
+parser.add_argument("ids", type=id_list, location="values", required=True)
+
+
+class WinesBatch(Resource):
+    def get(self):
+        ids: list[int] = parser.parse_args()["ids"]
+
+        wine_rows = db.session.execute(WINES_REDDIT_QUERY.where(Wine.id.in_(ids))).fetchall()
+        found_ids = [wine.id for wine, _ in wine_rows]
+
+        vineyards = get_related_instances_batch(
+            Vineyard, WineVineyardAssociation.vineyard_id, WineVineyardAssociation.wine_id, found_ids, vineyards_schema
+        )
+
+        regions = get_related_instances_batch(
+            Region, WineRegionAssociation.region_id, WineRegionAssociation.wine_id, found_ids, regions_schema
+        )
+
+        data: dict[int, JsonObject] = {}
+
+        for wine, reddit_post in wine_rows:
+            data[wine.id] = {
+                **serialize_wine(wine, reddit_post),
+                "related": {
+                    "vineyards": vineyards[wine.id],
+                    "regions": regions[wine.id],
+                },
+            }
+
+        return {"data": data}
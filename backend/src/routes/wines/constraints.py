@@ -2,39 +2,43 @@ from flask_restful import Resource
 from sqlalchemy.sql.expression import Select
 
 from src.common.core import db
+from src.common.snapshot import Snapshot
 from src.models import Wine
 from src.routes.wines.all import sort_methods
+from src.util.database import get_ranges
+from src.util.general import JsonObject
+
+
+def create_constraints() -> dict:
+    countries_query: Select = db.select(Wine.country)
+    countries_query = countries_query.distinct().order_by(Wine.country.asc())
+    countries: list[str] = db.session.execute(countries_query).scalars().all()
+
+    wineries_query: Select = db.select(Wine.winery)
+    wineries_query = wineries_query.distinct().order_by(Wine.winery.asc())
+    wineries: list[str] = db.session.execute(wineries_query).scalars().all()
+
+    types_query: Select = db.select(Wine.type)
+    types_query = types_query.distinct().order_by(Wine.type.asc())
+    types: list[str] = db.session.execute(types_query).scalars().all()
+
+    sorts = [e.to_json() for e in sort_methods.values()]
+    sorts.sort(key=lambda e: e["id"])
+
+    data: JsonObject = {
+        **get_ranges(Wine.rating, Wine.reviews),
+        "types": types,
+        "wineries": wineries,
+        "countries": countries,
+        "sorts": sorts,
+    }
+
+    return data
+
+
+constraints = Snapshot(create_constraints)
 
 
 class WinesConstraints(Resource):
     def get(self):
-        countries_query: Select = db.select(Wine.country)
-        countries_query = countries_query.distinct().order_by(Wine.country.asc())
-        countries: list[str] = db.session.execute(countries_query).scalars().all()
-
-        wineries_query: Select = db.select(Wine.winery)
-        wineries_query = wineries_query.distinct().order_by(Wine.winery.asc())
-        wineries: list[str] = db.session.execute(wineries_query).scalars().all()
-
-        types_query: Select = db.select(Wine.type)
-        types_query = types_query.distinct().order_by(Wine.type.asc())
-        types: list[str] = db.session.execute(types_query).scalars().all()
-
-        sorts = [e.to_json() for e in sort_methods.values()]
-        sorts.sort(key=lambda e: e["id"])
-
-        data = {
-            "rating": {
-                "min": 0.0,
-                "max": 5.0,
-            },
-            "reviews": {
-                "min": 0,
-            },
-            "types": types,
-            "wineries": wineries,
-            "countries": countries,
-            "sorts": sorts,
-        }
-
-        return data
+        return constraints.get()
@@ -1,38 +1,30 @@
+from typing import Optional
+
 from flask import abort
 from flask_restful import Resource
 
-from src.common.core import db
-from src.models import (
-    Region,
-    Vineyard,
-    Wine,
-    WineRegionAssociation,
-    WineVineyardAssociation,
-)
-from src.schemas import WineSchema, regions_schema, vineyards_schema
-from src.util.database import WINES_REDDIT_QUERY, get_related_instances
+from src.models import Wine, WineRegionAssociation, WineVineyardAssociation
+from src.schemas import regions_schema, serialize_wine, vineyards_schema
+from src.util.database import dump_related, get_instance_with_related
 
 
 class WinesId(Resource):
     def get(self, id: int):
-        wine_query = WINES_REDDIT_QUERY.where(Wine.id == id)
-        wine_row = db.session.execute(wine_query).fetchone()
-
-        if wine_row is None:
-            abort(404)
-
-        vineyards = get_related_instances(
-            Vineyard, WineVineyardAssociation.vineyard_id, WineVineyardAssociation.wine_id == id, vineyards_schema
+        wine: Optional[Wine] = get_instance_with_related(
+            Wine,
+            id,
+            Wine.reddit_post,
+            (Wine.vineyard_list, WineVineyardAssociation.vineyard),
+            (Wine.region_list, WineRegionAssociation.region),
         )
 
-        regions = get_related_instances(
-            Region, WineRegionAssociation.region_id, WineRegionAssociation.wine_id == id, regions_schema
-        )
+        if wine is None or wine.reddit_post is None:
+            abort(404)
 
         return {
-            **WineSchema(context={"reddit_post": wine_row[1]}).dump(wine_row[0]),
+            **serialize_wine(wine, wine.reddit_post),
             "related": {
-                "vineyards": vineyards,
-                "regions": regions,
+                "vineyards": dump_related(wine.vineyard_list, "vineyard", vineyards_schema),
+                "regions": dump_related(wine.region_list, "region", regions_schema),
             },
         }
@@ -1,3 +1,14 @@
-from .region import RegionSchema, region_schema, regions_schema
-from .vineyard import VineyardSchema, vineyard_schema, vineyards_schema
-from .wine import WineSchema, wine_partial_schema, wines_partial_schema
+from .region import RegionSchema, region_schema, regions_schema, serialize_region
+from .vineyard import (
+    VineyardSchema,
+    serialize_vineyard,
+    vineyard_schema,
+    vineyards_schema,
+)
+from .wine import (
+    WineSchema,
+    serialize_wine,
+    serialize_wine_partial,
+    wine_partial_schema,
+    wines_partial_schema,
+)
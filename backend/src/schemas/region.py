@@ -1,7 +1,11 @@
+from typing import Any
+
 from flask_marshmallow.fields import fields
 
 from src.common.core import ma
+from src.common.serializer import Serializer
 from src.models import Region
+from src.util.general import JsonObject
 
 
 class RegionSchema(ma.SQLAlchemySchema):
@@ -41,5 +45,23 @@ class RegionSchema(ma.SQLAlchemySchema):
         }
 
 
-region_schema = RegionSchema()
-regions_schema = RegionSchema(many=True)
+def serialize_region(values: dict[str, Any]) -> JsonObject:
+    """
+    The output of `RegionSchema` for the column values of a region, which the routes use in its place.
+    """
+    return {
+        "id": values["id"],
+        "name": values["name"],
+        "country": values["country"],
+        "reviews": values["reviews"],
+        "tags": values["tags"],
+        "url": values["url"],
+        "tripTypes": values["trip_types"],
+        "rating": float(values["rating"]),
+        "coordinates": {"longitude": float(values["longitude"]), "latitude": float(values["latitude"])},
+        "image": {"url": values["image"], "width": values["image_width"], "height": values["image_height"]},
+    }
+
+
+region_schema = Serializer(serialize_region)
+regions_schema = Serializer(serialize_region, many=True)
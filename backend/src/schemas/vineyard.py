@@ -1,7 +1,11 @@
+from typing import Any
+
 from flask_marshmallow.fields import fields
 
 from src.common.core import ma
+from src.common.serializer import Serializer
 from src.models import Vineyard
+from src.util.general import JsonObject
 
 
 class VineyardSchema(ma.SQLAlchemySchema):
@@ -30,5 +34,22 @@ class VineyardSchema(ma.SQLAlchemySchema):
         }
 
 
-vineyard_schema = VineyardSchema()
-vineyards_schema = VineyardSchema(many=True)
+def serialize_vineyard(values: dict[str, Any]) -> JsonObject:
+    """
+    The output of `VineyardSchema` for the column values of a vineyard, which the routes use in its place.
+    """
+    return {
+        "id": values["id"],
+        "name": values["name"],
+        "price": values["price"],
+        "reviews": values["reviews"],
+        "image": values["image"],
+        "country": values["country"],
+        "url": values["url"],
+        "rating": float(values["rating"]),
+        "coordinates": {"longitude": float(values["longitude"]), "latitude": float(values["latitude"])},
+    }
+
+
+vineyard_schema = Serializer(serialize_vineyard)
+vineyards_schema = Serializer(serialize_vineyard, many=True)
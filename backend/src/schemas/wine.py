@@ -1,10 +1,12 @@
 import re
-from typing import Optional
+from typing import Any, Optional
 
 from flask_marshmallow.fields import fields
 
 from src.common.core import ma
+from src.common.serializer import Serializer
 from src.models import RedditPost, Wine
+from src.util.general import JsonObject
 
 REDDIT_POSTS = 20
 REDDIT_MEDIA_URL = "https://www.redditmedia.com"
@@ -39,17 +41,44 @@ class WineSchema(ma.SQLAlchemySchema):
     def get_reddit_posts(self, obj: Wine):
         if "reddit_post" not in self.context:
             return []
+        return get_reddit_posts(self.context["reddit_post"])
 
-        reddit_post: RedditPost = self.context["reddit_post"]
-        ret: list[str] = []
 
-        for url in reddit_post.urls[0:REDDIT_POSTS]:
-            stub = get_reddit_stub(url)
-            if stub is not None:
-                ret.append(f"{REDDIT_MEDIA_URL}{stub}")
+def get_reddit_posts(reddit_post: RedditPost) -> list[str]:
+    ret: list[str] = []
 
-        return ret
+    for url in reddit_post.urls[0:REDDIT_POSTS]:
+        stub = get_reddit_stub(url)
+        if stub is not None:
+            ret.append(f"{REDDIT_MEDIA_URL}{stub}")
 
+    return ret
 
-wine_partial_schema = WineSchema(exclude=["redditPosts"])
-wines_partial_schema = WineSchema(exclude=["redditPosts"], many=True)
+
+def serialize_wine_partial(values: dict[str, Any]) -> JsonObject:
+    """
+    The output of `WineSchema(exclude=["redditPosts"])` for the column values of a wine, which the routes use in its
+    place.
+    """
+    return {
+        "id": values["id"],
+        "name": values["name"],
+        "winery": values["winery"],
+        "image": values["image"],
+        "reviews": values["reviews"],
+        "country": values["country"],
+        "region": values["region"],
+        "type": values["type"],
+        "rating": float(values["rating"]),
+    }
+
+
+wine_partial_schema = Serializer(serialize_wine_partial)
+wines_partial_schema = Serializer(serialize_wine_partial, many=True)
+
+
+def serialize_wine(obj: Wine, reddit_post: RedditPost) -> JsonObject:
+    """
+    The output of `WineSchema(context={"reddit_post": reddit_post})`.
+    """
+    return {**wine_partial_schema.dump(obj), "redditPosts": get_reddit_posts(reddit_post)}
@@ -0,0 +1,105 @@
+from sqlalchemy import Column, ForeignKey, Index, MetaData, Table, inspect
+from sqlalchemy.engine import Connection
+
+from src.common.core import db
+from src.models import DataVersion
+
+from .bulk_load import BULK_CHUNK_SIZE, Rows, bulk_insert
+
+SHADOW_SUFFIX = "_shadow"
+OLD_SUFFIX = "_old"
+
+
+def catalog_tables() -> list[Table]:
+    """
+    Every table that is replaced by a reload, in foreign key order. The data version history is kept.
+    """
+    return [table for table in db.metadata.sorted_tables if table.name != DataVersion.__tablename__]
+
+
+def create_shadow_table(table: Table, metadata: MetaData) -> Table:
+    columns: list[Column] = []
+
+    for column in table.columns:
+        foreign_keys = [
+            ForeignKey(f"{e.column.table.name}{SHADOW_SUFFIX}.{e.column.name}") for e in column.foreign_keys
+        ]
+        columns.append(
+            Column(
+                column.name,
+                column.type,
+                *foreign_keys,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+                autoincrement=column.autoincrement,
+            )
+        )
+
+    shadow = Table(f"{table.name}{SHADOW_SUFFIX}", metadata, *columns)
+
+    for index in table.indexes:
+        Index(f"{index.name}{SHADOW_SUFFIX}", *[shadow.c[e.name] for e in index.columns], unique=index.unique)
+
+    return shadow
+
+
+def drop_tables(connection: Connection, names: list[str]) -> None:
+    quote = connection.dialect.identifier_preparer.quote
+    for name in names:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {quote(name)}")
+
+
+def swap_tables(connection: Connection, tables: list[Table], shadows: list[Table]) -> None:
+    """
+    Replaces each table with its shadow in a single step: one `RENAME TABLE` statement on MySQL, one transaction
+    elsewhere. The replaced tables are dropped afterwards.
+    """
+    quote = connection.dialect.identifier_preparer.quote
+    existing = set(inspect(connection).get_table_names())
+
+    renames: list[tuple[str, str]] = []
+    for table, shadow in zip(tables, shadows):
+        if table.name in existing:
+            renames.append((table.name, f"{table.name}{OLD_SUFFIX}"))
+        renames.append((shadow.name, table.name))
+
+    if connection.dialect.name == "mysql":
+        connection.exec_driver_sql("RENAME TABLE " + ", ".join(f"{quote(a)} TO {quote(b)}" for a, b in renames))
+    else:
+        for a, b in renames:
+            connection.exec_driver_sql(f"ALTER TABLE {quote(a)} RENAME TO {quote(b)}")
+
+    drop_tables(connection, [f"{e.name}{OLD_SUFFIX}" for e in reversed(tables)])
+
+    # give the indexes of the swapped tables their usual names
+    for table, shadow in zip(tables, shadows):
+        for index, shadow_index in zip(sorted(table.indexes, key=index_key), sorted(shadow.indexes, key=index_key)):
+            if connection.dialect.name == "mysql":
+                connection.exec_driver_sql(
+                    f"ALTER TABLE {quote(table.name)} RENAME INDEX {quote(shadow_index.name)} TO {quote(index.name)}"
+                )
+            else:
+                shadow_index.drop(connection)
+                index.create(connection)
+
+
+def index_key(index: Index) -> str:
+    return str(index.name).removesuffix(SHADOW_SUFFIX)
+
+
+def reload_tables(connection: Connection, rows: Rows, chunk_size: int = BULK_CHUNK_SIZE) -> None:
+    """
+    Replaces the content of every catalog table without downtime. Rows are loaded and indexed in shadow tables while
+    the live tables keep serving, then the shadow tables are swapped in.
+    """
+    tables = catalog_tables()
+    shadow_metadata = MetaData()
+    shadows = [create_shadow_table(e, shadow_metadata) for e in tables]
+
+    drop_tables(connection, [e.name for e in reversed(shadows)] + [f"{e.name}{OLD_SUFFIX}" for e in reversed(tables)])
+    shadow_metadata.create_all(connection)
+
+    shadow_of = dict(zip(tables, shadows))
+    bulk_insert(connection, {shadow_of[table]: table_rows for table, table_rows in rows.items()}, chunk_size)
+
+    swap_tables(connection, tables, shadows)
@@ -0,0 +1,164 @@
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import Index, Integer, Table, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.interfaces import MANYTOONE, ONETOMANY
+from sqlalchemy.schema import sort_tables
+
+from src.common.core import db
+
+BULK_CHUNK_SIZE = 1000
+
+Rows = dict[Table, list[dict[str, Any]]]
+
+
+class TablePlan:
+    """
+    How the instances of one mapper translate to rows, resolved once per mapper.
+    """
+
+    def __init__(self, mapper: Mapper) -> None:
+        self.table: Table = mapper.local_table
+        self.columns = [(e.key, mapper.get_property_by_column(e).key) for e in self.table.columns]
+
+        pk = mapper.primary_key
+        generated = len(pk) == 1 and isinstance(pk[0].type, Integer) and len(pk[0].foreign_keys) == 0
+        self.id_column: Optional[str] = pk[0].key if generated else None
+
+        # (attribute, is collection, [(column of this table, column of the related table)])
+        self.parents: list[tuple[str, bool, list[tuple[str, str]]]] = []
+        self.children: list[tuple[str, bool, list[tuple[str, str]]]] = []
+        self.relationships: list[tuple[str, bool]] = []
+
+        for relationship in mapper.relationships:
+            pairs = [(local.key, remote.key) for local, remote in relationship.local_remote_pairs]
+            entry = (relationship.key, relationship.uselist, pairs)
+            self.relationships.append((relationship.key, relationship.uselist))
+
+            if relationship.direction is MANYTOONE:
+                self.parents.append(entry)
+            elif relationship.direction is ONETOMANY:
+                self.children.append(entry)
+
+
+def related(instance: Any, attribute: str, uselist: bool) -> list[Any]:
+    # only what was set on the new instance, new instances never lazy load
+    value = instance.__dict__.get(attribute)
+    if value is None:
+        return []
+    return list(value) if uselist else [value]
+
+
+def collect_instances(lists: list[list]) -> list[Any]:
+    """
+    Finds every instance reachable through the relationships of the given instances, listed instances first.
+    """
+    plans: dict[Mapper, TablePlan] = {}
+    seen: set[int] = set()
+    ret: list[Any] = []
+    queue = deque(chain.from_iterable(lists))
+
+    while len(queue) > 0:
+        instance = queue.popleft()
+        if id(instance) in seen:
+            continue
+
+        seen.add(id(instance))
+        ret.append(instance)
+
+        mapper = inspect(instance).mapper
+        plan = plans.get(mapper) or plans.setdefault(mapper, TablePlan(mapper))
+        for attribute, uselist in plan.relationships:
+            queue.extend(related(instance, attribute, uselist))
+
+    return ret
+
+
+def collect_rows(lists: list[list]) -> Rows:
+    """
+    Converts a graph of new ORM instances to the rows of each table, without a session.
+
+    Integer ids are assigned up front, per table in the order instances are listed, and copied into the foreign key
+    columns of related rows, so that every table can be inserted independently.
+    """
+    instances = collect_instances(lists)
+    plans: dict[type, TablePlan] = {}
+    next_ids: dict[Table, int] = defaultdict(lambda: 1)
+    rows_by_instance: dict[int, dict[str, Any]] = {}
+
+    for instance in instances:
+        cls = type(instance)
+        plan = plans.get(cls) or plans.setdefault(cls, TablePlan(inspect(cls)))
+        state = instance.__dict__
+        row = {column: state.get(attribute) for column, attribute in plan.columns}
+
+        if plan.id_column is not None:
+            row[plan.id_column] = next_ids[plan.table]
+            next_ids[plan.table] += 1
+
+        rows_by_instance[id(instance)] = row
+
+    for instance in instances:
+        plan = plans[type(instance)]
+        row = rows_by_instance[id(instance)]
+
+        for attribute, uselist, pairs in plan.parents:
+            for parent in related(instance, attribute, uselist):
+                parent_row = rows_by_instance[id(parent)]
+                for local, remote in pairs:
+                    row[local] = parent_row[remote]
+
+        for attribute, uselist, pairs in plan.children:
+            for child in related(instance, attribute, uselist):
+                child_row = rows_by_instance[id(child)]
+                for local, remote in pairs:
+                    child_row[remote] = row[local]
+
+    rows: Rows = defaultdict(list)
+    for instance in instances:
+        rows[plans[type(instance)].table].append(rows_by_instance[id(instance)])
+
+    return rows
+
+
+@contextmanager
+def deferred_constraints(connection: Connection, tables: list[Table]) -> Iterator[None]:
+    """
+    Drops the secondary indexes of the tables and turns off foreign key checks while rows are loaded, then rebuilds
+    the indexes once.
+    """
+    indexes: list[Index] = [index for table in tables for index in table.indexes]
+
+    if connection.dialect.name == "mysql":
+        connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 0")
+        connection.exec_driver_sql("SET UNIQUE_CHECKS = 0")
+
+    for index in indexes:
+        index.drop(connection)
+
+    try:
+        yield
+    finally:
+        if connection.dialect.name == "mysql":
+            connection.exec_driver_sql("SET UNIQUE_CHECKS = 1")
+            connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 1")
+
+        for index in indexes:
+            index.create(connection)
+
+
+def bulk_insert(connection: Connection, rows: Rows, chunk_size: int = BULK_CHUNK_SIZE) -> None:
+    """
+    Inserts rows into empty tables with one executemany per chunk, in foreign key order.
+    """
+    tables = sort_tables(rows.keys())
+
+    with deferred_constraints(connection, tables):
+        for table in tables:
+            table_rows = rows[table]
+            for i in range(0, len(table_rows), chunk_size):
+                connection.execute(table.insert(), table_rows[i : i + chunk_size])
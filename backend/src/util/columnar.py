@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import JSON, Integer, Numeric, String, Table
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.schema import sort_tables
+
+from .bulk_load import BULK_CHUNK_SIZE, Rows, deferred_constraints
+
+COLUMNAR_FORMAT = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def get_source_digest(paths: list[Path]) -> str:
+    digest = hashlib.sha256()
+
+    for path in paths:
+        digest.update(f"{path.name}\n".encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+
+    return digest.hexdigest()
+
+
+def get_kind(table: Table, column: str) -> str:
+    """
+    How the values of a column are stored: int64, float64, or UTF-8 text with offsets. JSON values are stored as the
+    text the JSON type binds, so that they are not encoded again on load.
+    """
+    column_type = table.c[column].type
+    if isinstance(column_type, JSON):
+        return "json"
+    if isinstance(column_type, Integer):
+        return "int"
+    if isinstance(column_type, Numeric):
+        return "float"
+    if isinstance(column_type, String):
+        return "str"
+    raise ValueError(f"cannot store {table.name}.{column} of type {column_type} in columns")
+
+
+def encode_column(kind: str, values: list[Any]) -> dict[str, npt.NDArray]:
+    """
+    Converts the values of a column to its buffers: `values`, `offsets` for text and `valid` if any value is None.
+    """
+    ret: dict[str, npt.NDArray] = {}
+
+    if kind == "json":
+        values = [json.dumps(e) for e in values]
+    elif any(e is None for e in values):
+        ret["valid"] = np.array([e is not None for e in values], dtype=np.bool_)
+
+    if kind == "int":
+        ret["values"] = np.array([0 if e is None else e for e in values], dtype=np.int64)
+    elif kind == "float":
+        ret["values"] = np.array([np.nan if e is None else e for e in values], dtype=np.float64)
+    else:
+        strings = ["" if e is None else e for e in values]
+        # offsets count characters, the text of a column is decoded once
+        lengths = np.fromiter((len(e) for e in strings), dtype=np.int64, count=len(strings))
+        ret["offsets"] = np.concatenate([np.zeros(1, dtype=np.int64), np.cumsum(lengths)])
+        ret["values"] = np.frombuffer("".join(strings).encode(), dtype=np.uint8)
+
+    return ret
+
+
+def write_columns(path: Path, rows: Rows, source_digest: str) -> None:
+    """
+    Writes the rows of each table as one `.npy` file per column buffer, described by a manifest, replacing the
+    directory at `path` once everything is written.
+    """
+    temp_path = path.with_name(path.name + ".tmp")
+    shutil.rmtree(temp_path, ignore_errors=True)
+    temp_path.mkdir(parents=True)
+
+    manifest: dict[str, Any] = {"format": COLUMNAR_FORMAT, "sources": source_digest, "tables": {}}
+
+    for table, table_rows in rows.items():
+        kinds = {e.key: get_kind(table, e.key) for e in table.columns}
+        manifest["tables"][table.name] = {"rows": len(table_rows), "columns": kinds}
+
+        for column, kind in kinds.items():
+            buffers = encode_column(kind, [row[column] for row in table_rows])
+            for name, array in buffers.items():
+                np.save(temp_path / f"{table.name}.{column}.{name}.npy", array)
+
+    (temp_path / MANIFEST_NAME).write_text(json.dumps(manifest, indent=4), encoding="utf-8")
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(temp_path, path)
+
+
+def read_manifest(path: Path) -> Optional[dict[str, Any]]:
+    manifest_path = path / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def check_columns(path: Path, source_digest: str, tables: list[Table], dialect: Dialect) -> Optional[str]:
+    """
+    Why the export at `path` cannot be loaded in place of the sources it was written from, or None if it can.
+    """
+    manifest = read_manifest(path)
+    if manifest is None:
+        return f"no export at {path}"
+    if manifest["format"] != COLUMNAR_FORMAT:
+        return f"format {manifest['format']} is not {COLUMNAR_FORMAT}"
+    if manifest["sources"] != source_digest:
+        return "the data files changed since the export"
+    if not dialect.positional:
+        return f"{dialect.name} takes named parameters"
+
+    for table in tables:
+        stored = manifest["tables"].get(table.name)
+        if stored is None or list(stored["columns"]) != [e.key for e in table.columns]:
+            return f"the columns of {table.name} changed since the export"
+
+    return None
+
+
+class ColumnReader:
+    """
+    The memory-mapped buffers of one column, decoded to Python values a range of rows at a time.
+    """
+
+    def __init__(self, path: Path, table: str, column: str, kind: str) -> None:
+        def load(name: str) -> Optional[npt.NDArray]:
+            buffer_path = path / f"{table}.{column}.{name}.npy"
+            return np.load(buffer_path, mmap_mode="r") if buffer_path.exists() else None
+
+        self.kind = kind
+        self.values = load("values")
+        self.offsets = load("offsets")
+        self.valid = load("valid")
+        self.text: Optional[str] = None
+
+    def read(self, start: int, stop: int) -> list[Any]:
+        assert self.values is not None
+
+        if self.offsets is None:
+            ret = self.values[start:stop].tolist()
+        else:
+            if self.text is None:
+                self.text = self.values.tobytes().decode()
+            offsets = self.offsets[start : stop + 1].tolist()
+            ret = [self.text[a:b] for a, b in zip(offsets, offsets[1:])]
+
+        if self.valid is not None:
+            for i in np.flatnonzero(~self.valid[start:stop]).tolist():
+                ret[i] = None
+
+        return ret
+
+
+def load_columns(connection: Connection, path: Path, tables: list[Table], chunk_size: int = BULK_CHUNK_SIZE) -> None:
+    """
+    Inserts the exported rows into empty tables, see `bulk_insert`. Each chunk is one executemany of positional
+    parameters zipped from the columns, which skips the per row dicts and type conversions of an ORM insert.
+    """
+    manifest = read_manifest(path)
+    assert manifest is not None
+    tables = sort_tables(tables)
+
+    with deferred_constraints(connection, tables):
+        for table in tables:
+            stored = manifest["tables"][table.name]
+            keys = list(stored["columns"])
+            compiled = table.insert().compile(dialect=connection.dialect, column_keys=keys)
+
+            readers = {key: ColumnReader(path, table.name, key, stored["columns"][key]) for key in keys}
+            ordered = [readers[e] for e in compiled.positiontup]
+
+            for start in range(0, stored["rows"], chunk_size):
+                stop = min(start + chunk_size, stored["rows"])
+                params = list(zip(*[e.read(start, stop) for e in ordered]))
+                connection.exec_driver_sql(str(compiled), params)
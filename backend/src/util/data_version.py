@@ -0,0 +1,73 @@
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Callable, Optional
+
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from src.common.core import db
+from src.models import DataVersion
+
+DATA_VERSION_TTL = 5  # seconds
+
+logger = logging.getLogger(__name__)
+
+listeners: list[Callable[[], None]] = []
+lock = Lock()
+cached: Optional[tuple[Optional[str], Optional[datetime]]] = None
+checked_at = 0.0
+
+
+def on_data_version_change(callback: Callable[[], None]) -> Callable[[], None]:
+    """
+    Registers a callback that runs whenever the API notices that the catalog was reloaded.
+    """
+    listeners.append(callback)
+    return callback
+
+
+def get_data_version() -> tuple[Optional[str], Optional[datetime]]:
+    """
+    Returns the version stamp of the catalog and when it was loaded. The stamp is read from the database at most once
+    every `DATA_VERSION_TTL` seconds. A database without the `data_version` table has no stamp, and nothing derived
+    from the catalog should be cached then, since its reloads cannot be noticed.
+    """
+    global cached, checked_at
+
+    with lock:
+        if cached is not None and time.monotonic() - checked_at < DATA_VERSION_TTL:
+            return cached
+
+        current: tuple[Optional[str], Optional[datetime]]
+
+        try:
+            query = db.select(DataVersion).order_by(DataVersion.id.desc()).limit(1)
+            row: Optional[DataVersion] = db.session.execute(query).scalar_one_or_none()
+            current = ("0", None) if row is None else (row.version, row.updated_at.replace(tzinfo=timezone.utc))
+        except (OperationalError, ProgrammingError):
+            db.session.rollback()
+            current = (None, None)
+            if cached is None or cached[0] is not None:
+                logger.warning("could not read the data version, responses are not cached", exc_info=True)
+
+        changed = cached is not None and cached[0] != current[0]
+        cached = current
+        checked_at = time.monotonic()
+
+    if changed:
+        for callback in listeners:
+            callback()
+
+    return current
+
+
+def bump_data_version() -> str:
+    """
+    Stamps the catalog with a new version. Called whenever the catalog is (re)loaded.
+    """
+    version = uuid.uuid4().hex
+    db.session.add(DataVersion(version=version, updated_at=datetime.now(timezone.utc).replace(tzinfo=None)))
+    db.session.commit()
+    return version
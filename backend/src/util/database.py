@@ -1,23 +1,99 @@
-from typing import TypeVar
+from decimal import Decimal
+from typing import Any, Optional, TypeVar
 
-from sqlalchemy.engine import Row
+from sqlalchemy import Column, bindparam, func
+from sqlalchemy.engine import Result, Row
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql.expression import Select
 
 from src.common.core import db
+from src.common.statement_cache import StatementCache
 from src.models import RedditPost, Wine
 
 from .general import JsonObject
 
 T = TypeVar("T")
 
+STATEMENT_CACHE_SIZE = 500
+
+# compiled list queries, keyed by their filter shape
+statement_cache = StatementCache(STATEMENT_CACHE_SIZE)
+
 WINES_REDDIT_QUERY: Select = db.select(Wine, RedditPost).join_from(
     Wine, RedditPost, Wine.reddit_post_id == RedditPost.id
 )
 
 
-def get_related_instances(model, atable_id, atable_where_clause, schema) -> list[JsonObject]:
-    filter: Select = model.id.in_(db.select(atable_id).where(atable_where_clause))
-    query: Select = db.select(model).filter(filter)
+def get_instance_with_related(model, id: int, *relations) -> Optional[Any]:
+    """
+    Loads an instance together with its related instances. Each relation is either a relationship attribute or a
+    chain of them, e.g. `(Wine.region_list, WineRegionAssociation.region)`.
+
+    Many-to-one relationships are joined into the query of the instance. Each collection is loaded by one more query
+    that joins the rest of its chain, since joining two collections into one query returns every combination of their
+    rows.
+    """
+    options = []
+
+    for relation in relations:
+        chain = relation if isinstance(relation, tuple) else (relation,)
+        option = selectinload(chain[0]) if chain[0].property.uselist else joinedload(chain[0])
+        for attribute in chain[1:]:
+            option = option.joinedload(attribute)
+        options.append(option)
+
+    query: Select = db.select(model).options(*options).where(model.id == id)
+    return db.session.execute(query).unique().scalar_one_or_none()
+
+
+def dump_related(associations: list, attribute: str, schema) -> list[JsonObject]:
+    instances = sorted((getattr(e, attribute) for e in associations), key=lambda e: e.id)
+    return schema.dump(instances)
+
+
+def get_related_instances_batch(model, atable_id, atable_owner_id, owner_ids, schema) -> dict[int, list[JsonObject]]:
+    """
+    Finds the instances related to each of several owners with a single query.
+    """
+    query: Select = (
+        db.select(atable_owner_id, model)
+        .join_from(model, atable_id.class_, model.id == atable_id)
+        .where(atable_owner_id.in_(owner_ids))
+        .order_by(model.id)
+    )
     rows: list[Row] = db.session.execute(query).fetchall()
-    instances: list[JsonObject] = schema.dump(e[0] for e in rows)
-    return instances
+    instances: list[JsonObject] = schema.dump(e[1] for e in rows)
+
+    ret: dict[int, list[JsonObject]] = {id: [] for id in owner_ids}
+    for row, instance in zip(rows, instances):
+        ret[row[0]].append(instance)
+
+    return ret
+
+
+def get_ranges(*columns: Column) -> dict[str, JsonObject]:
+    """
+    Finds the smallest and largest value of each column with a single query, keyed by column name.
+    """
+    query: Select = db.select(*[f(e) for e in columns for f in (func.min, func.max)])
+    row: Row = db.session.execute(query).one()
+
+    values = [float(e) if isinstance(e, Decimal) else e for e in row]
+    return {e.key: {"min": values[2 * i], "max": values[2 * i + 1]} for i, e in enumerate(columns)}
+
+
+def get_instances(model, ids: list[int]) -> list:
+    """
+    Loads the instances with the given ids, in the order of the ids. The ids are bound as one expanding parameter, so
+    the statement is the same however many there are.
+    """
+    if len(ids) == 0:
+        return []
+
+    query: Select = db.select(model).where(model.id.in_(bindparam("ids", expanding=True)))
+    instances = {e.id: e for e in execute_cached(query, {"ids": ids}).scalars()}
+    return [instances[id] for id in ids if id in instances]
+
+
+def execute_cached(query: Select, params: Optional[dict[str, Any]] = None) -> Result:
+    return db.session.execute(query, params, execution_options={"compiled_cache": statement_cache})
@@ -5,6 +5,7 @@ T = TypeVar("T")
 JsonObject = dict[str, Any]
 
 PAGE_SIZE = 20
+BATCH_SIZE = 100
 
 
 def determine_total_pages(elements: int, page_size: int) -> int:
@@ -13,6 +14,15 @@ def determine_total_pages(elements: int, page_size: int) -> int:
     return math.ceil(elements / page_size)
 
 
+def id_list(s: str) -> list[int]:
+    ids = list(dict.fromkeys(int(e) for e in s.split(",") if len(e.strip()) > 0))
+
+    if len(ids) > BATCH_SIZE:
+        raise ValueError(f"at most {BATCH_SIZE} ids can be requested at once")
+
+    return ids
+
+
 state_names = [
     "Alabama",
     "Alaska",
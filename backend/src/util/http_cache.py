@@ -0,0 +1,69 @@
+import hashlib
+from typing import Optional
+from urllib.parse import urlencode
+
+from flask import Response, request
+
+from .data_version import get_data_version
+
+CACHED_PATH_PREFIXES = ("/wines", "/regions", "/vineyards")
+CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"
+
+
+def is_cacheable() -> bool:
+    return request.method in ("GET", "HEAD") and request.path.startswith(CACHED_PATH_PREFIXES)
+
+
+def normalized_query() -> str:
+    return urlencode(sorted(request.args.items(multi=True)))
+
+
+def compute_etag(version: str) -> str:
+    key = f"{version}:{request.path}?{normalized_query()}"
+    return hashlib.sha256(key.encode()).hexdigest()[0:32]
+
+
+def add_headers(response: Response, etag: str) -> Response:
+    _, updated_at = get_data_version()
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if updated_at is not None:
+        response.last_modified = updated_at
+
+    return response
+
+
+def before_request() -> Optional[Response]:
+    """
+    Answers conditional GETs for catalog endpoints with 304 when the catalog did not change, without running the
+    request.
+    """
+    if not is_cacheable():
+        return None
+
+    version, updated_at = get_data_version()
+    if version is None:
+        return None
+
+    etag = compute_etag(version)
+
+    not_modified = False
+
+    if request.if_none_match:
+        not_modified = etag in request.if_none_match
+    elif request.if_modified_since is not None and updated_at is not None:
+        not_modified = updated_at.replace(microsecond=0) <= request.if_modified_since
+
+    if not_modified:
+        return add_headers(Response(status=304), etag)
+
+    return None
+
+
+def after_request(response: Response) -> Response:
+    if is_cacheable() and response.status_code == 200:
+        version, _ = get_data_version()
+        if version is not None:
+            add_headers(response, compute_etag(version))
+    return response
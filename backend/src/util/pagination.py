@@ -0,0 +1,255 @@
+from typing import Any, Hashable, Optional
+
+from flask import abort
+from flask_restful import inputs
+from sqlalchemy import Column, func
+from sqlalchemy.sql.expression import ColumnElement, Select
+
+from src.common.core import db
+from src.common.cursor import Cursor
+from src.common.simple_argument import SimpleArgument
+from src.common.sort_method import SortMethod
+from src.common.ttl_cache import TTLCache
+
+from .data_version import on_data_version_change
+from .database import execute_cached, get_instances
+from .general import PAGE_SIZE, determine_total_pages
+
+COUNT_CACHE_SIZE = 1024
+COUNT_CACHE_TTL = 60  # seconds
+
+count_cache = TTLCache(COUNT_CACHE_SIZE, COUNT_CACHE_TTL)
+on_data_version_change(count_cache.clear)
+
+pagination_arguments: list[SimpleArgument] = [
+    SimpleArgument(
+        "sort",
+        type=str,
+        location="values",
+    ),
+    SimpleArgument(
+        "page",
+        type=int,
+        location="values",
+    ),
+    SimpleArgument(
+        "cursor",
+        type=Cursor.decode,
+        location="values",
+    ),
+    SimpleArgument(
+        "count",
+        type=inputs.boolean,
+        location="values",
+        default=True,
+    ),
+]
+
+# arguments that change which page is shown, but not which instances are in the list
+NON_FILTER_ARGUMENTS = {e.name for e in pagination_arguments}
+
+
+class Page:
+    def __init__(
+        self,
+        instances: list,
+        number: int,
+        total_pages: Optional[int],
+        total_instances: Optional[int],
+        next_cursor: Optional[Cursor] = None,
+        prev_cursor: Optional[Cursor] = None,
+    ) -> None:
+        self.instances = instances
+        self.number = number
+        self.total_pages = total_pages
+        self.total_instances = total_instances
+        self.next_cursor = None if next_cursor is None else next_cursor.encode()
+        self.prev_cursor = None if prev_cursor is None else prev_cursor.encode()
+
+
+def order_by(id_column: Column, sort_method: Optional[SortMethod], reverse: bool = False) -> list[ColumnElement]:
+    if sort_method is not None:
+        return sort_method.order_by(id_column, reverse)
+    return [id_column.desc() if reverse else id_column.asc()]
+
+
+def seek(id_column: Column, sort_method: Optional[SortMethod], cursor: Cursor) -> ColumnElement:
+    if sort_method is not None:
+        return sort_method.seek(id_column, sort_method.to_value(cursor.value), cursor.id, cursor.reverse)
+    return id_column < cursor.id if cursor.reverse else id_column > cursor.id
+
+
+def filter_key(id_column: Column, args: dict[str, Any]) -> Hashable:
+    filters: list[tuple[str, Hashable]] = []
+
+    for name, value in args.items():
+        if name in NON_FILTER_ARGUMENTS or value is None:
+            continue
+        filters.append((name, tuple(sorted(value)) if isinstance(value, list) else value))
+
+    return (id_column.table.name, tuple(sorted(filters)))
+
+
+def count_instances(query: Select, id_column: Column, args: dict[str, Any]) -> int:
+    """
+    Counts every instance matching the filters of a query, ignoring its ordering and paging. Counts are memoized per
+    filter set, so paging through the same list only counts once.
+    """
+
+    def count() -> int:
+        count_query = db.select(func.count()).select_from(query.order_by(None).limit(None).offset(None).subquery())
+        return execute_cached(count_query).scalar_one()
+
+    return count_cache.get_or_set(filter_key(id_column, args), count)
+
+
+def create_cursor(instance: Any, sort_method: Optional[SortMethod], page: int, reverse: bool = False) -> Cursor:
+    if sort_method is None:
+        return Cursor(None, None, instance.id, page, reverse)
+    return Cursor(sort_method.id, sort_method.value_of(instance), instance.id, page, reverse)
+
+
+def paginate(query: Select, id_column: Column, args: dict[str, Any], sort_method: Optional[SortMethod]) -> Page:
+    """
+    Executes a filtered query either as a whole, by page number (offset), or by cursor (keyset).
+    """
+    cursor: Optional[Cursor] = args["cursor"]
+    page: Optional[int] = args["page"]
+
+    if cursor is not None:
+        return paginate_cursor(query, id_column, args, cursor, sort_method)
+
+    if page is None:
+        if sort_method is not None:
+            query = query.order_by(None).order_by(*order_by(id_column, sort_method))
+        instances = execute_cached(query).scalars().all()
+        return Page(instances, 1, 1, len(instances))
+
+    if page < 1:
+        return Page([], page, 1, 0)
+
+    page_query = query.order_by(None).order_by(*order_by(id_column, sort_method))
+    page_query = page_query.limit(PAGE_SIZE + 1).offset((page - 1) * PAGE_SIZE)
+
+    instances = execute_cached(page_query).scalars().all()
+    has_more = len(instances) > PAGE_SIZE
+    instances = instances[0:PAGE_SIZE]
+
+    if len(instances) == 0:
+        return Page([], page, 1, 0)
+
+    total_instances: Optional[int] = None
+    total_pages: Optional[int] = None
+
+    if args["count"]:
+        total_instances = count_instances(query, id_column, args)
+        total_pages = determine_total_pages(total_instances, PAGE_SIZE)
+
+    next_cursor = create_cursor(instances[-1], sort_method, page + 1) if has_more else None
+    prev_cursor = create_cursor(instances[0], sort_method, page - 1, reverse=True) if page > 1 else None
+
+    return Page(instances, page, total_pages, total_instances, next_cursor, prev_cursor)
+
+
+def paginate_cursor(
+    query: Select, id_column: Column, args: dict[str, Any], cursor: Cursor, sort_method: Optional[SortMethod]
+) -> Page:
+    sort_id = None if sort_method is None else sort_method.id
+    if cursor.sort != sort_id:
+        abort(400, "cursor does not match the requested sort")
+
+    # the value of a cursor comes from the client, and may not fit the sort column
+    try:
+        seek_clause = seek(id_column, sort_method, cursor)
+    except (ValueError, TypeError, ArithmeticError):
+        abort(400, "invalid cursor")
+
+    page_query = query.filter(seek_clause)
+    page_query = page_query.order_by(None).order_by(*order_by(id_column, sort_method, cursor.reverse))
+    page_query = page_query.limit(PAGE_SIZE + 1)
+
+    instances = execute_cached(page_query).scalars().all()
+    has_more = len(instances) > PAGE_SIZE
+    instances = instances[0:PAGE_SIZE]
+
+    if cursor.reverse:
+        instances.reverse()
+
+    total_instances: Optional[int] = None
+    total_pages: Optional[int] = None
+
+    if args["count"]:
+        total_instances = count_instances(query, id_column, args)
+        total_pages = determine_total_pages(total_instances, PAGE_SIZE)
+
+    next_cursor = None
+    prev_cursor = None
+
+    if len(instances) > 0:
+        if has_more or cursor.reverse:
+            next_cursor = create_cursor(instances[-1], sort_method, cursor.page + 1)
+        if has_more or not cursor.reverse:
+            prev_cursor = create_cursor(instances[0], sort_method, cursor.page - 1, reverse=True)
+
+    return Page(
+        instances,
+        cursor.page,
+        total_pages,
+        total_instances,
+        next_cursor,
+        prev_cursor,
+    )
+
+
+def paginate_ids(model, ids: list[int], args: dict[str, Any], sort_id: Optional[str]) -> Page:
+    """
+    Pages through the ids of a list that was already filtered and ordered, and only loads the instances on the page.
+    The cursors of such a list remember the position of their row as their value, which is used when the row has left
+    the list since.
+    """
+    cursor: Optional[Cursor] = args["cursor"]
+    page: Optional[int] = args["page"]
+
+    total_instances: Optional[int] = len(ids) if args["count"] else None
+    total_pages: Optional[int] = determine_total_pages(len(ids), PAGE_SIZE) if args["count"] else None
+
+    if cursor is not None:
+        if cursor.sort != sort_id:
+            abort(400, "cursor does not match the requested sort")
+        if not isinstance(cursor.value, int):
+            abort(400, "invalid cursor")
+
+        try:
+            position = ids.index(cursor.id)
+        except ValueError:
+            position = cursor.value
+
+        start = max(position - PAGE_SIZE, 0) if cursor.reverse else position + 1
+        end = position if cursor.reverse else position + 1 + PAGE_SIZE
+        number = cursor.page
+    elif page is None:
+        instances = get_instances(model, ids)
+        return Page(instances, 1, 1, len(instances))
+    elif page < 1:
+        return Page([], page, 1, 0)
+    else:
+        start = (page - 1) * PAGE_SIZE
+        end = start + PAGE_SIZE
+        number = page
+
+        if start >= len(ids):
+            return Page([], page, 1, 0)
+
+    page_ids = ids[max(start, 0) : max(end, 0)]
+    instances = get_instances(model, page_ids)
+
+    next_cursor = None
+    prev_cursor = None
+
+    if len(page_ids) > 0:
+        if end < len(ids):
+            next_cursor = Cursor(sort_id, end - 1, page_ids[-1], number + 1)
+        if start > 0:
+            prev_cursor = Cursor(sort_id, start, page_ids[0], number - 1, reverse=True)
+
+    return Page(instances, number, total_pages, total_instances, next_cursor, prev_cursor)
@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+from src.common.provider_store import ProviderStore, create_source
+
+PROVIDER_API_URL = "https://api.parkscape.me"
+PROVIDER_TIMEOUT = 10  # seconds
+PROVIDER_MAX_AGE = 60 * 60  # seconds
+PROVIDER_REFRESH_INTERVAL = 60 * 60  # seconds
+
+# PROVIDER_SOURCE is either the url of the provider's API or a directory of <resource>.json files
+provider_store = ProviderStore(
+    create_source(os.environ.get("PROVIDER_SOURCE") or PROVIDER_API_URL, PROVIDER_TIMEOUT),
+    Path(os.environ.get("PROVIDER_CACHE_DIR") or Path(__file__).parents[2] / "data" / "provider"),
+    PROVIDER_MAX_AGE,
+    PROVIDER_REFRESH_INTERVAL,
+)
@@ -0,0 +1,239 @@
+import hashlib
+import json
+from collections import Counter
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Column, Numeric, Table, and_, bindparam, select
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.schema import sort_tables
+
+from .bulk_load import BULK_CHUNK_SIZE, Rows
+
+NaturalKeys = dict[Table, tuple[str, ...]]
+
+
+class TableDiff:
+    """
+    Rows of one table that an upsert inserts, updates and deletes. Inserted and updated rows carry the ids they have
+    in the database, deleted rows are the stored rows.
+    """
+
+    def __init__(self, table: Table) -> None:
+        self.table = table
+        self.inserted: list[dict[str, Any]] = []
+        self.updated: list[dict[str, Any]] = []
+        self.deleted: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.inserted) + len(self.updated) + len(self.deleted)
+
+
+def get_id_column(table: Table, natural_keys: NaturalKeys) -> Optional[str]:
+    """
+    The generated id of a table that has a natural key. Other tables, e.g. associations, are identified by their
+    whole content.
+    """
+    if table not in natural_keys:
+        return None
+    return next(iter(table.primary_key.columns)).key
+
+
+def get_referred_table(column: Column) -> Optional[Table]:
+    return next((e.column.table for e in column.foreign_keys), None)
+
+
+def normalize(column: Column, value: Any, dialect: Optional[Dialect] = None) -> Any:
+    """
+    Returns a value that compares equal for a row read from the database and the row it was loaded from. Values that
+    are not read from the database are first converted the way `dialect` stores them, e.g. SQLite keeps numbers as
+    floats and rounds them to the scale of the column when they are read.
+    """
+    if value is None:
+        return None
+    if isinstance(column.type, Numeric) and column.type.scale is not None:
+        if dialect is not None:
+            bind = column.type.bind_processor(dialect)
+            result = column.type.result_processor(dialect, None)
+            value = bind(value) if bind is not None else value
+            value = result(value) if result is not None else value
+
+        scale = Decimal(1).scaleb(-column.type.scale)
+        return str(Decimal(str(value)).quantize(scale, rounding=ROUND_HALF_UP))
+    if isinstance(column.type, JSON):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def get_keys_by_id(rows: Rows, natural_keys: NaturalKeys, source: str) -> dict[Table, dict[Any, tuple]]:
+    """
+    The natural key of each row by its id. Raises a `ValueError` when two rows of a table share a natural key, since
+    they could not be told apart.
+    """
+    ret: dict[Table, dict[Any, tuple]] = {}
+
+    for table, key_columns in natural_keys.items():
+        id_column = next(iter(table.primary_key.columns)).key
+        ret[table] = {row[id_column]: tuple(row[e] for e in key_columns) for row in rows.get(table, [])}
+
+        duplicates = [key for key, count in Counter(ret[table].values()).items() if count > 1]
+        if len(duplicates) > 0:
+            raise ValueError(f"{source} rows of {table.name} share natural keys: {duplicates}")
+
+    return ret
+
+
+def get_content(
+    table: Table,
+    row: dict[str, Any],
+    id_column: Optional[str],
+    keys_by_id: dict,
+    dialect: Optional[Dialect] = None,
+) -> tuple:
+    """
+    The columns of a row with foreign keys replaced by the natural keys of the rows they refer to, so that the content
+    of a row does not depend on the ids it was given.
+    """
+    ret: list[Any] = []
+
+    for column in table.columns:
+        if column.key == id_column:
+            continue
+
+        value = row[column.key]
+        referred_table = get_referred_table(column)
+        if referred_table is not None and referred_table in keys_by_id:
+            ret.append(keys_by_id[referred_table].get(value))
+        else:
+            ret.append(normalize(column, value, dialect))
+
+    return tuple(ret)
+
+
+def get_identity(
+    table: Table,
+    row: dict[str, Any],
+    id_column: Optional[str],
+    keys_by_id: dict,
+    dialect: Optional[Dialect] = None,
+) -> tuple:
+    if id_column is None:
+        return get_content(table, row, None, keys_by_id, dialect)
+    return keys_by_id[table][row[id_column]]
+
+
+def get_content_hash(content: tuple) -> str:
+    return hashlib.sha256(json.dumps(content, default=str).encode()).hexdigest()
+
+
+def read_rows(connection: Connection, tables: list[Table]) -> Rows:
+    return {table: [dict(e._mapping) for e in connection.execute(select(table))] for table in tables}
+
+
+def diff_rows(stored: Rows, new: Rows, natural_keys: NaturalKeys, dialect: Dialect) -> list[TableDiff]:
+    """
+    Compares the rows of a new load, with ids from `collect_rows`, to the rows stored in a database of `dialect`.
+
+    Rows of tables with a natural key are matched by that key and updated when the content hash of the rest of their
+    columns differs. They keep their stored id, and new rows get ids after the largest stored one. Rows of other
+    tables are matched by their whole content, so they are only ever inserted or deleted. Natural keys have to be
+    unique on both sides.
+    """
+    tables = sort_tables(sorted(set(stored) | set(new), key=lambda e: e.name))
+    stored_keys = get_keys_by_id(stored, natural_keys, "stored")
+    new_keys = get_keys_by_id(new, natural_keys, "new")
+
+    # ids of the new rows in the database
+    ids: dict[Table, dict[Any, Any]] = {}
+    for table in tables:
+        id_column = get_id_column(table, natural_keys)
+        if id_column is None:
+            continue
+
+        stored_ids = {key: id for id, key in stored_keys[table].items()}
+        next_id = max(stored_ids.values(), default=0) + 1
+        ids[table] = {}
+
+        for row in new.get(table, []):
+            key = new_keys[table][row[id_column]]
+            if key not in stored_ids:
+                stored_ids[key] = next_id
+                next_id += 1
+            ids[table][row[id_column]] = stored_ids[key]
+
+    ret: list[TableDiff] = []
+
+    for table in tables:
+        id_column = get_id_column(table, natural_keys)
+        diff = TableDiff(table)
+
+        stored_by_identity = {get_identity(table, row, id_column, stored_keys): row for row in stored.get(table, [])}
+
+        for row in new.get(table, []):
+            stored_row = stored_by_identity.pop(get_identity(table, row, id_column, new_keys, dialect), None)
+
+            translated = dict(row)
+            for column in table.columns:
+                referred_table = table if column.key == id_column else get_referred_table(column)
+                if referred_table in ids and row[column.key] is not None:
+                    translated[column.key] = ids[referred_table][row[column.key]]
+
+            if stored_row is None:
+                diff.inserted.append(translated)
+            elif id_column is not None:
+                new_hash = get_content_hash(get_content(table, row, id_column, new_keys, dialect))
+                stored_hash = get_content_hash(get_content(table, stored_row, id_column, stored_keys))
+                if new_hash != stored_hash:
+                    diff.updated.append(translated)
+
+        diff.deleted = list(stored_by_identity.values())
+        ret.append(diff)
+
+    return ret
+
+
+def execute_chunks(connection: Connection, statement: Any, rows: list[dict[str, Any]], chunk_size: int) -> None:
+    for i in range(0, len(rows), chunk_size):
+        connection.execute(statement, rows[i : i + chunk_size])
+
+
+def delete_rows(connection: Connection, table: Table, rows: list[dict[str, Any]], chunk_size: int) -> None:
+    columns = list(table.primary_key.columns)
+    statement = table.delete().where(and_(*[e == bindparam(f"b_{e.key}") for e in columns]))
+    params = [{f"b_{e.key}": row[e.key] for e in columns} for row in rows]
+    execute_chunks(connection, statement, params, chunk_size)
+
+
+def update_rows(connection: Connection, table: Table, id_column: str, rows: list[dict[str, Any]], chunk_size: int):
+    statement = table.update().where(table.c[id_column] == bindparam(f"b_{id_column}"))
+    params = [{f"b_{id_column}": row[id_column], **{k: v for k, v in row.items() if k != id_column}} for row in rows]
+    execute_chunks(connection, statement, params, chunk_size)
+
+
+def apply_diff(
+    connection: Connection,
+    diffs: list[TableDiff],
+    natural_keys: NaturalKeys,
+    chunk_size: int = BULK_CHUNK_SIZE,
+) -> None:
+    """
+    Applies the diffs of `diff_rows`, listed in foreign key order, such that no foreign key ever refers to a missing
+    row: removed associations go first, then new and changed rows, then removed rows and at last new associations.
+    """
+    for diff in reversed(diffs):
+        if get_id_column(diff.table, natural_keys) is None:
+            delete_rows(connection, diff.table, diff.deleted, chunk_size)
+
+    for diff in diffs:
+        id_column = get_id_column(diff.table, natural_keys)
+        if id_column is not None:
+            execute_chunks(connection, diff.table.insert(), diff.inserted, chunk_size)
+            update_rows(connection, diff.table, id_column, diff.updated, chunk_size)
+
+    for diff in reversed(diffs):
+        if get_id_column(diff.table, natural_keys) is not None:
+            delete_rows(connection, diff.table, diff.deleted, chunk_size)
+
+    for diff in diffs:
+        if get_id_column(diff.table, natural_keys) is None:
+            execute_chunks(connection, diff.table.insert(), diff.inserted, chunk_size)
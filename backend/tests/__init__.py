@@ -1,4 +1,10 @@
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
+
+# serve the provider visualizations from local fixtures instead of the provider's API
+os.environ.setdefault("PROVIDER_SOURCE", str(Path(__file__).parent / "fixtures" / "provider"))
+os.environ.setdefault("PROVIDER_CACHE_DIR", tempfile.mkdtemp())
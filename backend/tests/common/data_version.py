@@ -0,0 +1,17 @@
+import math
+from contextlib import contextmanager
+from typing import Iterator
+from unittest import mock
+
+from src.util import data_version
+
+
+@contextmanager
+def frozen_data_version() -> Iterator[None]:
+    """
+    Reads the data version once and keeps it while the context is active, so that a re-check of the version does not
+    add to the queries counted within it.
+    """
+    data_version.get_data_version()
+    with mock.patch.object(data_version, "DATA_VERSION_TTL", math.inf):
+        yield
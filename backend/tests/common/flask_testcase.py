@@ -1,6 +1,6 @@
 import unittest
 
-from src.app import app
+from src.app import app, response_cache
 
 app.testing = True
 
@@ -10,6 +10,7 @@ class FlaskTestCase(unittest.TestCase):
         self.ctx = app.app_context()
         self.ctx.push()
         self.client = app.test_client()
+        response_cache.backend.clear()
 
     def tearDown(self) -> None:
         self.ctx.pop()
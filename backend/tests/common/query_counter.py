@@ -0,0 +1,23 @@
+from sqlalchemy import event
+
+from src.common.core import db
+
+
+class QueryCounter:
+    """
+    Counts the SQL statements sent to the database while the context is active.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def callback(self, *args, **kwargs) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        self.count = 0
+        event.listen(db.engine, "before_cursor_execute", self.callback)
+        return self
+
+    def __exit__(self, *args) -> None:
+        event.remove(db.engine, "before_cursor_execute", self.callback)
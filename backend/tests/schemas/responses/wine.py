@@ -57,9 +57,10 @@ constraints_response_schema = {
         "reviews": {
             "type": "object",
             "properties": {
+                "max": {"type": "number"},
                 "min": {"type": "number"},
             },
-            "required": ["min"],
+            "required": ["max", "min"],
             "additionalProperties": False,
         },
         "sorts": {
@@ -83,8 +84,10 @@ all_response_schema = {
     "properties": {
         "length": {"type": "number"},
         "page": {"type": "number"},
-        "totalInstances": {"type": "number"},
-        "totalPages": {"type": "number"},
+        "totalInstances": {"type": ["number", "null"]},
+        "totalPages": {"type": ["number", "null"]},
+        "nextCursor": {"type": ["string", "null"]},
+        "prevCursor": {"type": ["string", "null"]},
         "list": {
             "type": "array",
             "items": wine_schema,
@@ -95,7 +98,21 @@ all_response_schema = {
         "page",
         "totalInstances",
         "totalPages",
+        "nextCursor",
+        "prevCursor",
         "list",
     ],
     "additionalProperties": False,
 }
+
+batch_response_schema = {
+    "type": "object",
+    "properties": {
+        "data": {
+            "type": "object",
+            "additionalProperties": id_response_schema,
+        },
+    },
+    "required": ["data"],
+    "additionalProperties": False,
+}
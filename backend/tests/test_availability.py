@@ -0,0 +1,32 @@
+import unittest
+
+import __init__  # type: ignore
+from src.routes.visualizations.provider.line.availability import parse
+
+
+class AvailabilityTests(unittest.TestCase):
+    def test_constants(self):
+        """Whole-day and closed hours parse to fixed opening and closing minutes."""
+        self.assertEqual(parse("All Day"), (0, None))
+        self.assertEqual(parse("closed"), (None, 0))
+
+    def test_range(self):
+        """Ranges of clock times, sunrise and sunset, or noon parse to opening and closing minutes."""
+        self.assertEqual(parse("9:00am to 5:30pm"), (9 * 60, 17 * 60 + 30))
+        self.assertEqual(parse("12:15AM - 12:45PM"), (15, 12 * 60 + 45))
+        self.assertEqual(parse("Sunrise to Sunset"), (7 * 60, 19 * 60))
+        self.assertEqual(parse("9:00am to noon"), (9 * 60, None))
+
+    def test_opening(self):
+        """Hours that only give an opening time leave the closing time unknown."""
+        self.assertEqual(parse("Opens at 8:00am"), (8 * 60, None))
+        self.assertEqual(parse("opens  at sunrise"), (7 * 60, None))
+
+    def test_unknown(self):
+        """Hours without a readable time, or with an invalid one, leave it unknown."""
+        self.assertEqual(parse("by appointment only"), (None, None))
+        self.assertEqual(parse("9:75am to 5:00pm"), (None, 17 * 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
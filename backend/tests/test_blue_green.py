@@ -0,0 +1,43 @@
+import unittest
+
+from sqlalchemy import create_engine, inspect, select
+
+import __init__  # type: ignore
+from src.common.core import db
+from src.models import Region, RegionTag, Wine, WineRegionAssociation
+from src.util.blue_green import reload_tables
+from src.util.bulk_load import collect_rows
+
+
+def create_instances(name: str) -> list[list]:
+    region = Region(name=name, tag_list=[RegionTag(tag=name)])
+    wine = Wine(name=name, type="Red", region_list=[WineRegionAssociation(region=region)])
+    return [[wine], [region]]
+
+
+class BlueGreenTests(unittest.TestCase):
+    def test_reload_tables(self):
+        """Reloading the catalog replaces its rows and leaves no staging tables behind."""
+        engine = create_engine("sqlite://")
+        db.metadata.create_all(engine)
+
+        for name in ["old", "new"]:
+            with engine.begin() as connection:
+                reload_tables(connection, collect_rows(create_instances(name)))
+
+        with engine.connect() as connection:
+            self.assertEqual(connection.execute(select(Region.__table__.c.name)).scalars().all(), ["new"])
+            self.assertEqual(connection.execute(select(RegionTag.__table__.c.tag)).scalars().all(), ["new"])
+
+            inspector = inspect(connection)
+            self.assertEqual(set(inspector.get_table_names()), set(db.metadata.tables))
+
+            tag_indexes = [e["name"] for e in inspector.get_indexes(RegionTag.__tablename__)]
+            self.assertEqual(tag_indexes, ["ix_region_tags_tag"])
+
+            referred = [e["referred_table"] for e in inspector.get_foreign_keys(WineRegionAssociation.__tablename__)]
+            self.assertEqual(sorted(referred), ["regions", "wines"])
+
+
+if __name__ == "__main__":
+    unittest.main()
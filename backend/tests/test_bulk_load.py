@@ -0,0 +1,52 @@
+import unittest
+
+from sqlalchemy import create_engine, func, select
+
+import __init__  # type: ignore
+from src.common.core import db
+from src.models import RedditPost, Region, RegionTag, Wine, WineRegionAssociation
+from src.util.bulk_load import bulk_insert, collect_rows
+
+
+def create_instances() -> list[list]:
+    regions = [Region(name="A", tag_list=[RegionTag(tag="x")]), Region(name="B")]
+    post = RedditPost(wine_type="Red")
+    wines = [
+        Wine(name="1", type="Red", region_list=[WineRegionAssociation(region=regions[1])]),
+        Wine(name="2", type="Red", region_list=[WineRegionAssociation(region=regions[0])]),
+    ]
+    post.wines = wines
+    return [[post], wines, regions]
+
+
+class BulkLoadTests(unittest.TestCase):
+    def test_collect_rows(self):
+        """Instances become rows with sequential ids, foreign keys and association rows."""
+        rows = collect_rows(create_instances())
+
+        self.assertEqual([(e["id"], e["name"]) for e in rows[Region.__table__]], [(1, "A"), (2, "B")])
+        self.assertEqual([(e["id"], e["reddit_post_id"]) for e in rows[Wine.__table__]], [(1, 1), (2, 1)])
+        self.assertEqual(
+            [(e["wine_id"], e["region_id"]) for e in rows[WineRegionAssociation.__table__]],
+            [(1, 2), (2, 1)],
+        )
+        self.assertEqual(rows[RegionTag.__table__], [{"region_id": 1, "tag": "x"}])
+
+    def test_bulk_insert(self):
+        """Inserting rows in chunks writes every association and keeps the indexes."""
+        engine = create_engine("sqlite://")
+        db.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            bulk_insert(connection, collect_rows(create_instances()), chunk_size=1)
+
+        with engine.connect() as connection:
+            count = connection.execute(select(func.count()).select_from(WineRegionAssociation.__table__)).scalar_one()
+            self.assertEqual(count, 2)
+
+            tag_indexes = [e["name"] for e in engine.dialect.get_indexes(connection, RegionTag.__tablename__)]
+            self.assertIn("ix_region_tags_tag", tag_indexes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+import __init__  # type: ignore
+from src.common.core import db
+from src.models import RedditPost, Region, RegionTag, Wine, WineRegionAssociation
+from src.util.bulk_load import bulk_insert, collect_rows
+from src.util.columnar import check_columns, load_columns, write_columns
+from src.util.upsert import read_rows
+
+
+def create_instances() -> list[list]:
+    region = Region(name="Rhône", country="France", rating=4.5, tags=["Wineries"], tag_list=[RegionTag(tag="Wineries")])
+    reddit_post = RedditPost(wine_type="Red", urls=["https://reddit.com"])
+    wines = [
+        Wine(
+            name="Côte",
+            type="Red",
+            rating=4.2,
+            reddit_post=reddit_post,
+            region_list=[WineRegionAssociation(region=region)],
+        ),
+        Wine(name="", type="Red", rating=None),
+    ]
+    return [[reddit_post], wines, [region]]
+
+
+class ColumnarTests(unittest.TestCase):
+    def test_load_columns(self):
+        """Loading the columnar export gives the same rows as a bulk insert."""
+        rows = collect_rows(create_instances())
+        tables = list(rows)
+        path = Path(tempfile.mkdtemp()) / "columnar"
+        write_columns(path, rows, "digest")
+
+        expected_engine = create_engine("sqlite://")
+        actual_engine = create_engine("sqlite://")
+        db.metadata.create_all(expected_engine)
+        db.metadata.create_all(actual_engine)
+
+        with expected_engine.begin() as connection:
+            bulk_insert(connection, rows)
+        with actual_engine.begin() as connection:
+            load_columns(connection, path, tables, chunk_size=1)
+
+        with expected_engine.connect() as expected, actual_engine.connect() as actual:
+            self.assertEqual(read_rows(actual, tables), read_rows(expected, tables))
+
+    def test_check_columns(self):
+        """A columnar export is only usable when it exists and matches the digest of its source."""
+        rows = collect_rows(create_instances())
+        tables = list(rows)
+        path = Path(tempfile.mkdtemp()) / "columnar"
+        dialect = create_engine("sqlite://").dialect
+
+        self.assertIsNotNone(check_columns(path, "digest", tables, dialect))
+
+        write_columns(path, rows, "digest")
+        self.assertIsNone(check_columns(path, "digest", tables, dialect))
+        self.assertIsNotNone(check_columns(path, "changed", tables, dialect))
+
+
+if __name__ == "__main__":
+    unittest.main()
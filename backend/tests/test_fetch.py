@@ -0,0 +1,191 @@
+import json
+import tempfile
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+
+import __init__  # type: ignore
+from scripts.scrape.fetch import Fetcher, FetchRequest, ResponseCache, TokenBucket
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    `/echo?value=..&delay=..` answers with the value after the delay, `/flaky` fails with a 429 before it succeeds
+    and `/missing` answers with a 404 and an error body.
+    """
+
+    lock = Lock()
+    in_flight = 0
+    max_in_flight = 0
+    hits: Counter = Counter()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        cls = type(self)
+
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.hits[url.path] += 1
+            hits = cls.hits[url.path]
+
+        try:
+            time.sleep(float(query.get("delay", 0)))
+
+            if url.path == "/flaky" and hits < 3:
+                self.respond(429, {"error": "rate limited"}, {"Retry-After": "0"})
+            elif url.path == "/missing":
+                self.respond(404, {"error": "not found"})
+            else:
+                self.respond(200, {"value": query.get("value")})
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def respond(self, status: int, body: dict, headers: dict[str, str] = {}):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FetchTests(unittest.TestCase):
+    server: ThreadingHTTPServer
+    base_url: str
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.in_flight = 0
+        StubHandler.max_in_flight = 0
+        StubHandler.hits = Counter()
+
+    def test_ordered(self):
+        """Concurrent fetches return responses in request order and respect the per-host limit."""
+        fetcher = Fetcher(max_workers=8, per_host=3)
+        batch = [FetchRequest(f"{self.base_url}/echo", {"value": i, "delay": (i % 4) * 0.02}) for i in range(20)]
+
+        responses = fetcher.fetch_all(batch)
+
+        self.assertEqual(responses, [{"value": str(i)} for i in range(20)])
+        self.assertLessEqual(StubHandler.max_in_flight, 3)
+        self.assertGreater(StubHandler.max_in_flight, 1)
+
+    def test_retry(self):
+        """Rate limited requests are retried until they succeed."""
+        fetcher = Fetcher(backoff=0)
+
+        self.assertEqual(fetcher.get(FetchRequest(f"{self.base_url}/flaky", {"value": "ok"})), {"value": "ok"})
+        self.assertEqual(StubHandler.hits["/flaky"], 3)
+
+    def test_retries_exhausted(self):
+        """Once the retries run out, the last error response is returned."""
+        fetcher = Fetcher(retries=1, backoff=0)
+
+        self.assertEqual(fetcher.get(FetchRequest(f"{self.base_url}/flaky")), {"error": "rate limited"})
+        self.assertEqual(StubHandler.hits["/flaky"], 2)
+
+    def test_error_body(self):
+        """Errors that are not worth retrying return their body right away."""
+        fetcher = Fetcher(backoff=0)
+
+        self.assertEqual(fetcher.get(FetchRequest(f"{self.base_url}/missing")), {"error": "not found"})
+        self.assertEqual(StubHandler.hits["/missing"], 1)
+
+    def test_cache(self):
+        """Cached responses are reused by later runs, even after the API key changes."""
+        path = Path(tempfile.mkdtemp()) / "responses.sqlite3"
+        batch = [FetchRequest(f"{self.base_url}/echo", {"value": i, "key": "secret"}) for i in range(3)]
+
+        first = Fetcher(cache=ResponseCache(path)).fetch_all(batch[0:2])
+        self.assertEqual(StubHandler.hits["/echo"], 2)
+
+        # a new run with another api key only fetches what is missing
+        for request in batch:
+            request.params["key"] = "rotated"
+        fetcher = Fetcher(cache=ResponseCache(path))
+        responses = fetcher.fetch_all(batch)
+
+        self.assertEqual(responses[0:2], first)
+        self.assertEqual(responses[2], {"value": "2"})
+        self.assertEqual((fetcher.fetched, fetcher.cached), (1, 2))
+        self.assertEqual(StubHandler.hits["/echo"], 3)
+
+    def test_cache_expired(self):
+        """An expired cached response, or any with a max age of 0, is fetched again and stored again."""
+        path = Path(tempfile.mkdtemp()) / "responses.sqlite3"
+        request = FetchRequest(f"{self.base_url}/echo", {"value": 1})
+
+        cache = ResponseCache(path)
+        Fetcher(cache=cache).get(request)
+        cache.connect().execute("UPDATE responses SET fetched_at = fetched_at - 120")
+
+        fetcher = Fetcher(cache=ResponseCache(path, max_age=60))
+        self.assertEqual(fetcher.get(request), {"value": "1"})
+        self.assertEqual((fetcher.fetched, fetcher.cached), (1, 0))
+        self.assertEqual(StubHandler.hits["/echo"], 2)
+
+        # the response fetched by the run above is fresh
+        fetcher = Fetcher(cache=ResponseCache(path, max_age=60))
+        fetcher.get(request)
+        self.assertEqual((fetcher.fetched, fetcher.cached), (0, 1))
+
+        fetcher = Fetcher(cache=ResponseCache(path, max_age=0))
+        fetcher.get(request)
+        self.assertEqual((fetcher.fetched, fetcher.cached), (1, 0))
+        self.assertEqual(StubHandler.hits["/echo"], 3)
+
+    def test_cache_skips_failures(self):
+        """Failed responses are not cached."""
+        cache = ResponseCache(Path(tempfile.mkdtemp()) / "responses.sqlite3")
+        fetcher = Fetcher(retries=0, cache=cache)
+
+        self.assertEqual(fetcher.get(FetchRequest(f"{self.base_url}/flaky")), {"error": "rate limited"})
+        self.assertIsNone(cache.get(FetchRequest(f"{self.base_url}/flaky")))
+
+    def test_rate_limit(self):
+        """Requests beyond the first wait for the rate limit."""
+        fetcher = Fetcher(max_workers=8, per_host=8, requests_per_second=50)
+
+        start = time.monotonic()
+        fetcher.fetch_all([FetchRequest(f"{self.base_url}/echo", {"value": i}) for i in range(11)])
+
+        # the first request is free, the other 10 wait for a token
+        self.assertGreaterEqual(time.monotonic() - start, 10 / 50)
+
+    def test_token_bucket(self):
+        """A token bucket allows a burst up to its capacity, then refills at its rate."""
+        bucket = TokenBucket(rate=100, capacity=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.005)
+
+
+if __name__ == "__main__":
+    unittest.main()
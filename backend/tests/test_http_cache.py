@@ -0,0 +1,61 @@
+import unittest
+
+import __init__  # type: ignore
+from tests.common.data_version import frozen_data_version
+from tests.common.flask_testcase import FlaskTestCase
+from tests.common.query_counter import QueryCounter
+from tests.common.util import create_url
+
+
+class HttpCacheTests(FlaskTestCase):
+    endpoints = [
+        "/wines",
+        "/wines/1",
+        "/wines/constraints",
+        "/regions",
+        "/regions/1",
+        "/regions/constraints",
+        "/vineyards",
+        "/vineyards/1",
+        "/vineyards/constraints",
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(frozen_data_version())
+
+    def test_headers(self):
+        """Catalog endpoints answer with an ETag and a Cache-Control header."""
+        for endpoint in HttpCacheTests.endpoints:
+            res = self.client.get(endpoint)
+            self.assertEqual(res.status_code, 200, endpoint)
+            self.assertIsNotNone(res.headers.get("ETag"), endpoint)
+            self.assertIn("max-age", res.headers.get("Cache-Control", ""), endpoint)
+
+    def test_not_modified(self):
+        """A request with a matching ETag gets a 304 without querying the database."""
+        for endpoint in HttpCacheTests.endpoints:
+            etag = self.client.get(endpoint).headers["ETag"]
+
+            with QueryCounter() as counter:
+                res = self.client.get(endpoint, headers={"If-None-Match": etag})
+
+            self.assertEqual(res.status_code, 304, endpoint)
+            self.assertEqual(res.headers["ETag"], etag)
+            self.assertEqual(counter.count, 0, endpoint)
+
+    def test_etag_per_query(self):
+        """ETags ignore the order of the query arguments but not their values."""
+        etag_1 = self.client.get(create_url("/wines", {"page": 1, "sort": "name_asc"})).headers["ETag"]
+        etag_2 = self.client.get(create_url("/wines", {"sort": "name_asc", "page": 1})).headers["ETag"]
+        etag_3 = self.client.get(create_url("/wines", {"page": 2, "sort": "name_asc"})).headers["ETag"]
+
+        self.assertEqual(etag_1, etag_2)
+        self.assertNotEqual(etag_1, etag_3)
+
+        res = self.client.get(create_url("/wines", {"page": 2, "sort": "name_asc"}), headers={"If-None-Match": etag_1})
+        self.assertEqual(res.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import __init__  # type: ignore
+from scripts.scrape import json_stream
+from scripts.scrape.abstract_scrape_script import ScriptMode
+from scripts.scrape.json_stream import iter_entries, iter_items, write_json
+from scripts.scrape.wines import WineScript
+
+RECORDS = [
+    {"name": 'Château "1"', "rating": 4.5, "tags": ["a\nb", []], "empty": {}},
+    {"name": "2", "rating": -1.25e-7, "reviews": 12345678901234, "ok": True, "image": None},
+]
+
+
+class JsonStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+
+    def dump(self, data) -> Path:
+        path = self.dir / "data.json"
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=4), encoding="utf-8")
+        return path
+
+    @mock.patch.object(json_stream, "CHUNK_SIZE", 3)
+    def test_iter_items(self):
+        """Items of the data list are streamed, and a missing list raises a KeyError."""
+        path = self.dump({"before": {"data": [0]}, "data": RECORDS, "after": 1})
+
+        self.assertEqual(list(iter_items(path)), RECORDS)
+        self.assertEqual(list(iter_items(self.dump(RECORDS), None)), RECORDS)
+        self.assertEqual(list(iter_items(self.dump({"data": []}))), [])
+
+        with self.assertRaises(KeyError):
+            list(iter_items(self.dump({"other": RECORDS})))
+
+    @mock.patch.object(json_stream, "CHUNK_SIZE", 3)
+    def test_iter_entries(self):
+        """Entries of the top level object, or of one of its keys, are streamed."""
+        data = {"France": {"Alsace": RECORDS}, "Italy": {}}
+
+        self.assertEqual(dict(iter_entries(self.dump(data))), data)
+        self.assertEqual(dict(iter_entries(self.dump({"search": data}), "search")), data)
+
+    def test_write_json(self):
+        """Streamed output is identical to json.dumps of the same data."""
+        cases: list[dict] = [{}, {"data": []}, {"data": RECORDS, "other": {"a": [1, 2]}}]
+        for data in cases:
+            file = io.StringIO()
+            write_json(file, {k: iter(v) if isinstance(v, list) else v for k, v in data.items()})
+            self.assertEqual(file.getvalue(), json.dumps(data, ensure_ascii=False, indent=4))
+
+    def test_stage(self):
+        """A modify script streams the raw records and skips the ones it cannot parse."""
+        raw = {
+            "reds": [
+                {
+                    "winery": "A",
+                    "wine": "X",
+                    "image": "x.png",
+                    "location": "France\n·\nAlsace",
+                    "rating": {"average": "4.5", "reviews": "12 ratings"},
+                },
+                {"wine": "broken"},
+            ]
+        }
+        (self.dir / "data/raw").mkdir(parents=True)
+        (self.dir / "data/raw/wines.json").write_text(json.dumps(raw), encoding="utf-8")
+
+        script = WineScript("wines.json", ScriptMode.MODIFY)
+        script.root_dir = self.dir
+        script.target_dir = self.dir / "data/modify"
+        script.target_file = script.target_dir / "wines.json"
+
+        with mock.patch("builtins.print"):
+            script.run()
+
+        data = json.loads(script.target_file.read_text(encoding="utf-8"))
+        self.assertEqual([(e["name"], e["region"], e["reviews"]) for e in data["data"]], [("X", "Alsace", 12)])
+
+
+if __name__ == "__main__":
+    unittest.main()
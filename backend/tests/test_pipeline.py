@@ -0,0 +1,147 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from threading import Lock
+from unittest import mock
+
+import __init__  # type: ignore
+from scripts.scrape.abstract_scrape_script import ScriptMode
+from scripts.scrape.pipeline import Pipeline, Stage, shared_sources
+
+
+class FakeStage(Stage):
+    """
+    Writes the concatenated content of its inputs to its output.
+    """
+
+    lock = Lock()
+    running = 0
+    max_running = 0
+
+    data_dir: Path
+    fail = False
+    runs = 0
+
+    def version(self) -> str:
+        return "1"
+
+    def run(self, resume: bool = False) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+
+        try:
+            time.sleep(0.05)
+            if self.fail:
+                raise RuntimeError(self.name)
+
+            content = "".join((self.data_dir / e).read_text() for e in self.inputs) + self.name
+            output = self.data_dir / self.output
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(content)
+            self.runs += 1
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+class PipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.state_path = self.data_dir / "cache" / "pipeline.json"
+        FakeStage.max_running = 0
+
+        (self.data_dir / "misc").mkdir()
+        (self.data_dir / "misc/photos.json").write_text("photos")
+
+        self.stages = {
+            e.name: e
+            for e in [
+                self.create_stage("wines", ScriptMode.RAW, []),
+                self.create_stage("wines", ScriptMode.MODIFY, ["raw/wines.json"]),
+                self.create_stage("info", ScriptMode.RAW, ["modify/wines.json"]),
+                self.create_stage("photos", ScriptMode.RAW, ["modify/wines.json"]),
+                self.create_stage("regions", ScriptMode.MODIFY, ["raw/info.json", "misc/photos.json"]),
+            ]
+        }
+
+    def create_stage(self, module: str, mode: ScriptMode, inputs: list[str]) -> FakeStage:
+        stage = FakeStage(module, mode, inputs)
+        stage.data_dir = self.data_dir
+        return stage
+
+    def run_pipeline(self, **kwargs) -> dict[str, str]:
+        pipeline = Pipeline(list(self.stages.values()), self.data_dir, self.state_path)
+        with mock.patch("builtins.print"):
+            return pipeline.run(**kwargs)
+
+    def test_run(self):
+        """Stages run in dependency order, and independent stages run in parallel."""
+        results = self.run_pipeline()
+
+        self.assertEqual(set(results.values()), {"ran"})
+        self.assertEqual(
+            (self.data_dir / "modify/regions.json").read_text(),
+            "wines:rawwines:modifyinfo:rawphotosregions:modify",
+        )
+        # info and photos only depend on wines:modify
+        self.assertEqual(FakeStage.max_running, 2)
+
+    def test_skip_unchanged(self):
+        """When resuming, only stages whose inputs changed run again."""
+        self.run_pipeline()
+        self.assertEqual(set(self.run_pipeline(resume=True).values()), {"skipped"})
+
+        (self.data_dir / "misc/photos.json").write_text("reviewed photos")
+        results = self.run_pipeline(resume=True)
+
+        self.assertEqual(results["regions:modify"], "ran")
+        self.assertEqual(results["info:raw"], "skipped")
+        self.assertEqual(self.stages["regions:modify"].runs, 2)
+
+        self.assertEqual(set(self.run_pipeline(force=True).values()), {"ran"})
+
+    def test_raw_stages_rerun(self):
+        """Raw stages run again unless resuming, and the stages after them only if their output changed."""
+        self.run_pipeline()
+        results = self.run_pipeline()
+
+        self.assertEqual({k for k, v in results.items() if v == "ran"}, {"wines:raw", "info:raw", "photos:raw"})
+        self.assertEqual(results["wines:modify"], "skipped")
+        self.assertEqual(results["regions:modify"], "skipped")
+
+    def test_failure(self):
+        """A failed stage blocks the stages after it, but not unrelated ones."""
+        self.stages["info:raw"].fail = True
+        results = self.run_pipeline()
+
+        self.assertEqual(results["info:raw"], "failed")
+        self.assertEqual(results["regions:modify"], "blocked")
+        self.assertEqual(results["photos:raw"], "ran")
+
+    def test_only(self):
+        """Only the selected stages run."""
+        self.run_pipeline()
+        results = self.run_pipeline(force=True, only={"photos:raw"})
+
+        self.assertEqual(results, {"photos:raw": "ran"})
+
+    def test_version(self):
+        """The version of a stage changes with the modules that all stages share."""
+        self.assertIn("fetch.py", [e.name for e in shared_sources()])
+        self.assertNotIn("wines.py", [e.name for e in shared_sources()])
+
+        shared = self.data_dir / "shared.py"
+        shared.write_text("a")
+        stage = Stage("wines", ScriptMode.RAW, [])
+
+        with mock.patch("scripts.scrape.pipeline.shared_sources", return_value=[shared]):
+            version = stage.version()
+            shared.write_text("b")
+            self.assertNotEqual(stage.version(), version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import __init__  # type: ignore
+from src.common.provider_store import FileSource, ProviderStore
+from tests.common.flask_testcase import FlaskTestCase
+
+
+class ProviderStoreTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.source_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.write("parks", {"data": [1]})
+
+    def write(self, resource: str, payload: dict) -> None:
+        temp_path = self.source_dir / f"{resource}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(payload, file)
+        os.replace(temp_path, self.source_dir / f"{resource}.json")
+
+    def wait_for(self, store: ProviderStore, resource: str, payload: dict) -> None:
+        for _ in range(100):
+            if store.entries[resource].payload == payload:
+                return
+            store.get(resource)  # with max_age 0, every get starts a refresh unless one is running
+            time.sleep(0.01)
+        self.fail("payload was not refreshed")
+
+    def test_served_from_memory(self):
+        """A fresh payload is served from memory without reading the source again."""
+        store = ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=60)
+        self.assertEqual(store.get("parks"), {"data": [1]})
+
+        self.write("parks", {"data": [2]})
+        self.assertEqual(store.get("parks"), {"data": [1]})
+
+    def test_stale_while_revalidate(self):
+        """A stale payload is served while it is refreshed in the background."""
+        store = ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=0)
+        store.get("parks")
+
+        self.write("parks", {"data": [2]})
+        self.assertEqual(store.get("parks"), {"data": [1]})
+        self.wait_for(store, "parks", {"data": [2]})
+        self.assertEqual(store.get("parks"), {"data": [2]})
+
+    def test_failed_refresh_keeps_payload(self):
+        """A failed refresh keeps serving the previous payload."""
+        store = ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=60)
+        store.get("parks")
+
+        (self.source_dir / "parks.json").unlink()
+        self.assertFalse(store.try_refresh("parks"))
+        self.assertEqual(store.get("parks"), {"data": [1]})
+
+    def test_persisted(self):
+        """Payloads persisted by one store are served by the next without the source."""
+        ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=60).get("parks")
+        (self.source_dir / "parks.json").unlink()
+
+        store = ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=60)
+        self.assertEqual(store.get("parks"), {"data": [1]})
+
+    def test_render(self):
+        """Rendered payloads are reused until the payload is refreshed."""
+        store = ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=0)
+        calls: list[dict] = []
+
+        def create(payload: dict) -> dict:
+            calls.append(payload)
+            return {"length": len(payload["data"])}
+
+        self.assertEqual(json.loads(store.render("parks", create)), {"length": 1})
+        self.assertEqual(json.loads(store.render("parks", create)), {"length": 1})
+        self.assertEqual(len(calls), 1)
+
+        self.write("parks", {"data": [1, 2]})
+        self.wait_for(store, "parks", {"data": [1, 2]})
+        self.assertEqual(json.loads(store.render("parks", create)), {"length": 2})
+        self.assertEqual(len(calls), 2)
+
+    def test_views_bounded(self):
+        """Only the most recently used views are kept, and views of an older payload are dropped on refresh."""
+        store = ProviderStore(FileSource(self.source_dir), self.cache_dir, max_age=60, max_views=3)
+
+        def create(payload: dict, scale: int) -> dict:
+            return {"data": [e * scale for e in payload["data"]]}
+
+        for scale in range(5):
+            store.render("parks", create, scale)
+        self.assertEqual([e[2] for e in store.views], [2, 3, 4])
+
+        store.render("parks", create, 2)
+        store.render("parks", create, 5)
+        self.assertEqual([e[2] for e in store.views], [4, 2, 5])
+
+        self.write("parks", {"data": [1, 2]})
+        store.refresh("parks")
+        self.assertEqual(len(store.views), 0)
+        self.assertEqual(json.loads(store.render("parks", create, 2)), {"data": [2, 4]})
+
+
+if __name__ == "__main__":
+    unittest.main()
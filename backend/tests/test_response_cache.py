@@ -0,0 +1,93 @@
+import time
+import unittest
+from unittest import mock
+
+from sqlalchemy import text
+
+import __init__  # type: ignore
+from src.app import response_cache
+from src.common.core import db
+from src.common.response_cache import LocalBackend
+from src.util import data_version
+from tests.common.data_version import frozen_data_version
+from tests.common.flask_testcase import FlaskTestCase
+from tests.common.query_counter import QueryCounter
+from tests.common.util import create_url
+
+
+class LocalBackendTests(unittest.TestCase):
+    def test_size_bound(self):
+        """The least recently used entries are evicted to stay within the size bound."""
+        backend = LocalBackend(max_bytes=10, ttl=60)
+        backend.set("a", b"1234")
+        backend.set("b", b"1234")
+        backend.get("a")
+        backend.set("c", b"1234")
+
+        self.assertEqual(backend.get("a"), b"1234")
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("c"), b"1234")
+        self.assertLessEqual(backend.size, 10)
+
+    def test_too_large(self):
+        """Values larger than the whole cache are not stored."""
+        backend = LocalBackend(max_bytes=3, ttl=60)
+        backend.set("a", b"1234")
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual(backend.size, 0)
+
+    def test_ttl(self):
+        """Entries expire after their TTL."""
+        backend = LocalBackend(max_bytes=10, ttl=0.01)
+        backend.set("a", b"1234")
+        time.sleep(0.02)
+        self.assertIsNone(backend.get("a"))
+
+
+class ResponseCacheTests(FlaskTestCase):
+    def setUp(self):
+        super().setUp()
+        self.enterContext(frozen_data_version())
+
+    def test_hit(self):
+        """A repeated request is answered from the cache without querying the database."""
+        url = create_url("/wines", {"page": 1, "sort": "rating_desc"})
+        res_1 = self.client.get(url)
+        hits = response_cache.hits
+
+        with QueryCounter() as counter:
+            res_2 = self.client.get(create_url("/wines", {"sort": "rating_desc", "page": 1}))
+
+        self.assertEqual(res_2.status_code, 200)
+        self.assertEqual(res_1.get_json(), res_2.get_json())
+        self.assertEqual(response_cache.hits, hits + 1)
+        self.assertEqual(counter.count, 0)
+
+    def test_not_found(self):
+        """Error responses are not cached."""
+        self.assertEqual(self.client.get("/wines/0").status_code, 404)
+        self.assertEqual(self.client.get("/wines/0").status_code, 404)
+
+    def test_missing_data_version(self):
+        """Without a data_version table, responses are served but neither cached nor tagged."""
+        db.session.execute(text("ALTER TABLE data_version RENAME TO data_version_missing"))
+        db.session.commit()
+
+        try:
+            with mock.patch.object(data_version, "cached", None), mock.patch("src.util.data_version.logger"):
+                hits = response_cache.hits
+                res_1 = self.client.get("/wines/1")
+                res_2 = self.client.get("/wines/constraints")
+
+                self.assertEqual(res_1.status_code, 200)
+                self.assertEqual(res_2.status_code, 200)
+                self.assertIsNone(res_1.headers.get("ETag"))
+                self.assertEqual(self.client.get("/wines/1").get_json(), res_1.get_json())
+                self.assertEqual(response_cache.hits, hits)
+        finally:
+            db.session.execute(text("ALTER TABLE data_version_missing RENAME TO data_version"))
+            db.session.commit()
+
+
+if __name__ == "__main__":
+    unittest.main()
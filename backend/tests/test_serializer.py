@@ -0,0 +1,102 @@
+import unittest
+from decimal import Decimal
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import __init__  # type: ignore
+from src.common.core import db
+from src.models import RedditPost, Region, Vineyard, Wine
+from src.schemas import (
+    RegionSchema,
+    VineyardSchema,
+    WineSchema,
+    region_schema,
+    regions_schema,
+    serialize_wine,
+    vineyards_schema,
+    wines_partial_schema,
+)
+
+
+def create_instances() -> tuple[Region, Vineyard, Wine, RedditPost]:
+    region = Region(
+        id=1,
+        name="Rhône",
+        country="France",
+        rating=Decimal("4.5"),
+        reviews=10,
+        tags=["Wineries"],
+        trip_types=["Couples"],
+        longitude=Decimal("4.805000"),
+        latitude=Decimal("45.000000"),
+        url="https://example.com",
+        image="https://example.com/image.jpg",
+        image_width=640,
+        image_height=480,
+    )
+    vineyard = Vineyard(
+        id=1,
+        name="Vineyard",
+        country="France",
+        price=2,
+        rating=Decimal("4.0"),
+        reviews=5,
+        image="https://example.com/image.jpg",
+        url="https://example.com",
+        longitude=Decimal("4.800000"),
+        latitude=Decimal("45.100000"),
+    )
+    reddit_post = RedditPost(id=1, wine_type="Red", urls=["https://www.reddit.com/r/wine/comments/1/post", "bad"])
+    wine = Wine(
+        id=1,
+        name="Côte",
+        winery="Winery",
+        image="https://example.com/image.jpg",
+        reviews=3,
+        country="France",
+        region="Rhône",
+        type="Red",
+        rating=Decimal("4.2"),
+        reddit_post=reddit_post,
+    )
+    return region, vineyard, wine, reddit_post
+
+
+class SerializerTests(unittest.TestCase):
+    def test_schema_parity(self):
+        """The serializers give the same JSON as the marshmallow schemas, in the same key order."""
+        region, vineyard, wine, reddit_post = create_instances()
+
+        # lists compare the key order too, which the JSON of a response keeps
+        self.assertEqual(list(regions_schema.dump([region])[0].items()), list(RegionSchema().dump(region).items()))
+        self.assertEqual(
+            list(vineyards_schema.dump([vineyard])[0].items()), list(VineyardSchema().dump(vineyard).items())
+        )
+        self.assertEqual(
+            list(wines_partial_schema.dump([wine])[0].items()),
+            list(WineSchema(exclude=["redditPosts"]).dump(wine).items()),
+        )
+        self.assertEqual(
+            list(serialize_wine(wine, reddit_post).items()),
+            list(WineSchema(context={"reddit_post": reddit_post}).dump(wine).items()),
+        )
+
+    def test_expired_instances(self):
+        """Instances whose attributes expired are loaded again before they are serialized."""
+        engine = create_engine("sqlite://")
+        db.metadata.create_all(engine)
+        region = create_instances()[0]
+        expected = RegionSchema().dump(region)
+
+        with Session(engine) as session:
+            session.add(region)
+            session.commit()
+
+            self.assertNotIn("name", region.__dict__)
+            self.assertEqual(region_schema.dump(region), expected)
+            self.assertEqual(regions_schema.dump(e for e in [region]), [expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+import __init__  # type: ignore
+from src.routes.regions.all import sort_methods as region_sort_methods
+from src.routes.vineyards.all import sort_methods as vineyard_sort_methods
+from src.routes.wines.all import sort_methods as wine_sort_methods
+
+
+class SortIndexTests(unittest.TestCase):
+    def test_indexed(self):
+        """Every sort column has an index on (column, id) for the seek of a cursor."""
+        for sort_methods in [wine_sort_methods, region_sort_methods, vineyard_sort_methods]:
+            for sort_method in sort_methods.values():
+                table = sort_method.column.table
+                indexed = [[e.name for e in index.columns] for index in table.indexes]
+                self.assertIn([sort_method.column.name, "id"], indexed, sort_method.id)
+
+
+if __name__ == "__main__":
+    unittest.main()
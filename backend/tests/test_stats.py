@@ -0,0 +1,39 @@
+import unittest
+
+import __init__  # type: ignore
+from tests.common.flask_testcase import FlaskTestCase
+from tests.common.util import create_url
+
+
+class StatsTests(FlaskTestCase):
+    endpoint = "/stats"
+
+    def test_statement_cache(self):
+        """The statement cache counts a hit for each statement that a repeated request reuses."""
+        params = {"country": ["France"], "page": 1}
+        self.client.get(create_url("/wines", params))
+        before = self.client.get(StatsTests.endpoint).get_json()["statementCache"]
+
+        self.client.get(create_url("/wines", {**params, "page": 2}))
+        after = self.client.get(StatsTests.endpoint).get_json()["statementCache"]
+
+        self.assertEqual(after["misses"], before["misses"])
+        self.assertGreater(after["hits"], before["hits"])
+        self.assertGreater(after["size"], 0)
+        self.assertGreater(after["hitRate"], 0.0)
+
+    def test_response_cache(self):
+        """The response cache counts a miss for the first request and a hit for the same request after it."""
+        before = self.client.get(StatsTests.endpoint).get_json()["responseCache"]
+
+        self.client.get("/wines/1")
+        self.client.get("/wines/1")
+        after = self.client.get(StatsTests.endpoint).get_json()["responseCache"]
+
+        self.assertEqual(after["misses"], before["misses"] + 1)
+        self.assertEqual(after["hits"], before["hits"] + 1)
+        self.assertGreater(after["hitRate"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from sqlalchemy import create_engine, select
+
+import __init__  # type: ignore
+from src.common.core import db
+from src.models import Region, Wine, WineRegionAssociation
+from src.util.bulk_load import bulk_insert, collect_rows
+from src.util.upsert import NaturalKeys, apply_diff, diff_rows, read_rows
+
+NATURAL_KEYS: NaturalKeys = {
+    Wine.__table__: ("name", "winery"),
+    Region.__table__: ("country", "name"),
+}
+
+
+def create_instances(wines: dict[str, str], ratings: dict[str, float]) -> list[list]:
+    """
+    Wines by name with the name of their region, and regions by name with their rating.
+    """
+    regions = {name: Region(name=name, country="France", rating=rating) for name, rating in ratings.items()}
+    ret = [
+        Wine(name=name, winery="A", region_list=[WineRegionAssociation(region=regions[region])])
+        for name, region in wines.items()
+    ]
+    return [ret, list(regions.values())]
+
+
+class UpsertTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        db.metadata.create_all(self.engine)
+
+    def upsert(self, lists: list[list], dry_run: bool = False) -> dict[str, tuple[int, int, int]]:
+        with self.engine.begin() as connection:
+            rows = collect_rows(lists)
+            diffs = diff_rows(read_rows(connection, list(rows)), rows, NATURAL_KEYS, connection.dialect)
+            if not dry_run:
+                apply_diff(connection, diffs, NATURAL_KEYS, chunk_size=1)
+
+        return {e.table.name: (len(e.inserted), len(e.updated), len(e.deleted)) for e in diffs}
+
+    def test_upsert(self):
+        """Only changed rows are written, and rows that remain keep their ids."""
+        self.upsert(create_instances({"x": "Alsace", "y": "Alsace"}, {"Alsace": 4.25, "Bordeaux": 4.0}))
+
+        with self.engine.connect() as connection:
+            ids = dict(connection.execute(select(Wine.__table__.c.name, Wine.__table__.c.id)).all())
+
+        unchanged = self.upsert(create_instances({"x": "Alsace", "y": "Alsace"}, {"Alsace": 4.25, "Bordeaux": 4.0}))
+        self.assertTrue(all(e == (0, 0, 0) for e in unchanged.values()))
+
+        lists = create_instances({"y": "Bordeaux", "z": "Bordeaux"}, {"Bordeaux": 3.5})
+        self.assertEqual(self.upsert(lists, dry_run=True), self.upsert(lists))
+
+        with self.engine.connect() as connection:
+            wines = connection.execute(select(Wine.__table__.c.name, Wine.__table__.c.id)).all()
+            self.assertEqual(sorted(wines), [("y", ids["y"]), ("z", 3)])
+
+            regions = connection.execute(select(Region.__table__.c.name, Region.__table__.c.rating)).all()
+            self.assertEqual([(name, float(rating)) for name, rating in regions], [("Bordeaux", 3.5)])
+
+            associations = connection.execute(select(WineRegionAssociation.__table__)).all()
+            self.assertEqual(sorted(associations), [(ids["y"], 2), (3, 2)])
+
+    def test_duplicate_keys(self):
+        """Rows that share a natural key cannot be matched, whether they are new or stored."""
+        wines, regions = create_instances({"x": "Alsace"}, {"Alsace": 4.25})
+        duplicate = Wine(name="x", winery="A", region_list=[])
+
+        with self.assertRaisesRegex(ValueError, "new rows of wines"):
+            self.upsert([[*wines, duplicate], regions])
+
+        with self.engine.begin() as connection:
+            rows = collect_rows([[*wines, duplicate], regions])
+            bulk_insert(connection, rows)
+
+        with self.assertRaisesRegex(ValueError, "stored rows of wines"):
+            self.upsert(create_instances({"x": "Alsace"}, {"Alsace": 4.25}))
+
+
+if __name__ == "__main__":
+    unittest.main()
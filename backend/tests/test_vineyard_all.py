@@ -79,6 +79,52 @@ class VineyardAllTests(FlaskTestCase):
         self.assertEqual(res_2["length"], PAGE_SIZE)
         self.assertGreaterEqual(res_2["totalInstances"], PAGE_SIZE)
 
+    def test_cursor(self):
+        """Following the cursors of a page gives the same pages as page numbers."""
+        params = {"sort": "rating_desc"}
+        res_1 = self.client.get(create_url(VineyardAllTests.endpoint, {**params, "page": 1})).get_json()
+        res_2 = self.client.get(create_url(VineyardAllTests.endpoint, {**params, "page": 2})).get_json()
+        self.assertIsNone(res_1["prevCursor"])
+        self.assertIsNotNone(res_1["nextCursor"])
+
+        res_next = self.client.get(
+            create_url(VineyardAllTests.endpoint, {**params, "cursor": res_1["nextCursor"]})
+        ).get_json()
+        validate(res_next, all_response_schema)
+        self.assertEqual(res_next["page"], 2)
+        self.assertEqual(res_next["totalInstances"], res_2["totalInstances"])
+        self.assertEqual([e["id"] for e in res_next["list"]], [e["id"] for e in res_2["list"]])
+
+        res_prev = self.client.get(
+            create_url(VineyardAllTests.endpoint, {**params, "cursor": res_next["prevCursor"]})
+        ).get_json()
+        self.assertEqual(res_prev["page"], 1)
+        self.assertIsNone(res_prev["prevCursor"])
+        self.assertEqual([e["id"] for e in res_prev["list"]], [e["id"] for e in res_1["list"]])
+
+    def test_cursor_invalid(self):
+        """Malformed cursors, and cursors of another sort, are rejected."""
+        res = self.client.get(create_url(VineyardAllTests.endpoint, {"cursor": "this is not a cursor"}))
+        self.assertEqual(res.status_code, 400)
+
+        res_1 = self.client.get(create_url(VineyardAllTests.endpoint, {"page": 1, "sort": "name_asc"})).get_json()
+        res_2 = self.client.get(
+            create_url(VineyardAllTests.endpoint, {"cursor": res_1["nextCursor"], "sort": "name_desc"})
+        )
+        self.assertEqual(res_2.status_code, 400)
+
+    def test_count_opt_out(self):
+        """Opting out of the count leaves the totals empty and the page unchanged."""
+        res_1 = self.client.get(create_url(VineyardAllTests.endpoint, {"page": 2})).get_json()
+        res_2 = self.client.get(create_url(VineyardAllTests.endpoint, {"page": 2, "count": "false"})).get_json()
+
+        validate(res_2, all_response_schema)
+        self.assertIsNone(res_2["totalInstances"])
+        self.assertIsNone(res_2["totalPages"])
+        self.assertGreaterEqual(res_1["totalInstances"], PAGE_SIZE)
+        self.assertEqual(res_1["list"], res_2["list"])
+        self.assertEqual(res_1["nextCursor"], res_2["nextCursor"])
+
     def test_search(self):
         """Written by JB"""
         search_query = "st"
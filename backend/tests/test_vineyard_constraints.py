@@ -1,8 +1,11 @@
 import unittest
 
 from jsonschema import validate
+from sqlalchemy import func
 
 import __init__  # type: ignore
+from src.common.core import db
+from src.models import Vineyard
 from src.routes.vineyards.all import sort_methods
 from tests.common.flask_testcase import FlaskTestCase
 from tests.common.util import JsonObject, is_alphabetical_order
@@ -35,9 +38,22 @@ class VineyardConstraintTests(FlaskTestCase):
         """Written by Ryan"""
         res: JsonObject = self.client.get(VineyardConstraintTests.endpoint).get_json()
 
-        self.assertEqual(res["rating"]["min"], 0.0)
-        self.assertEqual(res["rating"]["max"], 5.0)
-        self.assertEqual(res["reviews"]["min"], 0)
+        query = db.select(
+            func.min(Vineyard.rating),
+            func.max(Vineyard.rating),
+            func.min(Vineyard.reviews),
+            func.max(Vineyard.reviews),
+            func.min(Vineyard.price),
+            func.max(Vineyard.price),
+        )
+        min_rating, max_rating, min_reviews, max_reviews, min_price, max_price = db.session.execute(query).one()
+
+        self.assertEqual(res["rating"]["min"], float(min_rating))
+        self.assertEqual(res["rating"]["max"], float(max_rating))
+        self.assertEqual(res["reviews"]["min"], min_reviews)
+        self.assertEqual(res["reviews"]["max"], max_reviews)
+        self.assertEqual(res["price"]["min"], min_price)
+        self.assertEqual(res["price"]["max"], max_price)
 
         all_sorts: list[JsonObject] = res["sorts"]
         for sort_obj in all_sorts:
@@ -3,9 +3,18 @@ import unittest
 from jsonschema import validate
 
 from tests.common.flask_testcase import FlaskTestCase
+from tests.common.util import JsonObject, create_url
 from tests.schemas.responses.visualizations import provider_line_response_schema
 
 
+def value_at(res: JsonObject, hour: int, minute: int) -> int:
+    value = 0
+    for point in res["data"]:
+        if (point["time"]["hour"], point["time"]["minute"]) <= (hour, minute):
+            value = point["value"]
+    return value
+
+
 class TestVisualizationProviderLine(FlaskTestCase):
     endpoint = "/visualizations/provider/line"
 
@@ -16,6 +25,39 @@ class TestVisualizationProviderLine(FlaskTestCase):
         self.assertEqual(res.status_code, 200)
         validate(res.get_json(), provider_line_response_schema)
 
+    def test_values(self):
+        """Each point is the number of providers open at that time, over all days."""
+        res: JsonObject = self.client.get(TestVisualizationProviderLine.endpoint).get_json()
+
+        self.assertEqual(res["sample_size"], 4 * 7)
+        self.assertEqual(value_at(res, 3, 0), 7)
+        self.assertEqual(value_at(res, 12, 0), 26)
+        self.assertEqual(value_at(res, 23, 59), 8)
+
+    def test_resolution(self):
+        """A coarser resolution only has points on its steps."""
+        url = create_url(TestVisualizationProviderLine.endpoint, {"resolution": 60})
+        res: JsonObject = self.client.get(url).get_json()
+
+        validate(res, provider_line_response_schema)
+        for point in res["data"]:
+            self.assertEqual(point["time"]["minute"], 0)
+        self.assertEqual(value_at(res, 12, 0), 26)
+
+    def test_resolution_invalid(self):
+        """A resolution below one minute is rejected."""
+        url = create_url(TestVisualizationProviderLine.endpoint, {"resolution": 0})
+        self.assertEqual(self.client.get(url).status_code, 400)
+
+    def test_weekday(self):
+        """A weekday only counts the hours of that day."""
+        url = create_url(TestVisualizationProviderLine.endpoint, {"weekday": 6})
+        res: JsonObject = self.client.get(url).get_json()
+
+        validate(res, provider_line_response_schema)
+        self.assertEqual(res["sample_size"], 4)
+        self.assertEqual(value_at(res, 12, 0), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,9 @@ from jsonschema import validate
 from unidecode import unidecode
 
 import __init__  # type: ignore
+from src.common.cursor import Cursor
+from src.routes.wines.all import search_index
+from src.util.database import statement_cache
 from src.util.general import PAGE_SIZE
 from tests.common.flask_testcase import FlaskTestCase
 from tests.common.util import JsonObject, create_url, is_alphabetical_order
@@ -78,6 +81,72 @@ class WineAllTests(FlaskTestCase):
         self.assertEqual(res_2["length"], PAGE_SIZE)
         self.assertGreaterEqual(res_2["totalInstances"], PAGE_SIZE)
 
+    def test_cursor(self):
+        """Following the cursors of a page gives the same pages as page numbers."""
+        params = {"sort": "rating_desc"}
+        res_1 = self.client.get(create_url(WineAllTests.endpoint, {**params, "page": 1})).get_json()
+        res_2 = self.client.get(create_url(WineAllTests.endpoint, {**params, "page": 2})).get_json()
+        self.assertIsNone(res_1["prevCursor"])
+        self.assertIsNotNone(res_1["nextCursor"])
+
+        res_next = self.client.get(
+            create_url(WineAllTests.endpoint, {**params, "cursor": res_1["nextCursor"]})
+        ).get_json()
+        validate(res_next, all_response_schema)
+        self.assertEqual(res_next["page"], 2)
+        self.assertEqual(res_next["totalInstances"], res_2["totalInstances"])
+        self.assertEqual([e["id"] for e in res_next["list"]], [e["id"] for e in res_2["list"]])
+
+        res_prev = self.client.get(
+            create_url(WineAllTests.endpoint, {**params, "cursor": res_next["prevCursor"]})
+        ).get_json()
+        self.assertEqual(res_prev["page"], 1)
+        self.assertIsNone(res_prev["prevCursor"])
+        self.assertEqual([e["id"] for e in res_prev["list"]], [e["id"] for e in res_1["list"]])
+
+    def test_cursor_invalid(self):
+        """Malformed cursors, and cursors of another sort, are rejected."""
+        res = self.client.get(create_url(WineAllTests.endpoint, {"cursor": "this is not a cursor"}))
+        self.assertEqual(res.status_code, 400)
+
+        res_1 = self.client.get(create_url(WineAllTests.endpoint, {"page": 1, "sort": "name_asc"})).get_json()
+        res_2 = self.client.get(create_url(WineAllTests.endpoint, {"cursor": res_1["nextCursor"], "sort": "name_desc"}))
+        self.assertEqual(res_2.status_code, 400)
+
+    def test_cursor_invalid_value(self):
+        """Cursors whose value does not fit the sort column are rejected."""
+        cases = [("rating_desc", "abc"), ("rating_desc", "NaN"), ("reviews_asc", "x"), ("reviews_asc", [1])]
+
+        for sort, value in cases:
+            cursor = Cursor(sort, value, 1, 2).encode()
+            res = self.client.get(create_url(WineAllTests.endpoint, {"sort": sort, "cursor": cursor}))
+            self.assertEqual(res.status_code, 400, (sort, value))
+
+    def test_count_opt_out(self):
+        """Opting out of the count leaves the totals empty and the page unchanged."""
+        res_1 = self.client.get(create_url(WineAllTests.endpoint, {"page": 2})).get_json()
+        res_2 = self.client.get(create_url(WineAllTests.endpoint, {"page": 2, "count": "false"})).get_json()
+
+        validate(res_2, all_response_schema)
+        self.assertIsNone(res_2["totalInstances"])
+        self.assertIsNone(res_2["totalPages"])
+        self.assertGreaterEqual(res_1["totalInstances"], PAGE_SIZE)
+        self.assertEqual(res_1["list"], res_2["list"])
+        self.assertEqual(res_1["nextCursor"], res_2["nextCursor"])
+
+    def test_statement_cache(self):
+        """Requests with the same filters but other values reuse the compiled statements."""
+        params = {"country": ["Italy"], "startRating": 4.0, "sort": "rating_desc", "page": 1}
+        self.client.get(create_url(WineAllTests.endpoint, params))
+        misses = statement_cache.misses
+
+        params = {"country": ["Spain", "France", "Portugal"], "startRating": 3.5, "sort": "rating_desc", "page": 2}
+        res = self.client.get(create_url(WineAllTests.endpoint, params))
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(statement_cache.misses, misses)
+        self.assertGreater(statement_cache.stats()["hitRate"], 0.0)
+
     def test_search(self):
         """Written by JB"""
         search_query = "or"
@@ -111,6 +180,74 @@ class WineAllTests(FlaskTestCase):
         for key in found_dict.keys():
             self.assertTrue(found_dict[key], key)
 
+    def test_search_punctuation(self):
+        """A search without any words matches the wines that contain it, like a substring search."""
+        res = self.client.get(create_url(WineAllTests.endpoint, {"search": "-"})).get_json()
+
+        wines: list[JsonObject] = res["list"]
+        self.assertGreater(len(wines), 0)
+        for wine in wines:
+            self.assertTrue(any("-" in wine[key] for key in ["name", "country", "region", "winery", "type"]))
+
+        res = self.client.get(create_url(WineAllTests.endpoint, {"search": "!?!"})).get_json()
+        self.assertEqual(res["list"], [])
+
+    def test_search_pages(self):
+        """Paging through a search by page number or by cursor shows each match once, in the same order."""
+        params = {"search": "a", "count": "true"}
+        res = self.client.get(create_url(WineAllTests.endpoint, params)).get_json()
+        ids = [e["id"] for e in res["list"]]
+        self.assertGreater(len(ids), 2 * PAGE_SIZE)
+
+        res_1 = self.client.get(create_url(WineAllTests.endpoint, {**params, "page": 1})).get_json()
+        self.assertEqual(res_1["totalInstances"], len(ids))
+        self.assertEqual([e["id"] for e in res_1["list"]], ids[0:PAGE_SIZE])
+        self.assertIsNone(res_1["prevCursor"])
+
+        res_2 = self.client.get(create_url(WineAllTests.endpoint, {**params, "cursor": res_1["nextCursor"]})).get_json()
+        validate(res_2, all_response_schema)
+        self.assertEqual(res_2["page"], 2)
+        self.assertEqual([e["id"] for e in res_2["list"]], ids[PAGE_SIZE : 2 * PAGE_SIZE])
+
+        res_3 = self.client.get(create_url(WineAllTests.endpoint, {**params, "page": 3})).get_json()
+        res_prev = self.client.get(
+            create_url(WineAllTests.endpoint, {**params, "cursor": res_3["prevCursor"]})
+        ).get_json()
+        self.assertEqual(res_prev["page"], 2)
+        self.assertEqual(res_prev["list"], res_2["list"])
+
+        # sorted searches keep the order of the sort
+        res = self.client.get(create_url(WineAllTests.endpoint, {**params, "sort": "rating_desc"})).get_json()
+        ratings = [e["rating"] for e in res["list"]]
+        self.assertEqual(sorted(e["id"] for e in res["list"]), sorted(ids))
+        self.assertEqual(ratings, sorted(ratings, reverse=True))
+
+    def test_search_statement_cache(self):
+        """Searches with any number of matches share their statements."""
+        self.client.get(create_url(WineAllTests.endpoint, {"search": "a", "startRating": 3.0, "page": 1}))
+        misses = statement_cache.misses
+
+        res = self.client.get(create_url(WineAllTests.endpoint, {"search": "red", "startRating": 4.0, "page": 2}))
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(statement_cache.misses, misses)
+
+    def test_search_filtered(self):
+        """Filtered and sorted searches only read the ids of the matches, from an index built at startup."""
+        self.assertIsNotNone(search_index.built_at)
+
+        params = {"search": "red", "startRating": 4.0, "sort": "reviews_desc"}
+        res = self.client.get(create_url(WineAllTests.endpoint, params)).get_json()
+        unfiltered = self.client.get(create_url(WineAllTests.endpoint, {"search": "red"})).get_json()
+
+        wines: list[JsonObject] = res["list"]
+        self.assertGreater(len(wines), 0)
+        self.assertEqual(
+            sorted(e["id"] for e in wines), sorted(e["id"] for e in unfiltered["list"] if e["rating"] >= 4.0)
+        )
+        reviews = [e["reviews"] for e in wines]
+        self.assertEqual(reviews, sorted(reviews, reverse=True))
+
     def test_country(self):
         """Written by Ryan"""
         country_query = ["United States", "Portugal"]
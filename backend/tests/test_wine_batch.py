@@ -0,0 +1,62 @@
+import unittest
+
+from jsonschema import validate
+
+import __init__  # type: ignore
+from src.util.general import BATCH_SIZE
+from tests.common.data_version import frozen_data_version
+from tests.common.flask_testcase import FlaskTestCase
+from tests.common.query_counter import QueryCounter
+from tests.common.util import create_url
+from tests.schemas.responses.wine import batch_response_schema
+
+
+class WineBatchTests(FlaskTestCase):
+    endpoint = "/wines/batch"
+
+    def test_format(self):
+        """A batch response has one entry per requested id."""
+        res = self.client.get(create_url(WineBatchTests.endpoint, {"ids": "1,2,3"}))
+        self.assertEqual(res.status_code, 200)
+
+        data = res.get_json()
+        validate(data, batch_response_schema)
+        self.assertEqual(set(data["data"].keys()), {"1", "2", "3"})
+
+    def test_matches_id(self):
+        """Each batch entry is the same as the response of the single instance route."""
+        batch = self.client.get(create_url(WineBatchTests.endpoint, {"ids": "2,1"})).get_json()
+        single = self.client.get("/wines/2").get_json()
+        self.assertEqual(batch["data"]["2"], single)
+
+    def test_missing_ids(self):
+        """Ids that do not exist are left out."""
+        res = self.client.get(create_url(WineBatchTests.endpoint, {"ids": "1,0"})).get_json()
+        self.assertEqual(set(res["data"].keys()), {"1"})
+
+    def test_invalid_ids(self):
+        """Malformed, missing or too many ids are rejected."""
+        res = self.client.get(create_url(WineBatchTests.endpoint, {"ids": "1,a"}))
+        self.assertEqual(res.status_code, 400)
+
+        res = self.client.get(
+            create_url(WineBatchTests.endpoint, {"ids": ",".join(map(str, range(1, BATCH_SIZE + 2)))})
+        )
+        self.assertEqual(res.status_code, 400)
+
+        res = self.client.get(WineBatchTests.endpoint)
+        self.assertEqual(res.status_code, 400)
+
+    def test_query_count(self):
+        """The number of queries does not depend on the number of ids."""
+        with frozen_data_version(), QueryCounter() as few:
+            self.client.get(create_url(WineBatchTests.endpoint, {"ids": "1"}))
+
+        with frozen_data_version(), QueryCounter() as many:
+            self.client.get(create_url(WineBatchTests.endpoint, {"ids": ",".join(map(str, range(1, 21)))}))
+
+        self.assertEqual(few.count, many.count)
+
+
+if __name__ == "__main__":
+    unittest.main()
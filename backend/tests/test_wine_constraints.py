@@ -1,8 +1,11 @@
 import unittest
 
 from jsonschema import validate
+from sqlalchemy import func
 
 import __init__  # type: ignore
+from src.common.core import db
+from src.models import Wine
 from src.routes.wines.all import sort_methods
 from tests.common.flask_testcase import FlaskTestCase
 from tests.common.util import JsonObject, is_alphabetical_order
@@ -43,9 +46,13 @@ class WineConstraintTests(FlaskTestCase):
         """Written by Ryan"""
         res: JsonObject = self.client.get(WineConstraintTests.endpoint).get_json()
 
-        self.assertEqual(res["rating"]["min"], 0.0)
-        self.assertEqual(res["rating"]["max"], 5.0)
-        self.assertEqual(res["reviews"]["min"], 0)
+        query = db.select(func.min(Wine.rating), func.max(Wine.rating), func.min(Wine.reviews), func.max(Wine.reviews))
+        min_rating, max_rating, min_reviews, max_reviews = db.session.execute(query).one()
+
+        self.assertEqual(res["rating"]["min"], float(min_rating))
+        self.assertEqual(res["rating"]["max"], float(max_rating))
+        self.assertEqual(res["reviews"]["min"], min_reviews)
+        self.assertEqual(res["reviews"]["max"], max_reviews)
 
         all_sorts: list[JsonObject] = res["sorts"]
         for sort_obj in all_sorts:
@@ -3,7 +3,9 @@ import unittest
 from jsonschema import validate
 
 import __init__  # type: ignore
+from tests.common.data_version import frozen_data_version
 from tests.common.flask_testcase import FlaskTestCase
+from tests.common.query_counter import QueryCounter
 from tests.schemas.responses.wine import id_response_schema
 
 
@@ -25,6 +27,15 @@ class WineIdTests(FlaskTestCase):
         res = self.client.get(f"{WineIdTests.endpoint}/1").get_json()
         validate(res, id_response_schema)
 
+    def test_query_count(self):
+        """A wine and its related instances are loaded with a fixed number of queries."""
+        with frozen_data_version(), QueryCounter() as counter:
+            res = self.client.get(f"{WineIdTests.endpoint}/1")
+
+        # the instance, then one query per related collection
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(counter.count, 3)
+
 
 if __name__ == "__main__":
     unittest.main()